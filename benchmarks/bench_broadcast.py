@@ -0,0 +1,120 @@
+"""
+브로드캐스트 팬아웃 벤치마크: 순차 전송(기존) vs 연결별 송신 대기열 + 제한 시간(ConnectionManager).
+
+members명의 방에서 slow개의 연결은 전송마다 slow-ms만큼 지연되고,
+나머지 연결은 fast-ms 안팎으로 응답합니다. 메시지 messages개를 보내며
+브로드캐스트 1회의 소요 시간과 빠른 연결의 전달 지연(p50/p99), 제외된 연결 수를 측정합니다.
+
+실행: python benchmarks/bench_broadcast.py [--members 500] [--slow 5] [--slow-ms 3000]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+from core.websocket.manager import ConnectionManager  # noqa: E402
+
+
+class FakeSocket:
+    def __init__(self, delay: float, rng: random.Random, slow: bool):
+        self.delay = delay
+        self.rng = rng
+        self.slow = slow
+        self.delivered_at = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        await asyncio.sleep(self.delay * self.rng.uniform(0.5, 1.5))
+        self.delivered_at.append(time.perf_counter() - message["sent_at"])
+
+    async def send_text(self, frame):
+        await self.send_json(json.loads(frame))
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def legacy_broadcast(manager: ConnectionManager, message, room_id: str):
+    """기존 구현: 연결마다 순서대로 전송"""
+    for user_id, connection in list(manager.active_connections[room_id].items()):
+        try:
+            await connection.send_json(message)
+        except Exception:
+            manager.disconnect(room_id, user_id)
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(math.ceil(q * len(ordered)) - 1, len(ordered) - 1)]
+
+
+async def run(args, concurrent: bool) -> None:
+    rng = random.Random(args.seed)
+    manager = ConnectionManager(
+        send_timeout=args.timeout_ms / 1000, slow_consumer_strikes=args.strikes
+    )
+    slow_ids = set(rng.sample(range(args.members), args.slow))
+    sockets = []
+    for i in range(args.members):
+        slow = i in slow_ids
+        ws = FakeSocket((args.slow_ms if slow else args.fast_ms) / 1000, rng, slow)
+        sockets.append(ws)
+        await manager.connect(ws, "room", f"user_{i}")
+
+    durations = []
+    for _ in range(args.messages):
+        message = {"type": "stt_result", "payload": {}, "sent_at": time.perf_counter()}
+        started = time.perf_counter()
+        if concurrent:
+            await manager.broadcast(message, "room")
+        else:
+            await legacy_broadcast(manager, message, "room")
+        durations.append(time.perf_counter() - started)
+
+    if concurrent:
+        # 송신은 연결별 writer 태스크가 수행하므로 전달이 끝날 때까지 대기
+        await asyncio.sleep(args.timeout_ms / 1000 * args.strikes + 0.2)
+
+    fast_latency = [d for ws in sockets if not ws.slow for d in ws.delivered_at]
+    print(
+        f"{'concurrent' if concurrent else 'sequential':>10} | "
+        f"broadcast avg {sum(durations) / len(durations) * 1e3:8.1f} ms "
+        f"max {max(durations) * 1e3:8.1f} ms | "
+        f"fast p50 {percentile(fast_latency, 0.5) * 1e3:8.1f} ms "
+        f"p99 {percentile(fast_latency, 0.99) * 1e3:8.1f} ms | "
+        f"evicted {manager.evicted}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--slow", type=int, default=5)
+    parser.add_argument("--fast-ms", type=float, default=0.2)
+    parser.add_argument("--slow-ms", type=float, default=3000.0)
+    parser.add_argument("--timeout-ms", type=float, default=500.0)
+    parser.add_argument("--strikes", type=int, default=2)
+    parser.add_argument("--messages", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"members={args.members} slow={args.slow} ({args.slow_ms:.0f} ms/send) "
+        f"timeout={args.timeout_ms:.0f} ms strikes={args.strikes} messages={args.messages}"
+    )
+    asyncio.run(run(args, concurrent=False))
+    asyncio.run(run(args, concurrent=True))
+
+
+if __name__ == "__main__":
+    main()
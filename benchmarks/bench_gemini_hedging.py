@@ -0,0 +1,134 @@
+"""
+Gemini 요청 헤징 벤치마크: 헤징 없음 vs RequestHedger.
+
+가짜 모델은 로그정규 분포(중앙값 median-ms)의 지연에, tail-prob 확률로
+tail-mult배 느린 꼬리 지연을 섞어 응답합니다. 같은 시드로 두 모드를 실행하여
+p50/p95/p99 지연과 헤지 비율을 비교합니다.
+
+실행: python benchmarks/bench_gemini_hedging.py [--requests 1000] [--tail-prob 0.03]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+from infrastructure.external.gemini_client import GeminiClient  # noqa: E402
+from infrastructure.external.gemini_hedging import RequestHedger  # noqa: E402
+from infrastructure.external.gemini_scheduler import GeminiScheduler  # noqa: E402
+
+RESPONSE_TEXT = json.dumps({"type": "SUMMARY", "content": "벤치마크 응답입니다."})
+
+
+class _Response:
+    text = RESPONSE_TEXT
+    usage_metadata = None
+
+
+class FakeModel:
+    """설정한 지연 분포로 응답하는 가짜 Gemini 모델"""
+
+    def __init__(self, rng: random.Random, median: float, sigma: float, tail_prob: float, tail_mult: float):
+        self.rng = rng
+        self.median = median
+        self.sigma = sigma
+        self.tail_prob = tail_prob
+        self.tail_mult = tail_mult
+        self.calls = 0
+
+    def sample(self) -> float:
+        latency = self.median * math.exp(self.rng.gauss(0, self.sigma))
+        if self.rng.random() < self.tail_prob:
+            latency *= self.tail_mult
+        return latency
+
+    async def generate_content_async(self, prompt: str) -> _Response:
+        self.calls += 1
+        await asyncio.sleep(self.sample())
+        return _Response()
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(math.ceil(q * len(ordered)) - 1, len(ordered) - 1)]
+
+
+async def run_mode(args, hedged: bool) -> None:
+    model = FakeModel(
+        random.Random(args.seed),
+        args.median_ms / 1000,
+        args.sigma,
+        args.tail_prob,
+        args.tail_mult,
+    )
+    hedger = (
+        RequestHedger(
+            percentile=args.percentile,
+            budget=args.budget,
+            min_samples=args.min_samples,
+            min_delay=0.0,
+        )
+        if hedged
+        else None
+    )
+    scheduler = GeminiScheduler(
+        max_concurrency=args.concurrency * 2,
+        tokens_per_minute=10**9,
+        max_queue_wait=60,
+    )
+    client = GeminiClient(model=model, scheduler=scheduler, hedger=hedger)
+    client.cache = None
+
+    latencies = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await client.generate_insight(f"발언 {i}")
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+
+    hedge_rate = hedger.stats()["hedge_rate"] if hedger else 0.0
+    print(
+        f"{'hedged' if hedged else 'baseline':>8} | "
+        f"p50 {percentile(latencies, 0.50) * 1e3:7.1f} ms | "
+        f"p95 {percentile(latencies, 0.95) * 1e3:7.1f} ms | "
+        f"p99 {percentile(latencies, 0.99) * 1e3:7.1f} ms | "
+        f"hedge rate {hedge_rate * 100:5.2f}% | model calls {model.calls}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--median-ms", type=float, default=40.0)
+    parser.add_argument("--sigma", type=float, default=0.3)
+    parser.add_argument("--tail-prob", type=float, default=0.03)
+    parser.add_argument("--tail-mult", type=float, default=10.0)
+    parser.add_argument("--percentile", type=float, default=0.95)
+    parser.add_argument("--budget", type=float, default=0.05)
+    parser.add_argument("--min-samples", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"requests={args.requests} median={args.median_ms}ms sigma={args.sigma} "
+        f"tail={args.tail_prob * 100:.1f}% x{args.tail_mult} "
+        f"hedge at p{args.percentile * 100:.0f}, budget {args.budget * 100:.0f}%"
+    )
+    asyncio.run(run_mode(args, hedged=False))
+    asyncio.run(run_mode(args, hedged=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Gemini 인사이트 파싱 벤치마크: json.loads + 수동 검사 vs parse_insight(TypeAdapter + 로컬 복구).
+
+실제 응답에서 자주 보이는 형태(정상 JSON, 코드 펜스, 앞뒤 설명문, trailing comma,
+소문자 type, 잘린 응답, 스키마 위반 등)로 구성한 fixture corpus를 만들어
+형태별 처리 성공률과 전체 파싱 처리량(건/초)을 측정합니다.
+
+실행: python benchmarks/bench_insight_parser.py [--copies 2000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+
+from infrastructure.external.insight_parser import (  # noqa: E402
+    InsightParseError,
+    parse_insight,
+)
+
+TYPES = ("SUMMARY", "WARNING", "SUGGESTION")
+CONTENTS = (
+    "참여자들이 다음 주 배포 일정에 합의했습니다.",
+    "한 참여자의 발언 비중이 높습니다. 다른 분들의 의견도 들어보면 좋겠습니다.",
+    "예산 {초안} 검토를 다음 안건으로 제안합니다.",
+    "결정 사항: QA는 목요일까지, 릴리스는 금요일 오전.",
+)
+
+
+def _body(rng: random.Random) -> dict:
+    return {"type": rng.choice(TYPES), "content": rng.choice(CONTENTS)}
+
+
+# 형태 이름 -> (생성 함수, 복구 가능해야 하는지)
+def make_variants():
+    def clean(rng):
+        return json.dumps(_body(rng), ensure_ascii=False)
+
+    def fenced(rng):
+        return f"```json\n{json.dumps(_body(rng), ensure_ascii=False, indent=2)}\n```"
+
+    def prose(rng):
+        return f"Here is the insight:\n{clean(rng)}\nLet me know if you need more."
+
+    def trailing_comma(rng):
+        return clean(rng)[:-1] + ",}"
+
+    def lowercase_type(rng):
+        body = _body(rng)
+        body["type"] = body["type"].lower()
+        return json.dumps(body, ensure_ascii=False)
+
+    def extra_field(rng):
+        return json.dumps({**_body(rng), "confidence": 0.8}, ensure_ascii=False)
+
+    def truncated(rng):
+        text = clean(rng)
+        return text[: len(text) // 2]
+
+    def unknown_type(rng):
+        return json.dumps({"type": "PRAISE", "content": "좋아요"}, ensure_ascii=False)
+
+    def plain_text(rng):
+        return "요약: " + rng.choice(CONTENTS)
+
+    return {
+        "clean": (clean, True),
+        "fenced": (fenced, True),
+        "prose": (prose, True),
+        "trailing_comma": (trailing_comma, True),
+        "lowercase_type": (lowercase_type, True),
+        "extra_field": (extra_field, True),
+        "truncated": (truncated, False),
+        "unknown_type": (unknown_type, False),
+        "plain_text": (plain_text, False),
+    }
+
+
+def legacy_parse(text: str) -> dict:
+    """기존 방식 (json.loads 후 type/content 확인)"""
+    data = json.loads(text)
+    if data.get("type") not in TYPES or not data.get("content"):
+        raise ValueError("invalid insight")
+    return data
+
+
+def success_rate(parse, corpus) -> float:
+    ok = 0
+    for text in corpus:
+        try:
+            parse(text)
+            ok += 1
+        except (ValueError, InsightParseError):
+            pass
+    return ok / len(corpus)
+
+
+def throughput(parse, corpus, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in corpus:
+            try:
+                parse(text)
+            except (ValueError, InsightParseError):
+                pass
+        best = min(best, time.perf_counter() - started)
+    return len(corpus) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=2000, help="형태별 샘플 수")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    variants = make_variants()
+    corpora = {
+        name: [make(rng) for _ in range(args.copies)]
+        for name, (make, _) in variants.items()
+    }
+
+    print(f"{'variant':>15} | {'legacy ok':>9} | {'parser ok':>9} | expected")
+    for name, (_, recoverable) in variants.items():
+        print(
+            f"{name:>15} | {success_rate(legacy_parse, corpora[name]) * 100:8.1f}% | "
+            f"{success_rate(parse_insight, corpora[name]) * 100:8.1f}% | "
+            f"{'ok' if recoverable else 'ERROR'}"
+        )
+
+    near_json = [t for n, (_, r) in variants.items() if r and n != "clean" for t in corpora[n]]
+    print(f"\nrepair success (near-JSON): {success_rate(parse_insight, near_json) * 100:.1f}%")
+
+    mixed = [t for texts in corpora.values() for t in texts]
+    rng.shuffle(mixed)
+    for label, corpus in (("clean only", corpora["clean"]), ("mixed corpus", mixed)):
+        print(
+            f"{label:>15} | legacy {throughput(legacy_parse, corpus):>10,.0f}/s | "
+            f"parser {throughput(parse_insight, corpus):>10,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
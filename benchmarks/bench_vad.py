@@ -0,0 +1,97 @@
+"""
+VAD 마이크로벤치마크: 기존 샘플링 방식(_is_silence) vs 프레임 기반 VadEngine.
+
+동시 스트림 N개가 각각 청크 1개씩 보낸 한 틱(tick)을 처리하는 데
+이벤트 루프가 점유되는 시간을 측정합니다.
+
+실행: python benchmarks/bench_vad.py [--chunk-ms 100] [--speech-ratio 0.5]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from domain.services.vad import VadEngine  # noqa: E402
+
+SAMPLE_RATE = 16000
+STREAM_COUNTS = (100, 1000, 10000)
+
+
+def legacy_is_silence(data: bytes, threshold: int = 500) -> bool:
+    """기존 AudioService._is_silence 구현 (비교 기준)"""
+    if not data:
+        return True
+    count = len(data) // 2
+    step = max(1, count // 100)
+    for i in range(0, len(data), step * 2):
+        if i + 1 >= len(data):
+            break
+        sample = int.from_bytes(data[i : i + 2], byteorder="little", signed=True)
+        if abs(sample) > threshold:
+            return False
+    return True
+
+
+def make_chunk(ms: int, speech: bool, rng: random.Random) -> bytes:
+    count = SAMPLE_RATE * ms // 1000
+    if speech:
+        freq = rng.uniform(120, 400)
+        samples = (
+            int(3000 * math.sin(2 * math.pi * freq * i / SAMPLE_RATE)) for i in range(count)
+        )
+    else:
+        samples = (rng.randint(-60, 60) for _ in range(count))
+    return array("h", samples).tobytes()
+
+
+def bench(streams: int, chunk_ms: int, speech_ratio: float, rounds: int) -> None:
+    rng = random.Random(streams)
+    # 청크 생성 비용을 제외하기 위해 소수의 청크를 미리 만들어 재사용
+    pool = [make_chunk(chunk_ms, rng.random() < speech_ratio, rng) for _ in range(64)]
+    chunks = [pool[i % len(pool)] for i in range(streams)]
+
+    engine = VadEngine(sample_rate=SAMPLE_RATE)
+    vad_streams = [engine.create_stream() for _ in range(streams)]
+
+    legacy_best = vad_best = math.inf
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for chunk in chunks:
+            legacy_is_silence(chunk)
+        legacy_best = min(legacy_best, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for stream, chunk in zip(vad_streams, chunks):
+            stream.process(chunk)
+        vad_best = min(vad_best, time.perf_counter() - start)
+
+    print(
+        f"{streams:>6} streams | legacy {legacy_best * 1e3:8.2f} ms/tick "
+        f"({legacy_best / streams * 1e6:6.1f} us/chunk) | "
+        f"vad {vad_best * 1e3:8.2f} ms/tick ({vad_best / streams * 1e6:6.1f} us/chunk) | "
+        f"ratio {vad_best / legacy_best:5.2f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    parser.add_argument("--speech-ratio", type=float, default=0.5)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"chunk={args.chunk_ms}ms speech_ratio={args.speech_ratio} "
+        f"(frame/attack/hangover/stride from settings)"
+    )
+    for streams in STREAM_COUNTS:
+        bench(streams, args.chunk_ms, args.speech_ratio, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+시청자 1명당 메모리 벤치마크: 청취 전용 연결(/ws/room) vs 참가자 연결(/ws/audio).
+
+viewers명이 같은 방에 접속한 상태를 각 엔드포인트가 연결마다 만드는 상태로 재현하고
+tracemalloc으로 연결 1개당 할당 바이트를 측정합니다.
+- room:  ConnectionManager 등록만 (송신 대기열 + writer)
+- audio: 등록 + AudioService 스트림 + STT/Gemini 클라이언트 + Orchestrator 태스크
+STT 인식 스트림은 열지 않고 오디오를 기다리는 상태로 둡니다 (네트워크 미사용).
+이어서 방 전체에 메시지 messages개를 브로드캐스트하여 청취 연결의 전달 시간을 측정합니다.
+
+실행: python benchmarks/bench_viewer_memory.py [--viewers 500] [--messages 20]
+"""
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+os.environ.setdefault("JWT_SECRET_KEY", "bench")
+# 연결마다 남는 로그 출력은 측정에서 제외
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from core.logging import configure_logging  # noqa: E402
+from core.websocket.manager import ConnectionManager  # noqa: E402
+from domain.services.audio_service import AudioService  # noqa: E402
+from domain.services.meeting_orchestrator import MeetingOrchestrator  # noqa: E402
+from infrastructure.external.gemini_client import GeminiClient  # noqa: E402
+from infrastructure.external.google_stt import GoogleSTTClient  # noqa: E402
+from infrastructure.external.stt_channel_pool import stt_channel_pool  # noqa: E402
+
+
+class FakeSocket:
+    def __init__(self):
+        self.received = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame):
+        self.received += 1
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+class IdleSTTClient(GoogleSTTClient):
+    """인식 스트림을 열지 않고 오디오가 올 때까지 기다리는 STT 클라이언트"""
+
+    async def transcribe(self, audio_stream):
+        async for _ in audio_stream:
+            pass
+        return
+        yield
+
+
+async def connect_viewers(manager: ConnectionManager, room_id: str, viewers: int):
+    sockets = [FakeSocket() for _ in range(viewers)]
+    for i, ws in enumerate(sockets):
+        await manager.connect(ws, room_id, f"viewer_{i}")
+    return sockets
+
+
+async def connect_participants(
+    manager: ConnectionManager, audio: AudioService, room_id: str, viewers: int
+):
+    sockets = [FakeSocket() for _ in range(viewers)]
+    tasks = []
+    for i, ws in enumerate(sockets):
+        user_id = f"participant_{i}"
+        await manager.connect(ws, room_id, user_id)
+        await audio.start_stream(user_id, room_id)
+        orchestrator = MeetingOrchestrator(
+            audio_service=audio,
+            stt_client=IdleSTTClient(pool=stt_channel_pool),
+            gemini_client=GeminiClient(),
+            manager=manager,
+        )
+        tasks.append(asyncio.create_task(orchestrator.start_processing(user_id, room_id)))
+    await asyncio.sleep(0)
+    return sockets, tasks
+
+
+async def measure(label: str, connect, viewers: int):
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = await connect()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_viewer = (after - before) / viewers
+    print(f"{label:<6} {viewers:>6} viewers  {per_viewer / 1024:8.1f} KiB/viewer  "
+          f"total {(after - before) / 1024 / 1024:7.2f} MiB")
+    return result
+
+
+async def run(viewers: int, messages: int):
+    room_manager = ConnectionManager()
+    sockets = await measure(
+        "room", lambda: connect_viewers(room_manager, "room_1", viewers), viewers
+    )
+
+    audio_manager = ConnectionManager()
+    audio = AudioService()
+    _, tasks = await measure(
+        "audio",
+        lambda: connect_participants(audio_manager, audio, "room_1", viewers),
+        viewers,
+    )
+
+    # 청취 연결로의 브로드캐스트 전달 시간
+    start = time.perf_counter()
+    for i in range(messages):
+        await room_manager.broadcast({"type": "stt_result", "payload": {"seq": i}}, "room_1")
+    while sum(ws.received for ws in sockets) < viewers * messages:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    print(f"room broadcast: {messages} msgs x {viewers} viewers in {elapsed * 1000:.1f} ms")
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--viewers", type=int, default=500)
+    parser.add_argument("--messages", type=int, default=20)
+    args = parser.parse_args()
+    configure_logging()
+    asyncio.run(run(args.viewers, args.messages))
+
+
+if __name__ == "__main__":
+    main()
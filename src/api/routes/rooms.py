@@ -4,8 +4,15 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_session
+from domain.services.audio_service import audio_service
 from domain.services.room_service import room_service
-from api.schemas.rooms import CreateRoomRequest, RoomResponse
+from domain.services.speaking_analytics import speaking_analytics
+from api.schemas.rooms import (
+    AudioQueueStatsResponse,
+    CreateRoomRequest,
+    RoomResponse,
+    SpeakingStatsResponse,
+)
 from core.security import get_current_user, TokenPayload
 from core.websocket.manager import manager
 
@@ -52,6 +59,7 @@ async def close_room(
 
         # WebSocket 강제 종료 (Manager 위임)
         await manager.disconnect_room(str(room_id))
+        speaking_analytics.reset(str(room_id))
 
         return {"message": "Meeting closed successfully"}
 
@@ -81,3 +89,15 @@ async def get_insights_history(
 ):
     """[DNA Fix] HIGH-001: AI 인사이트 페이징 조회"""
     return await room_service.get_insights_history(db, room_id, cursor, limit)
+
+
+@router.get("/{room_id}/speaking-stats", response_model=SpeakingStatsResponse)
+async def get_speaking_stats(room_id: uuid.UUID):
+    """진행 중인 회의의 사용자별 발언 시간/차례/끼어들기/동시 발화 (VAD 기반 실시간 집계)"""
+    return speaking_analytics.stats(str(room_id))
+
+
+@router.get("/{room_id}/audio-queue-stats", response_model=AudioQueueStatsResponse)
+async def get_audio_queue_stats(room_id: uuid.UUID):
+    """방 사용자들의 STT 전송 대기 오디오 큐 깊이/High-water mark/드롭 수 (STT 지연 감시용)"""
+    return audio_service.get_room_queue_stats(str(room_id))
@@ -1,18 +1,88 @@
 import asyncio
+from typing import Optional
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from core.config import get_settings
 from core.logging import get_logger
 from core.logging.context import bind_context, generate_trace_id, clear_context
 from core.websocket.manager import manager
+from core.websocket.schemas import encode_message
 from domain.services.audio_service import audio_service
+from domain.services.insight_aggregator import insight_aggregator
+from domain.services.meeting_context import meeting_context
+from domain.services.significance_filter import significance_filter
+from domain.services.speaking_analytics import speaking_analytics
+from domain.services.transcript_dedup import transcript_dedup
 from core.security import get_current_user_ws, TokenPayload
 
 # 클래스 자체를 임포트 (테스트에서 monkeypatch로 교체하기 위함)
 from infrastructure.external.google_stt import GoogleSTTClient
 from infrastructure.external.gemini_client import GeminiClient
+from infrastructure.external.stt_channel_pool import stt_channel_pool
+from infrastructure.external.stt_stream_pool import stt_stream_pool
 from domain.services.meeting_orchestrator import MeetingOrchestrator
 
 router = APIRouter()
 logger = get_logger(__name__)
+settings = get_settings()
+
+# 발언 점유 이벤트 전송 태스크 (완료 전 GC 방지)
+_analytics_tasks: set = set()
+
+
+def _broadcast_speaking_event(room_id: str, event: dict) -> None:
+    """오디오 수신 경로를 막지 않도록 발언 분석 이벤트는 별도 태스크로 전송"""
+    task = asyncio.create_task(
+        manager.broadcast(encode_message("analytics", event), room_id)
+    )
+    _analytics_tasks.add(task)
+    task.add_done_callback(_analytics_tasks.discard)
+
+
+speaking_analytics.subscribe(_broadcast_speaking_event)
+
+
+def _create_orchestrator() -> MeetingOrchestrator:
+    # 연결마다 채널을 만들지 않고 프로세스 전역 채널 풀을 공유
+    # warm pool이 켜져 있으면 start_processing 시 미리 열어 둔 인식 스트림을 인계받음
+    stt_client = GoogleSTTClient(
+        pool=stt_channel_pool,
+        warm_pool=stt_stream_pool if settings.stt_warm_pool_enabled else None,
+    )
+    gemini_client = GeminiClient()
+
+    return MeetingOrchestrator(
+        audio_service=audio_service,
+        stt_client=stt_client,
+        gemini_client=gemini_client,
+        manager=manager,
+        # 방의 모든 화자가 공유하여 final 발화를 방 단위로 묶어 요청
+        insight_aggregator=insight_aggregator,
+        meeting_context=meeting_context,
+        significance_filter=significance_filter,
+        transcript_dedup=transcript_dedup if settings.transcript_dedup_enabled else None,
+    )
+
+
+async def _start_audio_pipeline(user_id: str, room_id: str) -> asyncio.Task:
+    """오디오 스트림 + Orchestrator(STT/Gemini) 백그라운드 태스크를 시작합니다."""
+    await audio_service.start_stream(user_id, room_id)
+    orchestrator = _create_orchestrator()
+    # Trace ID 컨텍스트가 이 Task 내부로 전파되도록 함 (Python 3.7+ asyncio 기본 동작)
+    return asyncio.create_task(orchestrator.start_processing(user_id, room_id))
+
+
+async def _stop_audio_pipeline(user_id: str, process_task: asyncio.Task) -> None:
+    await audio_service.stop_stream(user_id)
+
+    # 태스크 취소 및 대기
+    if not process_task.done():
+        process_task.cancel()
+        try:
+            await process_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as task_e:
+            logger.error("orchestrator_task_error", error=str(task_e))
 
 
 @router.websocket("/ws/audio/{room_id}")
@@ -32,23 +102,8 @@ async def audio_websocket_endpoint(
     # 1. 연결 수락
     await manager.connect(websocket, room_id, user_id)
 
-    # 2. 오디오 스트림 시작
-    await audio_service.start_stream(user_id)
-
-    # 3. Orchestrator 초기화
-    stt_client = GoogleSTTClient()
-    gemini_client = GeminiClient()
-
-    orchestrator = MeetingOrchestrator(
-        audio_service=audio_service,
-        stt_client=stt_client,
-        gemini_client=gemini_client,
-        manager=manager,
-    )
-
-    # 4. 백그라운드 태스크 실행 (Process Task)
-    # Trace ID 컨텍스트가 이 Task 내부로 전파되도록 함 (Python 3.7+ asyncio 기본 동작)
-    process_task = asyncio.create_task(orchestrator.start_processing(user_id, room_id))
+    # 2. 오디오 스트림 + Orchestrator 백그라운드 태스크 시작
+    process_task = await _start_audio_pipeline(user_id, room_id)
 
     try:
         while True:
@@ -64,17 +119,56 @@ async def audio_websocket_endpoint(
     finally:
         # 정리 작업
         manager.disconnect(room_id, user_id)
-        await audio_service.stop_stream(user_id)
-
-        # 태스크 취소 및 대기
-        if not process_task.done():
-            process_task.cancel()
-            try:
-                await process_task
-            except asyncio.CancelledError:
-                pass
-            except Exception as task_e:
-                logger.error("orchestrator_task_error", error=str(task_e))
+        await _stop_audio_pipeline(user_id, process_task)
 
         # 컨텍스트 정리
         clear_context()
+
+
+@router.websocket("/ws/room/{room_id}")
+async def room_websocket_endpoint(
+    websocket: WebSocket,
+    room_id: str,
+    token_payload: TokenPayload = Depends(get_current_user_ws),
+):
+    """
+    청취 전용 연결 (대규모 시청자용): 방 브로드캐스트(stt_result, ai_response 등)만 수신합니다.
+    연결 시에는 ConnectionManager에만 등록하고, 클라이언트가 오디오(바이너리)를
+    보내기 시작하면 그때 오디오 스트림과 STT/Gemini 파이프라인을 시작합니다.
+    텍스트 메시지(keepalive 등)는 무시합니다.
+    """
+    user_id = token_payload.sub
+
+    trace_id = generate_trace_id()
+    bind_context(trace_id=trace_id, user_id=user_id, room_id=room_id)
+
+    logger.info("websocket_listener_init", trace_id=trace_id)
+
+    await manager.connect(websocket, room_id, user_id)
+    process_task: Optional[asyncio.Task] = None
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                logger.info("websocket_disconnected", user_id=user_id, room_id=room_id)
+                break
+            data = message.get("bytes")
+            if not data:
+                continue
+            if process_task is None:
+                # 발언을 시작한 청취자: 이 시점에 STT 자원을 할당
+                process_task = await _start_audio_pipeline(user_id, room_id)
+                logger.info("listener_audio_started", user_id=user_id, room_id=room_id)
+            await audio_service.push_audio(user_id, data)
+
+    except WebSocketDisconnect:
+        logger.info("websocket_disconnected", user_id=user_id, room_id=room_id)
+    except Exception as e:
+        logger.error("websocket_error", error=str(e), user_id=user_id)
+    finally:
+        manager.disconnect(room_id, user_id)
+        if process_task is not None:
+            await _stop_audio_pipeline(user_id, process_task)
+
+        clear_context()
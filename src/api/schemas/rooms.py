@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from typing import List
 from pydantic import BaseModel, Field
 
 
@@ -16,3 +17,27 @@ class RoomResponse(BaseModel):
 
     class Config:
         from_attributes = True  # ORM 모드 (Pydantic v2)
+
+
+class SpeakerStats(BaseModel):
+    user_id: str
+    talk_seconds: float
+    share: float = Field(..., description="방 전체 발언 시간 대비 비율")
+    turns: int
+    interruptions: int
+    overlap_seconds: float
+
+
+class SpeakingStatsResponse(BaseModel):
+    total_talk_seconds: float
+    users: List[SpeakerStats]
+    dominant: List[str] = Field(..., description="발언 점유로 감지된 사용자")
+
+
+class AudioQueueStatsResponse(BaseModel):
+    streams: int = Field(..., description="방에서 오디오를 보내는 사용자 스트림 수")
+    depth_bytes: int = Field(..., description="STT로 아직 보내지 못한 오디오 합계")
+    high_water_bytes: int
+    dropped_chunks: int
+    dropped_bytes: int
+    blocked_puts: int
@@ -29,6 +29,142 @@ class Settings(BaseSettings):
         default=None, description="Google Cloud 인증 JSON 파일 경로"
     )
 
+    # Audio / VAD (PCM16 LINEAR16 기준)
+    audio_sample_rate: int = 16000
+    vad_frame_ms: Literal[10, 20, 30] = 20
+    vad_energy_threshold: float = Field(
+        default=300.0, description="프레임 RMS가 이 값 이상이면 음성 후보로 판단"
+    )
+    vad_attack_frames: int = Field(default=2, ge=1)
+    vad_hangover_frames: int = Field(default=10, ge=0)
+    vad_sample_stride: int = Field(
+        default=4, ge=1, description="에너지 계산 시 N개 샘플마다 1개만 사용"
+    )
+    # 사용자별 배경 소음(Noise Floor) 적응형 임계값
+    vad_adaptive: bool = True
+    vad_noise_window_frames: int = Field(default=500, ge=1)
+    vad_noise_percentile: float = Field(default=0.2, gt=0, lt=1)
+    vad_noise_calibration_frames: int = Field(default=50, ge=1)
+    vad_noise_margin: float = Field(
+        default=3.0, ge=1, description="임계값 = noise floor * margin"
+    )
+    vad_min_threshold: float = 60.0
+    vad_max_threshold: float = 3000.0
+    vad_preroll_ms: int = Field(
+        default=200, ge=0, description="음성 시작 시 함께 전달할 직전 무음 구간 길이"
+    )
+
+    # 사용자별 오디오 큐 상한 (둘 중 작은 값 적용)
+    audio_queue_max_bytes: int = Field(default=1024 * 1024, gt=0)
+    audio_queue_max_seconds: float = Field(default=10.0, gt=0)
+    audio_queue_overflow_policy: Literal["drop_oldest", "drop_newest", "block"] = (
+        "drop_oldest"
+    )
+
+    # STT 전송 전 청크 결합 (요청 수 절감, 지연 상한 보장)
+    stt_coalesce_enabled: bool = True
+    stt_coalesce_target_ms: int = Field(default=100, gt=0)
+    stt_coalesce_max_wait_ms: int = Field(default=120, ge=0)
+    # STT 재연결 시 재전송할 최근 오디오 보관 길이 (스트림당 고정 메모리)
+    stt_replay_buffer_seconds: float = Field(default=10.0, gt=0)
+    # 인식 세션이 아직 읽지 않은 오디오 상한 (1초). 넘으면 AudioQueue에서 꺼내지 않아
+    # STT 지연 시 큐의 overflow 정책(block/drop)과 드롭 메트릭이 적용됨
+    stt_feed_max_unread_bytes: int = Field(default=32000, gt=0)
+    # 스트리밍 인식 길이 제한(약 5분) 대응: 교대 시작 시점과 강제 인계 대기 시간
+    stt_stream_rotate_seconds: float = Field(default=270.0, gt=0)
+    stt_stream_handover_timeout_seconds: float = Field(default=8.0, ge=0)
+    # 프로세스 전역 STT gRPC 채널 풀
+    stt_channel_pool_size: int = Field(default=4, ge=1)
+    stt_channel_health_interval_seconds: float = Field(default=30.0, gt=0)
+    # 미리 열어 둔 인식 스트림 풀 (입장 직후 첫 발화 지연 단축, 선택 기능)
+    # 오디오 없이 약 10초가 지나면 서버가 스트림을 끊으므로 idle_ttl은 그보다 짧게 유지
+    stt_warm_pool_enabled: bool = False
+    stt_warm_pool_min: int = Field(default=0, ge=0)
+    stt_warm_pool_max: int = Field(default=8, ge=0)
+    stt_warm_pool_idle_ttl_seconds: float = Field(default=8.0, gt=0)
+    stt_warm_pool_rate_window_seconds: float = Field(default=60.0, gt=0)
+    stt_warm_pool_horizon_seconds: float = Field(default=10.0, gt=0)
+
+    # VAD 판정 기반 방별 발언 시간/차례/끼어들기/동시 발화 집계 (LLM 호출 없음)
+    speaking_analytics_enabled: bool = True
+    speaking_overlap_window_seconds: float = Field(
+        default=0.3, gt=0, description="다른 사용자의 마지막 발화가 이 시간 이내면 '말하는 중'으로 봄"
+    )
+    # 방 전체 발언 시간이 min_talk 이상이고 한 사용자의 비율이 share 이상이면 점유 이벤트
+    speaking_dominance_share: float = Field(default=0.6, gt=0, le=1)
+    speaking_dominance_min_talk_seconds: float = Field(default=60.0, ge=0)
+    speaking_dominance_hysteresis: float = Field(default=0.1, ge=0, lt=1)
+    # 이 시간 동안 오디오가 없는 방의 집계는 버림 (연결만 끊기고 회의 종료가 없는 방)
+    speaking_idle_ttl_seconds: float = Field(default=3600.0, gt=0)
+
+    # 같은 공간의 여러 마이크가 만든 중복 final 제거 (방 단위, MinHash 유사도)
+    transcript_dedup_enabled: bool = True
+    transcript_dedup_window_seconds: float = Field(default=3.0, gt=0)
+    transcript_dedup_hold_seconds: float = Field(
+        default=0.3, ge=0, description="다른 사용자가 말하는 방에서 중복 도착을 기다리는 시간"
+    )
+    transcript_dedup_similarity: float = Field(default=0.7, gt=0, le=1)
+    transcript_dedup_max_entries: int = Field(default=32, ge=1)
+
+    # WebSocket 브로드캐스트: 연결별 전송 제한 시간, 연속 초과 N회면 느린 소비자로 보고 연결 종료
+    websocket_send_timeout_seconds: float = Field(default=2.0, gt=0)
+    websocket_slow_consumer_strikes: int = Field(default=3, ge=1)
+    websocket_close_timeout_seconds: float = Field(default=2.0, gt=0)
+    # 연결별 송신 대기열 상한 (interim은 최신 1개만 유지, 그 외 메시지가 넘치면 연결 종료)
+    websocket_outbound_queue_size: int = Field(default=64, ge=1)
+    # 프로세스 간 방 메시지 전달: memory(단일 프로세스) | broker(tcp:// 또는 unix:// 브로커 경유)
+    websocket_backplane: Literal["memory", "broker"] = "memory"
+    websocket_backplane_url: str = "tcp://127.0.0.1:7400"
+
+    # AI 분석 단계 (STT 소비 루프와 분리된 제한 큐 + 워커)
+    insight_queue_max_size: int = Field(default=32, ge=1)
+    insight_workers: int = Field(default=2, ge=1)
+    # 스트림 정상 종료 시 남은 분석 요청을 처리할 최대 대기 시간
+    insight_drain_timeout_seconds: float = Field(default=10.0, ge=0)
+    # 방 단위 발화 묶음: 첫 final 이후 window 동안 또는 max_chars까지 모아 한 번에 요청 (0이면 묶지 않음)
+    insight_batch_window_seconds: float = Field(default=5.0, ge=0)
+    insight_batch_max_chars: int = Field(default=1000, gt=0)
+    # batch가 닫힌 뒤 이 시간 안에 결과를 보내지 못하면 버림/취소 (오래된 인사이트 전송 방지)
+    insight_deadline_seconds: float = Field(default=10.0, gt=0)
+    # Gemini 호출 전 로컬 사전 필터 (추임새/짧은 발화/반복 발화는 보내지 않음)
+    insight_filter_enabled: bool = True
+    insight_filter_min_chars: int = Field(
+        default=3, ge=1, description="추임새를 뺀 내용이 이 글자 수 미만이면 skip"
+    )
+    insight_filter_min_novelty: float = Field(
+        default=0.3, ge=0, le=1, description="최근 발언에 없던 토큰 비율이 이 값 미만이면 skip"
+    )
+    insight_filter_send_chars: int = Field(
+        default=40, ge=1, description="화자가 바뀌고 내용이 이 글자 수 이상이면 창을 바로 닫고 요청"
+    )
+    insight_filter_history: int = Field(default=5, ge=1)
+
+    # 프로세스 전역 Gemini 호출 스케줄러 (업스트림 rate limit 보호)
+    gemini_max_concurrency: int = Field(default=4, ge=1)
+    gemini_tokens_per_minute: int = Field(default=1_000_000, gt=0)
+    gemini_max_queue_wait_seconds: float = Field(
+        default=5.0, ge=0, description="이 시간 이상 대기한 요청은 호출하지 않고 거절"
+    )
+    # 요청 헤징: 관측 지연의 percentile까지 응답이 없으면 1회 중복 요청 (전체의 budget 비율 이하)
+    gemini_hedging_enabled: bool = False
+    gemini_hedge_percentile: float = Field(default=0.95, gt=0, lt=1)
+    gemini_hedge_budget: float = Field(default=0.05, ge=0, le=1)
+    gemini_hedge_min_samples: int = Field(default=20, ge=1)
+    # 스트리밍 생성: 인사이트 일부가 나오는 대로 partial ai_response 전송
+    gemini_streaming_enabled: bool = False
+    # 방별 회의 맥락: 최근 N개 발언 원문 + 누적 요약 (프롬프트 크기 상한, 로컬 토큰 추정)
+    meeting_context_recent_utterances: int = Field(default=20, ge=1)
+    meeting_context_max_tokens: int = Field(default=1500, gt=0)
+    meeting_context_summary_max_tokens: int = Field(default=400, gt=0)
+    meeting_context_idle_ttl_seconds: float = Field(default=3600.0, gt=0)
+    # 정규화한 발언 텍스트 기준 인사이트 캐시 (LRU + TTL)
+    insight_cache_enabled: bool = True
+    insight_cache_max_entries: int = Field(default=1024, ge=1)
+    insight_cache_ttl_seconds: float = Field(default=600.0, gt=0)
+    insight_cache_min_chars: int = Field(
+        default=2, ge=0, description="정규화 후 이 글자 수 미만이면 Gemini를 호출하지 않음"
+    )
+
     @validator("google_application_credentials")
     def validate_google_credentials(cls, v):
         if v and not v.exists():
@@ -14,5 +14,37 @@ Output must be a JSON object with this schema:
 - WARNING: If the speaker is aggressive or dominating, give a polite warning.
 - SUGGESTION: Suggest a next topic or question if the discussion stalls.
 
+The transcript may contain several speakers, one utterance per line as "speaker: utterance".
+Consider the whole exchange and return a single insight.
+
 Transcript:
 """
+
+# 회의 맥락 (요약 + 최근 발언). 분석 대상 transcript 뒤에 참고용으로 덧붙임
+MEETING_CONTEXT_PROMPT = """
+Earlier in this meeting (context only; analyze the transcript above, not this section):
+{context}
+"""
+
+MEETING_SUMMARY_PROMPT = """
+You maintain a running summary of a meeting.
+Update the previous summary with the new utterances below.
+Keep decisions, open questions, and who said what when it matters. Drop small talk.
+The updated summary must stay under {max_words} words.
+
+Output must be a JSON object with this schema:
+{{
+    "summary": "string (Korean)"
+}}
+
+Previous summary:
+{summary}
+
+New utterances:
+{utterances}
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """로컬 토큰 수 추정 (UTF-8 4바이트당 약 1토큰). API 호출 없이 프롬프트 크기 예산 관리에 사용"""
+    return len(text.encode("utf-8")) // 4 + 1
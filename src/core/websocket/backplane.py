@@ -0,0 +1,296 @@
+"""
+방 메시지를 다른 프로세스(uvicorn worker/노드)에 전달하는 backplane.
+
+각 프로세스의 ConnectionManager는 방 메시지를 로컬 연결에 보내는 동시에 backplane에 발행하고,
+다른 프로세스에서 온 메시지는 자신의 로컬 연결에만 전달합니다.
+메시지는 소켓마다가 아니라 프로세스마다 한 번 전달됩니다.
+
+브로커 실행 (src 디렉터리에서): python -m core.websocket.backplane tcp://127.0.0.1:7400
+"""
+import asyncio
+import json
+import struct
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from core.config import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# (종류, room_id, 프레임, lossy) -> None. 종류: "broadcast" | "disconnect_room"
+BackplaneHandler = Callable[[str, str, str, bool], None]
+
+# 길이(4바이트, big endian) + JSON 본문
+_HEADER = struct.Struct(">I")
+_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+# 송신 버퍼가 이 크기를 넘으면 브로커로의 전송이 따라잡을 때까지 대기
+_WRITE_BUFFER_LIMIT = 1024 * 1024
+# 브로커에서 한 연결의 송신 버퍼가 이 크기를 넘으면 느린 연결로 보고 끊음 (다른 연결의 중계는 계속)
+_CLIENT_BUFFER_LIMIT = 8 * 1024 * 1024
+_RECONNECT_DELAY = 1.0
+
+
+class Backplane(ABC):
+    """프로세스 간 방 메시지 전달 인터페이스"""
+
+    @abstractmethod
+    async def start(self, handler: BackplaneHandler) -> None:
+        """다른 프로세스에서 온 메시지를 handler로 전달하기 시작합니다."""
+
+    @abstractmethod
+    async def publish(
+        self, kind: str, room_id: str, frame: str, lossy: bool = False
+    ) -> None:
+        """메시지를 다른 프로세스들에 발행합니다 (자기 자신에게는 돌아오지 않음)."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        ...
+
+
+class InMemoryBackplane(Backplane):
+    """
+    같은 프로세스 안의 hub를 공유하는 구현 (단일 프로세스 기본값, 테스트용).
+    hub를 공유하는 다른 인스턴스에만 전달합니다.
+    """
+
+    def __init__(self, hub: Optional[List["InMemoryBackplane"]] = None):
+        self._hub: List[InMemoryBackplane] = hub if hub is not None else []
+        self._handler: Optional[BackplaneHandler] = None
+
+    async def start(self, handler: BackplaneHandler) -> None:
+        self._handler = handler
+        if self not in self._hub:
+            self._hub.append(self)
+
+    async def publish(
+        self, kind: str, room_id: str, frame: str, lossy: bool = False
+    ) -> None:
+        for peer in self._hub:
+            if peer is not self and peer._handler is not None:
+                peer._handler(kind, room_id, frame, lossy)
+
+    async def close(self) -> None:
+        if self in self._hub:
+            self._hub.remove(self)
+        self._handler = None
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    body = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _HEADER.pack(len(body)) + body
+
+
+async def _read_message(reader: asyncio.StreamReader) -> bytes:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if size > _MAX_MESSAGE_BYTES:
+        raise ValueError(f"backplane message too large: {size}")
+    return await reader.readexactly(size)
+
+
+async def _open_connection(url: str) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    parsed = urlparse(url)
+    if parsed.scheme == "unix":
+        return await asyncio.open_unix_connection(parsed.path)
+    if parsed.scheme == "tcp":
+        return await asyncio.open_connection(parsed.hostname, parsed.port)
+    raise ValueError(f"Unsupported backplane url: {url}")
+
+
+class BrokerBackplane(Backplane):
+    """
+    로컬 브로커(BackplaneBroker)에 TCP 또는 Unix 소켓으로 연결하는 구현.
+    연결이 끊기면 백그라운드에서 재연결하며, 그동안 발행한 메시지는 버립니다 (로컬 전송은 유지).
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self._handler: Optional[BackplaneHandler] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+
+        # 메트릭
+        self.published = 0
+        self.received = 0
+        self.dropped = 0
+        self.invalid = 0
+
+    async def start(self, handler: BackplaneHandler) -> None:
+        self._handler = handler
+        if self._task is None or self._task.done():
+            self._connected = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> None:
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, writer = await _open_connection(self.url)
+            except OSError as e:
+                logger.warning("backplane_connect_failed", url=self.url, error=str(e))
+                await asyncio.sleep(_RECONNECT_DELAY)
+                continue
+
+            self._writer = writer
+            self._connected.set()
+            logger.info("backplane_connected", url=self.url)
+            try:
+                while True:
+                    body = await _read_message(reader)
+                    self.received += 1
+                    # 형식이 잘못된 메시지 하나 때문에 수신 태스크가 끝나지 않도록 메시지 단위로 처리
+                    try:
+                        message = json.loads(body)
+                        if self._handler is not None:
+                            self._handler(
+                                message["k"], message["r"], message["f"], message.get("l", False)
+                            )
+                    except (KeyError, TypeError, ValueError) as e:
+                        self.invalid += 1
+                        logger.warning("backplane_message_invalid", url=self.url, error=str(e))
+                    except Exception as e:
+                        # 로컬 전달 실패(닫힌 큐 등)도 이후 메시지 수신을 멈추지 않음
+                        logger.error("backplane_handler_failed", url=self.url, error=str(e))
+            except (asyncio.IncompleteReadError, OSError, ValueError) as e:
+                logger.warning("backplane_disconnected", url=self.url, error=str(e))
+            finally:
+                self._writer = None
+                self._connected.clear()
+                writer.close()
+            await asyncio.sleep(_RECONNECT_DELAY)
+
+    async def publish(
+        self, kind: str, room_id: str, frame: str, lossy: bool = False
+    ) -> None:
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            self.dropped += 1
+            return
+        writer.write(_encode({"k": kind, "r": room_id, "f": frame, "l": lossy}))
+        self.published += 1
+        if writer.transport.get_write_buffer_size() > _WRITE_BUFFER_LIMIT:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._handler = None
+
+
+class BackplaneBroker:
+    """
+    프로세스(연결)마다 받은 메시지를 다른 모든 연결에 한 번씩 중계하는 경량 브로커.
+    같은 머신의 여러 worker는 Unix 소켓, 여러 노드는 TCP로 연결합니다.
+    """
+
+    def __init__(self, url: str, client_buffer_limit: int = _CLIENT_BUFFER_LIMIT):
+        self.url = url
+        self.client_buffer_limit = client_buffer_limit
+        self._server: Optional[asyncio.Server] = None
+        self._clients: Set[asyncio.StreamWriter] = set()
+        self._handlers: Set[asyncio.Task] = set()
+        self.relayed = 0
+        self.slow_disconnects = 0
+
+    async def start(self) -> None:
+        parsed = urlparse(self.url)
+        if parsed.scheme == "unix":
+            self._server = await asyncio.start_unix_server(self._serve, parsed.path)
+        elif parsed.scheme == "tcp":
+            self._server = await asyncio.start_server(
+                self._serve, parsed.hostname, parsed.port
+            )
+        else:
+            raise ValueError(f"Unsupported backplane url: {self.url}")
+        logger.info("backplane_broker_started", url=self.url)
+
+    @property
+    def port(self) -> Optional[int]:
+        """TCP 브로커의 실제 포트 (포트 0으로 시작한 경우 확인용)"""
+        if self._server is None or not self._server.sockets:
+            return None
+        address = self._server.sockets[0].getsockname()
+        return address[1] if isinstance(address, tuple) else None
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._clients.add(writer)
+        task = asyncio.current_task()
+        if task is not None:
+            self._handlers.add(task)
+        try:
+            while True:
+                body = await _read_message(reader)
+                packet = _HEADER.pack(len(body)) + body
+                for client in list(self._clients):
+                    if client is writer or client.is_closing():
+                        continue
+                    # 받는 쪽이 읽지 못해 버퍼가 한도를 넘으면 기다리지 않고 그 연결만 끊음
+                    if client.transport.get_write_buffer_size() > self.client_buffer_limit:
+                        self._disconnect_slow(client)
+                        continue
+                    client.write(packet)
+                    self.relayed += 1
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            if task is not None:
+                self._handlers.discard(task)
+            writer.close()
+
+    def _disconnect_slow(self, client: asyncio.StreamWriter) -> None:
+        self._clients.discard(client)
+        self.slow_disconnects += 1
+        logger.warning(
+            "backplane_client_slow",
+            url=self.url,
+            buffered=client.transport.get_write_buffer_size(),
+        )
+        # 쌓인 버퍼는 버리고 즉시 종료 (재연결 후 새 메시지부터 다시 수신)
+        client.transport.abort()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for client in list(self._clients):
+                client.close()
+            # 연결별 처리 태스크가 종료될 때까지 대기 (연결을 닫으면 읽기가 끝남)
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+
+def create_backplane() -> Backplane:
+    """설정에 따른 backplane (memory: 단일 프로세스, broker: 로컬 브로커 경유)"""
+    if settings.websocket_backplane == "broker":
+        return BrokerBackplane(settings.websocket_backplane_url)
+    return InMemoryBackplane()
+
+
+async def _serve_forever(url: str) -> None:
+    broker = BackplaneBroker(url)
+    await broker.start()
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        _serve_forever(sys.argv[1] if len(sys.argv) > 1 else settings.websocket_backplane_url)
+    )
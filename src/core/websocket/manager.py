@@ -1,19 +1,83 @@
+import asyncio
+import json
 from collections import defaultdict
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Set, Tuple, Union
 from fastapi import WebSocket
+from core.config import get_settings
 from core.logging import get_logger
+from core.websocket.backplane import Backplane, create_backplane
+from core.websocket.outbound import OutboundQueue
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# 느린 소비자로 판정된 연결을 닫을 때의 코드 (1013: Try Again Later)
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+@dataclass
+class _Peer:
+    """연결별 송신 상태 (대기열 + 전용 writer 태스크)"""
+
+    websocket: WebSocket
+    queue: OutboundQueue
+    writer: Optional[asyncio.Task] = None
+    # 연속 전송 시간 초과 횟수
+    strikes: int = 0
 
 
 class ConnectionManager:
-    def __init__(self):
+    def __init__(
+        self,
+        send_timeout: Optional[float] = None,
+        slow_consumer_strikes: Optional[int] = None,
+        close_timeout: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        backplane: Optional[Backplane] = None,
+    ):
         # 구조: {room_id: {user_id: WebSocket}}
         self.active_connections: Dict[str, Dict[str, WebSocket]] = defaultdict(dict)
+        # 연결별 전송 제한 시간 (느린 클라이언트 하나가 방 전체 전송을 막지 않도록)
+        self.send_timeout = send_timeout or settings.websocket_send_timeout_seconds
+        self.slow_consumer_strikes = (
+            slow_consumer_strikes or settings.websocket_slow_consumer_strikes
+        )
+        self.close_timeout = close_timeout or settings.websocket_close_timeout_seconds
+        self.queue_size = queue_size or settings.websocket_outbound_queue_size
+        # (room_id, user_id) -> 송신 대기열/writer
+        self._peers: Dict[Tuple[str, str], _Peer] = {}
+        # 느린 연결 종료 태스크 (브로드캐스트를 기다리게 하지 않음)
+        self._closing: Set[asyncio.Task] = set()
+        self.evicted = 0
+        # 다른 프로세스의 같은 방 연결로 메시지를 전달 (프로세스당 1회)
+        self.backplane = backplane or create_backplane()
+
+    async def start(self) -> None:
+        """다른 프로세스에서 발행한 방 메시지 수신을 시작합니다."""
+        await self.backplane.start(self._on_backplane_message)
+
+    async def close(self) -> None:
+        await self.backplane.close()
+
+    def _on_backplane_message(
+        self, kind: str, room_id: str, frame: str, lossy: bool
+    ) -> None:
+        if kind == "broadcast":
+            self._deliver(room_id, frame, lossy)
+        elif kind == "disconnect_room":
+            task = asyncio.create_task(self._disconnect_local_room(room_id, frame))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
 
     async def connect(self, websocket: WebSocket, room_id: str, user_id: str):
         await websocket.accept()
+        # 같은 사용자의 이전 연결이 남아 있으면 송신 태스크 정리
+        self._stop_peer(room_id, user_id)
         self.active_connections[room_id][user_id] = websocket
+        peer = _Peer(websocket, OutboundQueue(self.queue_size))
+        peer.writer = asyncio.create_task(self._writer(room_id, user_id, peer))
+        self._peers[(room_id, user_id)] = peer
         logger.info(
             "websocket_connected",
             room_id=room_id,
@@ -25,65 +89,173 @@ class ConnectionManager:
         if room_id in self.active_connections:
             if user_id in self.active_connections[room_id]:
                 del self.active_connections[room_id][user_id]
-                logger.info("websocket_disconnected", room_id=room_id, user_id=user_id)
+                stats = self._stop_peer(room_id, user_id)
+                logger.info(
+                    "websocket_disconnected",
+                    room_id=room_id,
+                    user_id=user_id,
+                    outbound=stats,
+                )
 
             if not self.active_connections[room_id]:
                 del self.active_connections[room_id]
 
+    def _stop_peer(self, room_id: str, user_id: str) -> Optional[Dict[str, int]]:
+        peer = self._peers.pop((room_id, user_id), None)
+        if peer is None:
+            return None
+        peer.queue.close()
+        if peer.writer is not None and peer.writer is not asyncio.current_task():
+            peer.writer.cancel()
+        return peer.queue.stats()
+
+    def _remove(self, room_id: str, user_id: str, websocket: WebSocket) -> None:
+        """전송 중 재연결된 경우 새 연결을 지우지 않도록 같은 소켓일 때만 해제"""
+        if self.active_connections.get(room_id, {}).get(user_id) is websocket:
+            self.disconnect(room_id, user_id)
+
     async def send_personal_message(
         self, message: Dict[str, Any], room_id: str, user_id: str
     ):
         """[DNA Fix] 특정 사용자에게 메시지 전송"""
-        if (
-            room_id in self.active_connections
-            and user_id in self.active_connections[room_id]
-        ):
-            try:
-                websocket = self.active_connections[room_id][user_id]
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error("personal_message_failed", error=str(e), user_id=user_id)
+        peer = self._peers.get((room_id, user_id))
+        if peer is not None:
+            self._enqueue(room_id, user_id, peer, _encode(message), lossy=False)
 
-    async def broadcast(self, message: Dict[str, Any], room_id: str):
-        """방 내 모든 사용자에게 브로드캐스트"""
-        if room_id not in self.active_connections:
-            return
+    async def broadcast(
+        self, message: Union[Dict[str, Any], str], room_id: str, lossy: bool = False
+    ):
+        """
+        방 내 모든 사용자의 송신 대기열에 메시지를 넣습니다 (느린 연결을 기다리지 않음).
+        message는 dict 또는 미리 직렬화한 JSON 텍스트(encode_message)이며,
+        직렬화는 수신자 수와 무관하게 한 번만 수행하고 같은 프레임을 전송합니다.
+        lossy=True(interim stt_result)면 밀린 연결에서는 최신 것만 남기고 교체됩니다.
+        다른 프로세스에 연결된 같은 방 사용자에게는 backplane으로 전달됩니다.
+        """
+        frame = _encode(message)
+        self._deliver(room_id, frame, lossy)
+        await self.backplane.publish("broadcast", room_id, frame, lossy)
+
+    def _deliver(self, room_id: str, frame: str, lossy: bool) -> None:
+        """이 프로세스에 연결된 방 사용자들에게 전달"""
+        for user_id in list(self.active_connections.get(room_id, ())):
+            peer = self._peers.get((room_id, user_id))
+            if peer is not None:
+                self._enqueue(room_id, user_id, peer, frame, lossy)
 
-        active_users = list(self.active_connections[room_id].items())
+    def _enqueue(
+        self, room_id: str, user_id: str, peer: _Peer, frame: str, lossy: bool
+    ) -> None:
+        if not peer.queue.put(frame, lossy):
+            # 버릴 수 없는 메시지가 대기열 상한을 넘음: 느린 소비자로 보고 연결 종료
+            logger.warning(
+                "outbound_queue_overflow", room_id=room_id, user_id=user_id
+            )
+            self._evict(room_id, user_id, peer.websocket)
 
-        for user_id, connection in active_users:
+    async def _writer(self, room_id: str, user_id: str, peer: _Peer) -> None:
+        """연결 전용 송신 루프: 대기열의 프레임을 순서대로 전송 (전송마다 제한 시간 적용)"""
+        while True:
+            frame = await peer.queue.get()
+            if frame is None:
+                return
             try:
-                await connection.send_json(message)
+                await asyncio.wait_for(
+                    peer.websocket.send_text(frame), self.send_timeout
+                )
+            except asyncio.TimeoutError:
+                peer.strikes += 1
+                logger.warning(
+                    "broadcast_timeout",
+                    room_id=room_id,
+                    user_id=user_id,
+                    strikes=peer.strikes,
+                    queue_depth=peer.queue.depth,
+                )
+                if peer.strikes >= self.slow_consumer_strikes:
+                    self._evict(room_id, user_id, peer.websocket)
+                    return
             except Exception as e:
                 logger.error("broadcast_failed", error=str(e), user_id=user_id)
-                self.disconnect(room_id, user_id)
+                self._remove(room_id, user_id, peer.websocket)
+                return
+            else:
+                peer.strikes = 0
+                peer.queue.sent += 1
+
+    def _evict(self, room_id: str, user_id: str, connection: WebSocket) -> None:
+        """느린 소비자 연결을 방에서 제외하고 백그라운드에서 닫습니다."""
+        self._remove(room_id, user_id, connection)
+        self.evicted += 1
+        logger.warning("slow_consumer_evicted", room_id=room_id, user_id=user_id)
+        task = asyncio.create_task(
+            self._close(connection, SLOW_CONSUMER_CLOSE_CODE)
+        )
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, connection: WebSocket, code: int) -> None:
+        try:
+            await asyncio.wait_for(connection.close(code=code), self.close_timeout)
+        except Exception:
+            pass  # 이미 닫혔거나 응답 없는 연결은 무시
+
+    async def _drain_and_close(self, peer: _Peer) -> None:
+        """대기 중인 메시지(종료 알림 등)를 제한 시간 안에 보낸 뒤 소켓을 닫습니다."""
+        peer.queue.close()
+        if peer.writer is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(peer.writer), self.close_timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                peer.writer.cancel()
+            except Exception:
+                pass
+        await self._close(peer.websocket, 1000)
+
+    def get_connection_stats(self, room_id: str) -> Dict[str, Dict[str, int]]:
+        """방의 연결별 송신 대기열 깊이/교체/버림/전송 수"""
+        return {
+            user_id: peer.queue.stats()
+            for (peer_room, user_id), peer in self._peers.items()
+            if peer_room == room_id
+        }
 
     async def disconnect_room(self, room_id: str):
         """
         [DNA Fix] CRITICAL-001: 특정 방의 모든 연결을 강제로 종료합니다.
-        회의가 종료되었을 때 호출됩니다.
+        회의가 종료되었을 때 호출됩니다. (다른 프로세스의 연결도 backplane으로 종료)
         """
-        if room_id not in self.active_connections:
-            return
-
         # 시스템 메시지 전송
         close_msg = {
             "type": "system",
             "payload": {"event": "meeting_closed", "message": "Meeting closed by host"},
         }
-        await self.broadcast(close_msg, room_id)
+        frame = _encode(close_msg)
+        await self.backplane.publish("disconnect_room", room_id, frame)
+        await self._disconnect_local_room(room_id, frame)
 
-        # 소켓 연결 해제
-        active_users = list(self.active_connections[room_id].items())
-        for user_id, connection in active_users:
-            try:
-                await connection.close(code=1000)
-            except Exception:
-                pass  # 이미 닫힌 경우 무시
-            finally:
-                self.disconnect(room_id, user_id)
+    async def _disconnect_local_room(self, room_id: str, close_frame: str) -> None:
+        if room_id not in self.active_connections:
+            return
+        self._deliver(room_id, close_frame, lossy=False)
+
+        # 소켓 연결 해제 (동시에, 연결별 제한 시간 적용)
+        peers = []
+        for user_id in list(self.active_connections.get(room_id, {})):
+            peer = self._peers.pop((room_id, user_id), None)
+            self.disconnect(room_id, user_id)
+            if peer is not None:
+                peers.append(peer)
+        await asyncio.gather(*(self._drain_and_close(peer) for peer in peers))
 
         logger.info("room_connections_closed", room_id=room_id)
 
 
+def _encode(message: Union[Dict[str, Any], str]) -> str:
+    if isinstance(message, str):
+        return message
+    # send_json과 같은 형식 (공백 없는 구분자, UTF-8 그대로)
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+
 manager = ConnectionManager()
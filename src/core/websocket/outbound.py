@@ -0,0 +1,97 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+
+class OutboundQueue:
+    """
+    연결별 송신 대기열 (전용 writer 태스크가 소비).
+    - lossy 프레임(interim stt_result)은 대기열에 최대 1개: 새 interim이 오면 이전 것을 교체
+    - 그 외 프레임(final, ai_response, system)은 버리지 않음. 대기열이 가득 차면
+      먼저 interim을 버려 자리를 만들고, 그래도 없으면 put이 False를 반환 (호출자가 연결 정리)
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # [frame, lossy]. 교체/버린 interim은 frame을 None으로 표시하고 writer가 건너뜀 (O(1))
+        self._items: Deque[List[Any]] = deque()
+        self._interim: Optional[List[Any]] = None
+        self._live = 0
+        self._ready = asyncio.Event()
+        self._closed = False
+
+        # 메트릭
+        self.high_water = 0
+        self.replaced = 0
+        self.dropped = 0
+        # writer가 전송에 성공한 프레임 수
+        self.sent = 0
+
+    @property
+    def depth(self) -> int:
+        return self._live
+
+    def put(self, frame: str, lossy: bool = False) -> bool:
+        if self._closed:
+            return True
+        if lossy:
+            if self._interim is not None:
+                # 아직 보내지 못한 이전 interim은 최신 것으로 대체 (순서는 맨 뒤로)
+                self._discard_interim(self._interim)
+                self.replaced += 1
+            if self._live >= self.max_size:
+                self.dropped += 1
+                return True
+        elif self._live >= self.max_size:
+            if self._interim is None:
+                return False
+            self._discard_interim(self._interim)
+            self.dropped += 1
+
+        item = [frame, lossy]
+        self._items.append(item)
+        self._live += 1
+        if lossy:
+            self._interim = item
+        self.high_water = max(self.high_water, self._live)
+        self._ready.set()
+        return True
+
+    def _discard_interim(self, item: List[Any]) -> None:
+        item[0] = None
+        self._interim = None
+        self._live -= 1
+        # writer가 멈춘 동안 표시만 된 항목이 쌓이지 않도록 가끔 정리 (분할 상환 O(1))
+        if len(self._items) - self._live > self.max_size:
+            self._items = deque(item for item in self._items if item[0] is not None)
+
+    async def get(self) -> Optional[str]:
+        """다음 프레임. 닫힌 뒤 남은 프레임을 모두 꺼내면 None."""
+        while True:
+            while not self._items:
+                if self._closed:
+                    return None
+                self._ready.clear()
+                await self._ready.wait()
+
+            item = self._items.popleft()
+            if item[0] is None:
+                continue
+            self._live -= 1
+            if item is self._interim:
+                self._interim = None
+            return item[0]
+
+    def close(self) -> None:
+        """더 이상 받지 않음 (남은 프레임은 writer가 마저 전송)"""
+        self._closed = True
+        self._ready.set()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "depth": self.depth,
+            "high_water": self.high_water,
+            "replaced": self.replaced,
+            "dropped": self.dropped,
+            "sent": self.sent,
+        }
@@ -1,13 +1,33 @@
 # src/core/websocket/schemas.py
-from typing import Any, Literal
+import json
+from typing import Any, Dict, Literal
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+MessageType = Literal["chat", "stt_result", "ai_response", "system", "analytics"]
+
+# 가장 빈번한 stt_result 메시지는 모델 생성 없이 미리 만든 envelope에 payload만 채움
+# (필드 순서/형식은 WebSocketMessage.model_dump_json 결과와 동일)
+_STT_RESULT_PREFIX = '{"type":"stt_result","payload":'
+
 
 class WebSocketMessage(BaseModel):
-    type: Literal["chat", "stt_result", "ai_response", "system"]
+    type: MessageType
     payload: Any
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
         json_encoders = {datetime: lambda v: v.isoformat()}
+
+
+def encode_message(msg_type: MessageType, payload: Any) -> str:
+    """메시지를 JSON 텍스트 프레임으로 한 번만 직렬화합니다 (수신자 전원에게 같은 프레임 전송)."""
+    if msg_type == "stt_result" and isinstance(payload, dict):
+        return encode_stt_result(payload)
+    return WebSocketMessage(type=msg_type, payload=payload).model_dump_json()
+
+
+def encode_stt_result(payload: Dict[str, Any]) -> str:
+    """stt_result 전용 경량 경로: pydantic 모델을 만들지 않고 envelope 문자열을 조립"""
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f'{_STT_RESULT_PREFIX}{body},"timestamp":"{datetime.utcnow().isoformat()}"}}'
@@ -0,0 +1,95 @@
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Dict
+
+from domain.services.audio_queue import AudioQueue
+
+
+class ChunkCoalescer:
+    """
+    작은 WebSocket 오디오 청크를 목표 크기의 프레임으로 묶어
+    STT 요청(StreamingRecognizeRequest) 수를 줄이는 단계입니다.
+    - 미리 할당한 bytearray에 청크를 복사하여 bytes 반복 결합을 피함
+    - 프레임의 첫 청크 도착 후 max_wait가 지나면 목표 크기 미달이라도 전송 (지연 상한)
+    """
+
+    def __init__(self, target_bytes: int, max_wait: float):
+        if target_bytes <= 0:
+            raise ValueError("target_bytes must be positive")
+
+        self.target_bytes = target_bytes
+        self.max_wait = max_wait
+        self._buffer = bytearray(target_bytes)
+
+        # 메트릭
+        self.chunks_in = 0
+        self.frames_out = 0
+        self.added_latency_total = 0.0
+        self.added_latency_max = 0.0
+        self._started_at = time.monotonic()
+
+    async def frames(self, queue: AudioQueue) -> AsyncGenerator[bytes, None]:
+        buffer = self._buffer
+        view = memoryview(buffer)
+        target = self.target_bytes
+        fill = 0
+        first_at = 0.0
+
+        while True:
+            if fill == 0:
+                chunk = await queue.get()
+            else:
+                remaining = self.max_wait - (time.monotonic() - first_at)
+                try:
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    chunk = await queue.get(timeout=remaining)
+                except asyncio.TimeoutError:
+                    # 마감 시간 도달: 모인 만큼만 전송
+                    yield self._flush(view, fill, first_at)
+                    fill = 0
+                    continue
+
+            if chunk is None:
+                break
+
+            self.chunks_in += 1
+            data = memoryview(chunk)
+            while data:
+                if fill == 0:
+                    first_at = time.monotonic()
+                take = min(target - fill, len(data))
+                buffer[fill : fill + take] = data[:take]
+                fill += take
+                data = data[take:]
+
+                if fill == target:
+                    yield self._flush(view, fill, first_at)
+                    fill = 0
+
+        if fill:
+            yield self._flush(view, fill, first_at)
+
+    def _flush(self, view: memoryview, fill: int, first_at: float) -> bytes:
+        latency = time.monotonic() - first_at
+        self.frames_out += 1
+        self.added_latency_total += latency
+        self.added_latency_max = max(self.added_latency_max, latency)
+        # 버퍼는 재사용되므로 프레임 단위로 한 번만 복사
+        return bytes(view[:fill])
+
+    def stats(self) -> Dict[str, Any]:
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        saved = max(self.chunks_in - self.frames_out, 0)
+        return {
+            "chunks_in": self.chunks_in,
+            "frames_out": self.frames_out,
+            "messages_saved": saved,
+            "messages_saved_per_sec": round(saved / elapsed, 2),
+            "avg_added_latency_ms": round(
+                self.added_latency_total / self.frames_out * 1000, 2
+            )
+            if self.frames_out
+            else 0.0,
+            "max_added_latency_ms": round(self.added_latency_max * 1000, 2),
+        }
@@ -0,0 +1,138 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Literal, Optional
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "block"]
+
+
+class AudioQueue:
+    """
+    바이트 단위 상한을 가진 오디오 청크 큐.
+    상한 초과 시 정책에 따라 처리합니다.
+    - drop_oldest: 가장 오래된 청크를 버리고 새 청크를 넣음 (최신 발화 우선)
+    - drop_newest: 새 청크를 버림
+    - block: 공간이 생길 때까지 put()이 대기 (수신 루프가 멈추며 클라이언트에 Backpressure 전달)
+    """
+
+    def __init__(
+        self, max_bytes: int, policy: OverflowPolicy = "drop_oldest", user_id: str = ""
+    ):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.user_id = user_id
+        self._chunks: Deque[bytes] = deque()
+        self._bytes = 0
+        self._closed = False
+        self._cond = asyncio.Condition()
+
+        # 메트릭
+        self.high_water_bytes = 0
+        self.dropped_chunks = 0
+        self.dropped_bytes = 0
+        self.blocked_puts = 0
+        self._overflowing = False
+
+    @property
+    def depth_bytes(self) -> int:
+        return self._bytes
+
+    def qsize(self) -> int:
+        return len(self._chunks)
+
+    def _record_drop(self, chunk: bytes) -> None:
+        self.dropped_chunks += 1
+        self.dropped_bytes += len(chunk)
+        if not self._overflowing:
+            # 오버플로 구간 진입 시 한 번만 경고 (청크마다 로그 폭주 방지)
+            self._overflowing = True
+            logger.warning(
+                "audio_queue_overflow",
+                user_id=self.user_id,
+                policy=self.policy,
+                depth_bytes=self._bytes,
+            )
+
+    def _popleft(self) -> bytes:
+        chunk = self._chunks.popleft()
+        self._bytes -= len(chunk)
+        if self._overflowing and self._bytes <= self.max_bytes // 2:
+            self._overflowing = False
+        return chunk
+
+    async def put(self, chunk: bytes) -> bool:
+        """청크를 넣습니다. 정책에 의해 버려졌거나 큐가 닫혔으면 False를 반환합니다."""
+        async with self._cond:
+            blocked = False
+            # 큐가 비어 있으면 상한보다 큰 단일 청크도 허용
+            while (
+                not self._closed
+                and self._chunks
+                and self._bytes + len(chunk) > self.max_bytes
+            ):
+                if self.policy == "drop_newest":
+                    self._record_drop(chunk)
+                    return False
+                if self.policy == "drop_oldest":
+                    self._record_drop(self._popleft())
+                    continue
+
+                if not blocked:
+                    blocked = True
+                    self.blocked_puts += 1
+                await self._cond.wait()
+
+            if self._closed:
+                return False
+
+            self._chunks.append(chunk)
+            self._bytes += len(chunk)
+            self.high_water_bytes = max(self.high_water_bytes, self._bytes)
+            self._cond.notify_all()
+            return True
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        청크를 꺼냅니다. 큐가 닫히고 모두 소진되면 None을 반환합니다.
+        timeout 동안 청크가 없으면 asyncio.TimeoutError가 발생합니다.
+        """
+        async with self._cond:
+            if timeout is None:
+                while not self._chunks and not self._closed:
+                    await self._cond.wait()
+            elif not self._chunks and not self._closed:
+                await asyncio.wait_for(
+                    self._cond.wait_for(lambda: bool(self._chunks) or self._closed),
+                    timeout,
+                )
+
+            if not self._chunks:
+                return None
+
+            chunk = self._popleft()
+            # block 정책으로 대기 중인 put()을 깨움
+            self._cond.notify_all()
+            return chunk
+
+    async def close(self) -> None:
+        """큐를 닫습니다. 남은 청크는 소비자가 모두 꺼낸 뒤 None을 받습니다."""
+        async with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth_bytes": self._bytes,
+            "depth_chunks": len(self._chunks),
+            "max_bytes": self.max_bytes,
+            "high_water_bytes": self.high_water_bytes,
+            "dropped_chunks": self.dropped_chunks,
+            "dropped_bytes": self.dropped_bytes,
+            "blocked_puts": self.blocked_puts,
+        }
@@ -0,0 +1,57 @@
+from typing import Optional
+
+
+class AudioRingBuffer:
+    """
+    최근 N초의 오디오를 보관하는 고정 크기 링 버퍼.
+    모든 위치는 스트림 시작 기준 누적 바이트 오프셋(absolute offset)으로 표현하며,
+    미리 할당한 bytearray 하나만 사용하므로 스트림당 메모리가 일정합니다.
+    """
+
+    def __init__(self, capacity_bytes: int):
+        if capacity_bytes <= 0:
+            raise ValueError("capacity_bytes must be positive")
+
+        self.capacity = capacity_bytes
+        self._buffer = bytearray(capacity_bytes)
+        # 보관 중인 가장 오래된 바이트의 오프셋 (tail)
+        self.start_offset = 0
+        # 다음에 기록될 바이트의 오프셋 (head)
+        self.end_offset = 0
+
+    def append(self, data: bytes) -> None:
+        size = len(data)
+        if size >= self.capacity:
+            # 용량보다 큰 청크는 마지막 capacity 바이트만 보관
+            view = memoryview(data)[size - self.capacity :]
+            self._write(self.end_offset + size - self.capacity, view)
+        else:
+            self._write(self.end_offset, memoryview(data))
+
+        self.end_offset += size
+        self.start_offset = max(self.start_offset, self.end_offset - self.capacity)
+
+    def _write(self, offset: int, view: memoryview) -> None:
+        pos = offset % self.capacity
+        first = min(len(view), self.capacity - pos)
+        self._buffer[pos : pos + first] = view[:first]
+        if first < len(view):
+            self._buffer[: len(view) - first] = view[first:]
+
+    def read_from(self, offset: int, max_bytes: Optional[int] = None) -> bytes:
+        """
+        offset 이후 보관 중인 바이트를 반환합니다 (이미 밀려난 구간은 생략).
+        max_bytes가 주어지면 최대 그 크기까지만 반환합니다.
+        """
+        offset = min(max(offset, self.start_offset), self.end_offset)
+        size = self.end_offset - offset
+        if max_bytes is not None:
+            size = min(size, max_bytes)
+        if size == 0:
+            return b""
+
+        pos = offset % self.capacity
+        view = memoryview(self._buffer)
+        if pos + size <= self.capacity:
+            return bytes(view[pos : pos + size])
+        return b"".join((view[pos:], view[: size - (self.capacity - pos)]))
@@ -1,74 +1,172 @@
-import asyncio
-from typing import AsyncGenerator, Dict
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Deque, Dict, Optional
+from core.config import get_settings
 from core.logging import get_logger
+from domain.services.audio_coalescer import ChunkCoalescer
+from domain.services.audio_queue import AudioQueue, OverflowPolicy
+from domain.services.speaking_analytics import SpeakingAnalytics, speaking_analytics
+from domain.services.vad import VadEngine, VadStream
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# 음성 에너지 이동 평균의 반영 비율
+_SPEECH_ENERGY_ALPHA = 0.2
+
+
+@dataclass
+class AudioStreamStats:
+    """사용자별 VAD 게이팅 통계"""
+
+    bytes_forwarded: int = 0
+    bytes_dropped: int = 0
+    # 음성 구간 RMS 에너지의 지수 이동 평균 (마이크와 화자의 거리 추정용)
+    speech_energy: float = 0.0
 
 
 class AudioService:
-    def __init__(self):
+    def __init__(
+        self,
+        vad_engine: Optional[VadEngine] = None,
+        queue_max_bytes: Optional[int] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
+        analytics: Optional[SpeakingAnalytics] = None,
+    ):
         # 사용자 ID를 키로, 오디오 데이터 큐를 값으로 저장
-        self._queues: Dict[str, asyncio.Queue] = {}
-
-    async def start_stream(self, user_id: str):
+        self._queues: Dict[str, AudioQueue] = {}
+        # 사용자 ID -> 방 ID (방 단위 큐 메트릭 집계용)
+        self._user_rooms: Dict[str, str] = {}
+        self._coalescers: Dict[str, ChunkCoalescer] = {}
+        # 사용자별 VAD 스무딩 상태
+        self._vad = vad_engine or VadEngine()
+        self._vad_streams: Dict[str, VadStream] = {}
+        self._stats: Dict[str, AudioStreamStats] = {}
+        # 음성 시작 직전의 무음 청크 (어두 잘림 방지용 Pre-roll)
+        self._prerolls: Dict[str, Deque[bytes]] = {}
+        self._preroll_bytes = (
+            self._vad.sample_rate * 2 * settings.vad_preroll_ms // 1000
+        )
+        # [DNA Fix] 큐 상한: 바이트/초 설정 중 작은 값 (PCM16 = 2 bytes/sample)
+        self._queue_max_bytes = queue_max_bytes or min(
+            settings.audio_queue_max_bytes,
+            int(settings.audio_queue_max_seconds * self._vad.sample_rate * 2),
+        )
+        self._overflow_policy: OverflowPolicy = (
+            overflow_policy or settings.audio_queue_overflow_policy
+        )
+        # VAD 판정을 재사용하는 발언 시간 집계 (설정으로 끌 수 있음)
+        self._analytics: Optional[SpeakingAnalytics] = None
+        if settings.speaking_analytics_enabled:
+            self._analytics = analytics or speaking_analytics
+        self._bytes_per_second = self._vad.sample_rate * 2
+
+    async def start_stream(self, user_id: str, room_id: Optional[str] = None):
         """사용자별 오디오 스트림 큐를 초기화합니다."""
         if user_id in self._queues:
             logger.warning("audio_stream_already_exists", user_id=user_id)
             await self.stop_stream(user_id)
 
-        self._queues[user_id] = asyncio.Queue()
+        self._queues[user_id] = AudioQueue(
+            self._queue_max_bytes, self._overflow_policy, user_id=user_id
+        )
+        if room_id is not None:
+            self._user_rooms[user_id] = room_id
+        self._vad_streams[user_id] = self._vad.create_stream()
+        self._stats[user_id] = AudioStreamStats()
+        self._prerolls[user_id] = deque()
         logger.info("audio_stream_started", user_id=user_id)
 
-    def _is_silence(self, data: bytes, threshold: int = 500) -> bool:
+    async def push_audio(self, user_id: str, data: bytes):
         """
-        [DNA Fix] T003: 간단한 VAD(Voice Activity Detection) Placeholder.
-        PCM 16bit 데이터의 진폭(Amplitude)을 검사하여 무음 여부를 판단합니다.
+        수신된 오디오 데이터를 큐에 넣습니다.
+        block 정책에서는 큐에 여유가 생길 때까지 대기하므로 호출자(수신 루프)가 늦춰집니다.
         """
-        if not data:
-            return True
-
-        # 간단한 RMS(Root Mean Square) 계산 대신 최대 진폭으로 약식 검사 (성능 최적화)
-        # 실제 프로덕션에서는 webrtcvad 등 전문 라이브러리 사용 권장
-        try:
-            # 바이트를 int로 변환하여 진폭 검사 (Little Endian, 16bit)
-            # 전체를 다 검사하면 느리므로 샘플링 검사
-            count = len(data) // 2
-            step = max(1, count // 100)  # 100개 샘플만 검사
-
-            for i in range(0, len(data), step * 2):
-                if i + 1 >= len(data):
-                    break
-                sample = int.from_bytes(
-                    data[i : i + 2], byteorder="little", signed=True
+        if user_id in self._queues:
+            stats = self._stats[user_id]
+            preroll = self._prerolls[user_id]
+
+            # [DNA Fix] T003: 프레임 기반 VAD로 무음 감지
+            vad_result = self._vad_streams[user_id].process(data)
+            is_speech = vad_result.is_speech
+            if is_speech and vad_result.frame_energies:
+                energy = sum(vad_result.frame_energies) / len(vad_result.frame_energies)
+                stats.speech_energy += _SPEECH_ENERGY_ALPHA * (
+                    energy - stats.speech_energy
+                )
+            room_id = self._user_rooms.get(user_id)
+            if self._analytics is not None and room_id is not None:
+                self._analytics.observe(
+                    room_id, user_id, is_speech, len(data) / self._bytes_per_second
                 )
-                if abs(sample) > threshold:
-                    return False  # 소리가 감지됨
-
-            return True  # 모든 샘플이 임계값 이하임
-        except Exception:
-            # 포맷 파싱 에러 시 일단 소리로 간주
-            return False
 
-    async def push_audio(self, user_id: str, data: bytes):
-        """수신된 오디오 데이터를 큐에 넣습니다."""
-        if user_id in self._queues:
-            # [DNA Fix] T003: 무음 감지 (VAD) 로직 적용
-            if self._is_silence(data):
-                # 무음은 큐에 넣지 않거나, 필요 시 특정 마커 처리
-                # 여기서는 트래픽 절감을 위해 스킵하되 디버그 로그만 남김
-                # logger.debug("silence_detected", user_id=user_id)
+            if not is_speech:
+                # 무음은 트래픽 절감을 위해 스킵하되, 직전 구간만 Pre-roll로 보관
+                stats.bytes_dropped += len(data)
+                preroll.append(data)
+                preroll_size = sum(map(len, preroll))
+                while preroll and preroll_size > self._preroll_bytes:
+                    preroll_size -= len(preroll.popleft())
                 return
 
+            # 무음 -> 음성 전환 시 Pre-roll을 먼저 전달하여 첫 음절 손실 방지
+            while preroll:
+                chunk = preroll.popleft()
+                stats.bytes_dropped -= len(chunk)
+                stats.bytes_forwarded += len(chunk)
+                await self._queues[user_id].put(chunk)
+
+            stats.bytes_forwarded += len(data)
             await self._queues[user_id].put(data)
         else:
             logger.warning("audio_stream_not_found_for_push", user_id=user_id)
 
+    def get_stream_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """사용자별 전달/차단 바이트 수와 현재 noise floor를 반환합니다."""
+        stats = self._stats.get(user_id)
+        vad_stream = self._vad_streams.get(user_id)
+        if stats is None or vad_stream is None:
+            return None
+
+        queue = self._queues.get(user_id)
+        coalescer = self._coalescers.get(user_id)
+        return {
+            "bytes_forwarded": stats.bytes_forwarded,
+            "bytes_dropped": stats.bytes_dropped,
+            "speech_energy": round(stats.speech_energy, 1),
+            "noise_floor": vad_stream.noise_floor,
+            "threshold": vad_stream.threshold,
+            "queue": queue.stats() if queue is not None else None,
+            "coalescer": coalescer.stats() if coalescer is not None else None,
+        }
+
+    def get_speech_energy(self, user_id: str) -> float:
+        """최근 음성 구간의 평균 에너지 (스트림이 없으면 0)"""
+        stats = self._stats.get(user_id)
+        return stats.speech_energy if stats is not None else 0.0
+
+    def get_room_queue_stats(self, room_id: str) -> Dict[str, Any]:
+        """방 단위로 사용자 큐 깊이/High-water mark/드롭 수를 집계합니다."""
+        queues = [
+            self._queues[user_id]
+            for user_id, user_room in self._user_rooms.items()
+            if user_room == room_id and user_id in self._queues
+        ]
+        return {
+            "streams": len(queues),
+            "depth_bytes": sum(q.depth_bytes for q in queues),
+            "high_water_bytes": max((q.high_water_bytes for q in queues), default=0),
+            "dropped_chunks": sum(q.dropped_chunks for q in queues),
+            "dropped_bytes": sum(q.dropped_bytes for q in queues),
+            "blocked_puts": sum(q.blocked_puts for q in queues),
+        }
+
     async def get_audio_stream(self, user_id: str) -> AsyncGenerator[bytes, None]:
         """
         큐에서 데이터를 순차적으로 꺼내주는 비동기 제너레이터입니다.
         """
         queue = self._queues.get(user_id)
-        if not queue:
+        if queue is None:
             logger.warning("audio_stream_not_found_for_consumption", user_id=user_id)
             return
 
@@ -81,13 +179,48 @@ class AudioService:
         finally:
             pass
 
+    async def get_coalesced_stream(
+        self, user_id: str, coalescer: Optional[ChunkCoalescer] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        큐의 청크를 목표 크기(기본 100ms)의 프레임으로 묶어 꺼내주는 비동기 제너레이터입니다.
+        STT 요청 수를 줄이며, 결합으로 인한 지연은 max_wait 이내로 제한됩니다.
+        """
+        queue = self._queues.get(user_id)
+        if queue is None:
+            logger.warning("audio_stream_not_found_for_consumption", user_id=user_id)
+            return
+
+        if coalescer is None:
+            coalescer = ChunkCoalescer(
+                target_bytes=self._vad.sample_rate
+                * 2
+                * settings.stt_coalesce_target_ms
+                // 1000,
+                max_wait=settings.stt_coalesce_max_wait_ms / 1000,
+            )
+        self._coalescers[user_id] = coalescer
+
+        try:
+            async for frame in coalescer.frames(queue):
+                yield frame
+        finally:
+            if self._coalescers.get(user_id) is coalescer:
+                del self._coalescers[user_id]
+            logger.info("audio_coalescer_stats", user_id=user_id, **coalescer.stats())
+
     async def stop_stream(self, user_id: str):
         """스트림을 종료하고 자원을 정리합니다."""
         if user_id in self._queues:
-            # Sentinel 전달
-            await self._queues[user_id].put(None)
+            stats = self.get_stream_stats(user_id)
+            # 큐를 닫으면 소비자는 남은 청크를 모두 꺼낸 뒤 None(종료)을 받음
+            await self._queues[user_id].close()
             del self._queues[user_id]
-            logger.info("audio_stream_stopped", user_id=user_id)
+            self._user_rooms.pop(user_id, None)
+            self._vad_streams.pop(user_id, None)
+            self._stats.pop(user_id, None)
+            self._prerolls.pop(user_id, None)
+            logger.info("audio_stream_stopped", user_id=user_id, stats=stats)
 
 
 audio_service = AudioService()
@@ -0,0 +1,254 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.config import get_settings
+from core.logging import get_logger
+from domain.services.pipeline_stage import PipelineStage
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# (room_id, 화자 표시가 포함된 transcript) -> Gemini 호출 및 결과 전송
+InsightProcessor = Callable[[str, str], Awaitable[None]]
+
+
+@dataclass
+class Utterance:
+    speaker: str
+    text: str
+
+
+@dataclass
+class _RoomWindow:
+    processor: InsightProcessor
+    opened_at: float
+    utterances: List[Utterance] = field(default_factory=list)
+    chars: int = 0
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+@dataclass
+class _InsightBatch:
+    room_id: str
+    transcript: str
+    size: int
+    opened_at: float
+    processor: InsightProcessor
+    # 이 시각 이후의 결과는 대화가 이미 넘어간 것으로 보고 버림
+    deadline: float
+    # 같은 방의 더 새로운 batch로 대체됨 (대기 중에만 설정)
+    superseded: bool = False
+
+
+class InsightAggregator:
+    """
+    방(room) 단위로 여러 화자의 final 발화를 시간/글자 수 창(window)만큼 모아
+    하나의 프롬프트로 Gemini에 요청하는 집계 단계입니다.
+    - 창은 첫 발화 후 window_seconds가 지나거나 max_chars에 도달하면 닫힘
+    - 닫힌 창(batch)은 제한된 큐 + 워커(PipelineStage)에서 처리되어 STT 루프를 막지 않음
+    - window_seconds=0 이면 발화마다 바로 요청 (묶지 않음)
+    - batch마다 마감 시각(deadline)이 있어, 대기 중 마감이 지나면 호출하지 않고
+      처리 중 마감이 지나면 취소함. 같은 방의 새 batch가 닫히면 대기 중인 이전 batch를 대체
+      (이전 발언은 새 batch 앞에 합쳐 분석 누락을 막음)
+    """
+
+    def __init__(
+        self,
+        window_seconds: Optional[float] = None,
+        max_chars: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        workers: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
+    ):
+        self.window_seconds = (
+            window_seconds
+            if window_seconds is not None
+            else settings.insight_batch_window_seconds
+        )
+        self.max_chars = max_chars or settings.insight_batch_max_chars
+        self.deadline_seconds = deadline_seconds or settings.insight_deadline_seconds
+        self._stage: PipelineStage[_InsightBatch] = PipelineStage(
+            "insight",
+            self._run_batch,
+            max_size=max_queue or settings.insight_queue_max_size,
+            workers=workers or settings.insight_workers,
+            on_drop=self._batch_done,
+        )
+        self._windows: Dict[str, _RoomWindow] = {}
+        # 방별로 큐에 있거나 처리 중인 batch 수 (flush 대기용)
+        self._in_flight: Dict[str, int] = {}
+        self._idle: Dict[str, asyncio.Event] = {}
+        # 방별로 아직 처리 시작 전인 가장 최근 batch (대체 대상)
+        self._queued: Dict[str, _InsightBatch] = {}
+
+        # 메트릭
+        self.utterances_in = 0
+        self.utterances_batched = 0
+        self.batches_out = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.superseded = 0
+        self.expired = 0
+        self.expired_in_flight = 0
+
+    def add(
+        self,
+        room_id: str,
+        speaker: str,
+        text: str,
+        processor: InsightProcessor,
+        urgent: bool = False,
+    ) -> None:
+        """final 발화를 방의 현재 창에 추가합니다 (대기하지 않음). urgent면 창을 바로 닫음."""
+        self._stage.start()
+        self.utterances_in += 1
+
+        window = self._windows.get(room_id)
+        if window is None:
+            window = _RoomWindow(processor=processor, opened_at=time.monotonic())
+            self._windows[room_id] = window
+            if self.window_seconds > 0:
+                window.timer = asyncio.get_running_loop().call_later(
+                    self.window_seconds, self._close_window, room_id
+                )
+        # 가장 최근 화자의 processor 사용 (먼저 나간 사용자의 연결에 의존하지 않도록)
+        window.processor = processor
+        window.utterances.append(Utterance(speaker, text))
+        window.chars += len(text)
+
+        if urgent or self.window_seconds <= 0 or window.chars >= self.max_chars:
+            self._close_window(room_id)
+
+    def _close_window(self, room_id: str) -> None:
+        window = self._windows.pop(room_id, None)
+        if window is None:
+            return
+        if window.timer is not None:
+            window.timer.cancel()
+
+        # 화자 표시: "speaker: 발언" 한 줄씩
+        transcript = "\n".join(f"{u.speaker}: {u.text}" for u in window.utterances)
+        size = len(window.utterances)
+        opened_at = window.opened_at
+
+        previous = self._queued.pop(room_id, None)
+        if previous is not None:
+            # 아직 시작 전인 이전 batch는 대체하고, 그 발언은 새 batch에 합침
+            previous.superseded = True
+            self.superseded += 1
+            transcript = f"{previous.transcript}\n{transcript}"
+            size += previous.size
+            opened_at = previous.opened_at
+            logger.info("insight_batch_superseded", room_id=room_id)
+
+        batch = _InsightBatch(
+            room_id=room_id,
+            transcript=transcript,
+            size=size,
+            opened_at=opened_at,
+            processor=window.processor,
+            deadline=time.monotonic() + self.deadline_seconds,
+        )
+        self._queued[room_id] = batch
+        self._in_flight[room_id] = self._in_flight.get(room_id, 0) + 1
+        self._idle.setdefault(room_id, asyncio.Event()).clear()
+        self._stage.submit(batch)
+
+    async def _run_batch(self, batch: _InsightBatch) -> None:
+        if self._queued.get(batch.room_id) is batch:
+            del self._queued[batch.room_id]
+
+        try:
+            if batch.superseded:
+                return
+
+            remaining = batch.deadline - time.monotonic()
+            if remaining <= 0:
+                # 대기 중 마감 초과: 호출하지 않고 버림
+                self.expired += 1
+                logger.info("insight_batch_expired", room_id=batch.room_id)
+                return
+
+            try:
+                await asyncio.wait_for(
+                    batch.processor(batch.room_id, batch.transcript), remaining
+                )
+            except asyncio.TimeoutError:
+                # 처리 중 마감 초과: Gemini 호출을 취소하여 슬롯을 반납
+                self.expired_in_flight += 1
+                logger.info("insight_batch_cancelled", room_id=batch.room_id)
+                return
+            finally:
+                latency = time.monotonic() - batch.opened_at
+                self.batches_out += 1
+                self.utterances_batched += batch.size
+                self.latency_total += latency
+                self.latency_max = max(self.latency_max, latency)
+                logger.info(
+                    "insight_batch_processed",
+                    room_id=batch.room_id,
+                    utterances=batch.size,
+                    latency_ms=round(latency * 1000, 1),
+                )
+        finally:
+            self._batch_done(batch)
+
+    def _batch_done(self, batch: _InsightBatch) -> None:
+        if self._queued.get(batch.room_id) is batch:
+            # 큐 초과로 버려진 경우
+            del self._queued[batch.room_id]
+        remaining = self._in_flight.get(batch.room_id, 1) - 1
+        if remaining > 0:
+            self._in_flight[batch.room_id] = remaining
+            return
+        self._in_flight.pop(batch.room_id, None)
+        idle = self._idle.pop(batch.room_id, None)
+        if idle is not None:
+            idle.set()
+
+    async def flush(self, room_id: str, timeout: Optional[float] = None) -> None:
+        """방의 열린 창을 즉시 닫고, 해당 방의 batch가 모두 처리될 때까지 기다립니다."""
+        self._close_window(room_id)
+        idle = self._idle.get(room_id)
+        if idle is None:
+            return
+        try:
+            await asyncio.wait_for(idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("insight_flush_timeout", room_id=room_id)
+
+    async def close(self) -> None:
+        """열린 창과 대기 중인 batch를 버리고 워커를 종료합니다."""
+        for window in self._windows.values():
+            if window.timer is not None:
+                window.timer.cancel()
+        self._windows.clear()
+        self._queued.clear()
+        await self._stage.close()
+        self._in_flight.clear()
+        for idle in self._idle.values():
+            idle.set()
+        self._idle.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stage.stats(),
+            "utterances": self.utterances_in,
+            "batches": self.batches_out,
+            # 발화마다 호출했을 때 대비 절감한 Gemini 호출 수
+            "calls_saved": self.utterances_batched - self.batches_out,
+            "avg_insight_latency_ms": round(
+                self.latency_total / self.batches_out * 1000, 1
+            )
+            if self.batches_out
+            else 0.0,
+            "max_insight_latency_ms": round(self.latency_max * 1000, 1),
+            "superseded": self.superseded,
+            "expired": self.expired,
+            "expired_in_flight": self.expired_in_flight,
+        }
+
+
+insight_aggregator = InsightAggregator()
@@ -0,0 +1,198 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from core.config import get_settings
+from core.logging import get_logger
+from core.prompts import estimate_tokens
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# (이전 요약, 새로 접어 넣을 발언들, 최대 단어 수) -> 새 요약 (실패 시 None)
+Summarizer = Callable[[str, List[str], int], Awaitable[Optional[str]]]
+
+
+@dataclass
+class _RoomContext:
+    touched_at: float
+    summary: str = ""
+    recent: Deque[str] = field(default_factory=deque)
+    recent_tokens: int = 0
+    # 최근 창에서 밀려나 요약에 반영 대기 중인 발언
+    pending: List[str] = field(default_factory=list)
+    compacting: Optional[asyncio.Task] = None
+
+
+class MeetingContextManager:
+    """
+    방(room)별 회의 맥락 관리자.
+    최근 N개 발언은 원문 그대로 유지하고, 밀려난 발언은 누적 요약(running summary)에
+    백그라운드로 조금씩 접어 넣습니다. 프롬프트에 붙는 맥락 크기가 토큰 예산(로컬 추정)을
+    넘지 않으므로 회의가 길어져도 프롬프트 비용/지연이 일정하게 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        max_recent: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        summary_max_tokens: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+    ):
+        self.max_recent = max_recent or settings.meeting_context_recent_utterances
+        self.max_tokens = max_tokens or settings.meeting_context_max_tokens
+        self.summary_max_tokens = (
+            summary_max_tokens or settings.meeting_context_summary_max_tokens
+        )
+        if self.summary_max_tokens >= self.max_tokens:
+            raise ValueError("summary_max_tokens must be smaller than max_tokens")
+        self.idle_ttl = idle_ttl or settings.meeting_context_idle_ttl_seconds
+        self._rooms: Dict[str, _RoomContext] = {}
+
+        # 메트릭
+        self.compactions = 0
+        self.compaction_failures = 0
+        self.dropped_utterances = 0
+
+    @property
+    def _recent_budget(self) -> int:
+        return self.max_tokens - self.summary_max_tokens
+
+    def build(self, room_id: str) -> str:
+        """프롬프트에 덧붙일 맥락 (요약 + 최근 발언). 맥락이 없으면 빈 문자열."""
+        room = self._rooms.get(room_id)
+        if room is None or (not room.summary and not room.recent):
+            return ""
+
+        parts = []
+        if room.summary:
+            parts.append(f"Summary so far:\n{room.summary}")
+        if room.recent:
+            parts.append("Recent utterances:\n" + "\n".join(room.recent))
+        return "\n\n".join(parts)
+
+    def record(self, room_id: str, transcript: str) -> None:
+        """분석한 발언을 최근 창에 추가하고, 예산을 넘는 오래된 발언은 요약 대기로 넘깁니다."""
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        room = self._rooms.get(room_id)
+        if room is None:
+            room = _RoomContext(touched_at=now)
+            self._rooms[room_id] = room
+        room.touched_at = now
+
+        for line in transcript.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            room.recent.append(line)
+            room.recent_tokens += estimate_tokens(line)
+
+        while room.recent and (
+            len(room.recent) > self.max_recent
+            or room.recent_tokens > self._recent_budget
+        ):
+            line = room.recent.popleft()
+            room.recent_tokens -= estimate_tokens(line)
+            room.pending.append(line)
+
+        # 요약이 계속 실패해도 대기 목록이 무한히 커지지 않도록 제한
+        overflow = len(room.pending) - self.max_recent * 2
+        if overflow > 0:
+            del room.pending[:overflow]
+            self.dropped_utterances += overflow
+            logger.warning(
+                "meeting_context_pending_dropped", room_id=room_id, dropped=overflow
+            )
+
+    def compact_soon(self, room_id: str, summarizer: Summarizer) -> None:
+        """요약 대기 발언이 있으면 백그라운드에서 누적 요약을 갱신합니다 (대기하지 않음)."""
+        room = self._rooms.get(room_id)
+        if room is None or not room.pending:
+            return
+        if room.compacting is not None and not room.compacting.done():
+            return
+        room.compacting = asyncio.create_task(self._compact(room_id, room, summarizer))
+
+    async def _compact(
+        self, room_id: str, room: _RoomContext, summarizer: Summarizer
+    ) -> None:
+        # 요약 중 새로 밀려난 발언은 다음 반복에서 반영
+        while room.pending:
+            lines, room.pending = room.pending, []
+            try:
+                summary = await summarizer(
+                    room.summary, lines, max(self.summary_max_tokens // 3, 1)
+                )
+            except Exception as e:
+                logger.warning("meeting_context_compaction_error", error=str(e))
+                summary = None
+
+            if summary is None:
+                # 실패: 다음 기회에 다시 시도
+                room.pending = lines + room.pending
+                self.compaction_failures += 1
+                return
+
+            room.summary = _truncate_to_tokens(summary, self.summary_max_tokens)
+            self.compactions += 1
+            logger.info(
+                "meeting_context_compacted",
+                room_id=room_id,
+                folded=len(lines),
+                summary_tokens=estimate_tokens(room.summary),
+            )
+
+    def _evict_idle(self, now: float) -> None:
+        for room_id, room in list(self._rooms.items()):
+            if now - room.touched_at > self.idle_ttl:
+                self._discard(room_id)
+
+    def _discard(self, room_id: str) -> None:
+        room = self._rooms.pop(room_id, None)
+        if room is not None and room.compacting is not None:
+            room.compacting.cancel()
+
+    async def close(self) -> None:
+        tasks = [
+            room.compacting
+            for room in self._rooms.values()
+            if room.compacting is not None and not room.compacting.done()
+        ]
+        for room_id in list(self._rooms):
+            self._discard(room_id)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self, room_id: Optional[str] = None) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "rooms": len(self._rooms),
+            "compactions": self.compactions,
+            "compaction_failures": self.compaction_failures,
+            "dropped_utterances": self.dropped_utterances,
+        }
+        if room_id is None:
+            return result
+        room = self._rooms.get(room_id)
+        if room is not None:
+            result.update(
+                recent=len(room.recent),
+                pending=len(room.pending),
+                context_tokens=estimate_tokens(self.build(room_id)),
+            )
+        return result
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens를 넘지 않도록 뒤를 자릅니다 (UTF-8 경계 보존)."""
+    limit = max(max_tokens - 1, 0) * 4
+    data = text.encode("utf-8")
+    if len(data) <= limit:
+        return text
+    return data[:limit].decode("utf-8", errors="ignore").rstrip()
+
+
+meeting_context = MeetingContextManager()
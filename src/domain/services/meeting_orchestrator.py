@@ -1,20 +1,33 @@
 import asyncio
-from typing import Any
+import functools
+import time
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
 
+from core.config import get_settings
 from core.logging import get_logger
 from core.websocket.manager import ConnectionManager
-from core.websocket.schemas import WebSocketMessage
+from core.websocket.schemas import encode_message
 from domain.services.audio_service import AudioService
+from domain.services.insight_aggregator import InsightAggregator
+from domain.services.meeting_context import MeetingContextManager
+from domain.services.pipeline_stage import StageMetrics
+from domain.services.significance_filter import SignificanceFilter
+from domain.services.transcript_dedup import TranscriptDeduplicator
 from infrastructure.external.gemini_client import GeminiClient
 from infrastructure.external.google_stt import GoogleSTTClient
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class MeetingOrchestrator:
     """
     오디오 스트림 수집 -> STT 변환 -> AI 분석 -> WebSocket 전송을
     담당하는 파이프라인 조정자 클래스입니다.
+    AI 분석은 별도 단계(제한된 큐 + 워커)에서 실행되어 STT 결과 전송이 LLM 응답을 기다리지 않습니다.
+    방의 모든 화자가 같은 InsightAggregator를 공유하면 final 발화가 방 단위로 묶여 요청됩니다.
     """
 
     def __init__(
@@ -23,11 +36,35 @@ class MeetingOrchestrator:
         stt_client: GoogleSTTClient,
         gemini_client: GeminiClient,
         manager: ConnectionManager,
+        insight_aggregator: Optional[InsightAggregator] = None,
+        meeting_context: Optional[MeetingContextManager] = None,
+        significance_filter: Optional[SignificanceFilter] = None,
+        transcript_dedup: Optional[TranscriptDeduplicator] = None,
     ):
         self.audio = audio_service
         self.stt = stt_client
         self.gemini = gemini_client
         self.manager = manager
+        # 주입되지 않으면 이 연결 전용 집계기를 사용 (종료 시 함께 정리)
+        self._owns_insights = insight_aggregator is None
+        self.insights = insight_aggregator or InsightAggregator()
+        # 방별 회의 맥락 (최근 발언 + 누적 요약). 주입되지 않으면 이 연결 전용
+        self._owns_context = meeting_context is None
+        self.context = meeting_context or MeetingContextManager()
+        # Gemini 호출 전 로컬 사전 필터 (설정으로 끌 수 있음)
+        self.filter: Optional[SignificanceFilter] = None
+        if settings.insight_filter_enabled:
+            self.filter = significance_filter or SignificanceFilter()
+        # 방의 다른 사용자 마이크와의 중복 final 제거 (방 전체가 공유할 때만 의미가 있어 주입 시에만 사용)
+        self.dedup = transcript_dedup
+        # 중복 판정이 보류된 final과 그 뒤에 온 결과 (순서대로 전송, STT 루프는 기다리지 않음)
+        self._held: Deque[
+            Tuple[Dict[str, Any], float, "Optional[asyncio.Future[bool]]"]
+        ] = deque()
+        self._held_task: "Optional[asyncio.Task[None]]" = None
+
+        # 단계별 메트릭 (STT: 결과 수신 ~ 전송 완료, insight: 창 열림 ~ 전송 완료)
+        self.stt_metrics = StageMetrics("stt")
 
     async def start_processing(self, user_id: str, room_id: str) -> None:
         """
@@ -37,24 +74,49 @@ class MeetingOrchestrator:
         logger.info("orchestrator_started", user_id=user_id, room_id=room_id)
 
         # AudioService에서 오디오 스트림 생성기 획득
-        audio_stream = self.audio.get_audio_stream(user_id)
+        # (설정 시 작은 청크를 프레임 단위로 결합하여 STT 요청 수 절감)
+        if settings.stt_coalesce_enabled:
+            audio_stream = self.audio.get_coalesced_stream(user_id)
+        else:
+            audio_stream = self.audio.get_audio_stream(user_id)
+
+        drain_timeout: Optional[float] = settings.insight_drain_timeout_seconds
 
         try:
             # STT 클라이언트에게 오디오 스트림 전달 및 결과 구독
             async for stt_result in self.stt.transcribe(audio_stream):
+                received_at = time.monotonic()
+                is_final = stt_result.get("is_final")
 
-                # 1. STT 결과를 즉시 WebSocket으로 전송 (낙관적 UI)
-                await self._broadcast_message(
-                    room_id=room_id, msg_type="stt_result", payload=stt_result
-                )
+                # 0. 같은 공간의 다른 마이크가 이미 인식한 발언이면 전송/분석하지 않음
+                verdict: "Optional[asyncio.Future[bool]]" = None
+                if (
+                    is_final
+                    and self.dedup is not None
+                    and stt_result.get("text", "").strip()
+                ):
+                    verdict = self.dedup.offer(
+                        room_id,
+                        user_id,
+                        stt_result["text"],
+                        self.audio.get_speech_energy(user_id),
+                    )
+
+                # 판정이 보류된 final이 있으면 이 화자의 이후 결과는 그 뒤에 순서대로 전송
+                # (STT 결과 소비는 계속하며, 보류 중에 온 interim은 최신 것만 유지)
+                holding = self._held_task is not None and not self._held_task.done()
+                if holding or (verdict is not None and not verdict.done()):
+                    self._hold(room_id, user_id, stt_result, received_at, verdict)
+                    continue
+                if verdict is not None and not verdict.result():
+                    continue
 
-                # 2. 문장이 완성된 경우(Final), Gemini에게 분석 요청
-                if stt_result.get("is_final"):
-                    transcript_text = stt_result.get("text", "")
-                    await self._process_ai_insight(room_id, transcript_text)
+                await self._deliver_stt_result(room_id, user_id, stt_result, received_at)
 
         except asyncio.CancelledError:
             logger.info("orchestrator_cancelled", user_id=user_id)
+            # 연결이 끊긴 경우 남은 분석 요청은 기다리지 않음
+            drain_timeout = None
             # 태스크 취소 시 정상 종료 처리
             raise
         except Exception as e:
@@ -66,7 +128,100 @@ class MeetingOrchestrator:
                 payload={"error": "Processing failed", "details": str(e)},
             )
         finally:
-            logger.info("orchestrator_stopped", user_id=user_id)
+            if self._held_task is not None:
+                if drain_timeout is not None:
+                    # 보류 중인 final은 판정(최대 hold)을 받은 뒤 분석 창에 합류
+                    await asyncio.gather(self._held_task, return_exceptions=True)
+                else:
+                    self._held_task.cancel()
+            # 스트림 종료 시 방의 열린 창을 닫고 대기 중인 분석 결과까지 전송
+            if drain_timeout is not None:
+                await self.insights.flush(room_id, drain_timeout)
+            if self._owns_insights:
+                await self.insights.close()
+            if self._owns_context:
+                await self.context.close()
+            logger.info(
+                "orchestrator_stopped", user_id=user_id, **self.get_pipeline_stats()
+            )
+
+    async def _deliver_stt_result(
+        self,
+        room_id: str,
+        user_id: str,
+        stt_result: Dict[str, Any],
+        received_at: float,
+    ) -> None:
+        # 1. STT 결과를 즉시 WebSocket으로 전송 (낙관적 UI)
+        await self._broadcast_message(
+            room_id=room_id, msg_type="stt_result", payload=stt_result
+        )
+        self.stt_metrics.observe_latency(time.monotonic() - received_at)
+
+        # 2. 문장이 완성된 경우(Final), 방 단위 집계 단계에 넘기고 바로 다음 결과를 소비
+        if stt_result.get("is_final"):
+            transcript_text = stt_result.get("text", "")
+            if transcript_text.strip():
+                self._submit_insight(room_id, user_id, transcript_text)
+
+    def _hold(
+        self,
+        room_id: str,
+        user_id: str,
+        stt_result: Dict[str, Any],
+        received_at: float,
+        verdict: "Optional[asyncio.Future[bool]]",
+    ) -> None:
+        """보류 대기열에 결과를 넣고, 판정을 기다려 순서대로 전송하는 태스크를 시작합니다."""
+        if (
+            not stt_result.get("is_final")
+            and self._held
+            and not self._held[-1][0].get("is_final")
+        ):
+            # 아직 전송되지 않은 interim은 최신 interim으로 교체
+            self._held[-1] = (stt_result, received_at, verdict)
+        else:
+            self._held.append((stt_result, received_at, verdict))
+        if self._held_task is None or self._held_task.done():
+            self._held_task = asyncio.create_task(
+                self._deliver_held(room_id, user_id)
+            )
+
+    async def _deliver_held(self, room_id: str, user_id: str) -> None:
+        while self._held:
+            verdict = self._held[0][2]
+            if verdict is not None:
+                await verdict
+            stt_result, received_at, verdict = self._held.popleft()
+            if verdict is None or verdict.result():
+                await self._deliver_stt_result(room_id, user_id, stt_result, received_at)
+
+    def _submit_insight(self, room_id: str, user_id: str, text: str) -> None:
+        """사전 필터 판정에 따라 발화를 버리거나(skip) 방의 창에 추가합니다."""
+        decision = (
+            self.filter.evaluate(room_id, user_id, text) if self.filter else "defer"
+        )
+        if decision == "skip":
+            return
+        self.insights.add(
+            room_id,
+            user_id,
+            text,
+            self._process_ai_insight,
+            urgent=decision == "send",
+        )
+
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """단계별 큐 깊이/지연 (오디오 큐 깊이는 AudioService.get_stream_stats 참조)"""
+        stats = {
+            "stt": self.stt_metrics.stats(),
+            "insight": self.insights.stats(),
+        }
+        if self.filter is not None:
+            stats["filter"] = self.filter.stats()
+        if self.dedup is not None:
+            stats["dedup"] = self.dedup.stats()
+        return stats
 
     async def _process_ai_insight(self, room_id: str, text: str) -> None:
         """Gemini를 호출하고 결과를 브로드캐스트합니다."""
@@ -74,8 +229,24 @@ class MeetingOrchestrator:
             return
 
         try:
+            # 이번 발언 이전까지의 맥락을 참고로 전달하고, 이번 발언은 맥락에 추가
+            context = self.context.build(room_id)
+            self.context.record(room_id, text)
+            self.context.compact_soon(
+                room_id, functools.partial(self.gemini.summarize, room_id=room_id)
+            )
+
+            if settings.gemini_streaming_enabled:
+                await self._stream_ai_insight(room_id, text, context or None)
+                return
+
             # Gemini 호출 (비동기)
-            insight = await self.gemini.generate_insight(text)
+            insight = await self.gemini.generate_insight(
+                text, room_id=room_id, context=context or None
+            )
+            if insight is None:
+                # 분석할 내용이 없는 짧은 발언 (전송 생략)
+                return
 
             # 결과 전송
             await self._broadcast_message(
@@ -85,13 +256,65 @@ class MeetingOrchestrator:
             # AI 분석 실패가 전체 파이프라인을 멈추게 하면 안 됨
             logger.warning("ai_processing_failed", error=str(e))
 
+    async def _stream_ai_insight(
+        self, room_id: str, text: str, context: Optional[str]
+    ) -> None:
+        """
+        스트리밍 모드: type과 content 앞부분이 나오는 대로 partial ai_response를 보내고,
+        완성되면 같은 insight_id로 최종 메시지를 보냅니다 (클라이언트는 id 기준으로 갱신).
+        """
+        insight_id = uuid.uuid4().hex
+        last: Optional[Dict[str, Any]] = None
+        try:
+            async for insight in self.gemini.stream_insight(
+                text, room_id=room_id, context=context
+            ):
+                await self._broadcast_message(
+                    room_id=room_id,
+                    msg_type="ai_response",
+                    payload={"insight_id": insight_id, **insight},
+                )
+                last = insight
+        except asyncio.CancelledError:
+            # 마감 시간 초과 등으로 취소: partial만 받은 클라이언트가 같은 id를 마무리하도록 알림
+            await self._finish_partial_insight(room_id, insight_id, last, "cancelled")
+            raise
+        except Exception:
+            await self._finish_partial_insight(room_id, insight_id, last, "error")
+            raise
+
+    async def _finish_partial_insight(
+        self,
+        room_id: str,
+        insight_id: str,
+        last: Optional[Dict[str, Any]],
+        status: str,
+    ) -> None:
+        """partial만 전송된 인사이트를 같은 insight_id의 최종 메시지로 닫습니다."""
+        if last is None or not last.get("partial"):
+            return
+        await self._broadcast_message(
+            room_id=room_id,
+            msg_type="ai_response",
+            payload={
+                "insight_id": insight_id,
+                "type": last.get("type"),
+                "content": last.get("content"),
+                "partial": False,
+                "status": status,
+            },
+        )
+
     async def _broadcast_message(
         self, room_id: str, msg_type: str, payload: Any
     ) -> None:
         """WebSocketMessage 스키마에 맞춰 메시지를 전송합니다."""
-        message = WebSocketMessage(
-            type=msg_type,  # type: ignore[arg-type]
-            payload=payload,
+        # 한 번만 직렬화한 프레임을 방 전체에 전송 (stt_result는 모델 생성 없는 경량 경로)
+        frame = encode_message(msg_type, payload)  # type: ignore[arg-type]
+        # interim 결과는 밀린 연결에서 최신 것으로 교체 가능 (final/인사이트/시스템은 유실 없음)
+        lossy = (
+            msg_type == "stt_result"
+            and isinstance(payload, dict)
+            and not payload.get("is_final")
         )
-        # Pydantic v2: mode='json' converts datetime to string
-        await self.manager.broadcast(message.model_dump(mode="json"), room_id)
\ No newline at end of file
+        await self.manager.broadcast(frame, room_id, lossy=lossy)
\ No newline at end of file
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class StageMetrics:
+    """파이프라인 단계별 큐 깊이/처리 지연 메트릭"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.depth = 0
+        self.max_depth = 0
+        self.processed = 0
+        self.dropped = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def observe_depth(self, depth: int) -> None:
+        self.depth = depth
+        self.max_depth = max(self.max_depth, depth)
+
+    def observe_latency(self, latency: float) -> None:
+        self.processed += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "avg_latency_ms": round(self.latency_total / self.processed * 1000, 1)
+            if self.processed
+            else 0.0,
+            "max_latency_ms": round(self.latency_max * 1000, 1),
+        }
+
+
+class PipelineStage(Generic[T]):
+    """
+    제한된 큐와 고정 개수의 워커로 구성된 비동기 파이프라인 단계.
+    submit()은 대기하지 않으므로 앞 단계(STT 결과 전송)가 느린 뒤 단계(LLM)에 묶이지 않습니다.
+    큐가 가득 차면 가장 오래된 항목을 버립니다 (오래된 발화의 분석보다 최신 발화가 중요).
+    지연(latency)은 submit ~ 처리 완료 시간입니다 (큐 대기 포함).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[T], Awaitable[None]],
+        max_size: int,
+        workers: int,
+        on_drop: Optional[Callable[[T], None]] = None,
+    ):
+        if max_size <= 0 or workers <= 0:
+            raise ValueError("max_size and workers must be positive")
+
+        self.name = name
+        self._handler = handler
+        self._on_drop = on_drop
+        self._max_size = max_size
+        self._queue: "asyncio.Queue[Tuple[T, float]]" = asyncio.Queue(max_size)
+        self._worker_count = workers
+        self._workers: List[asyncio.Task] = []
+        self.metrics = StageMetrics(name)
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self._worker_count)
+            ]
+
+    def submit(self, item: T) -> bool:
+        """항목을 큐에 넣습니다. 가득 차서 가장 오래된 항목을 버렸으면 False."""
+        accepted = True
+        if self._queue.full():
+            dropped, _ = self._queue.get_nowait()
+            self._queue.task_done()
+            if self._on_drop is not None:
+                self._on_drop(dropped)
+            self.metrics.dropped += 1
+            accepted = False
+            logger.warning(
+                "pipeline_stage_overflow",
+                stage=self.name,
+                dropped=self.metrics.dropped,
+            )
+
+        self._queue.put_nowait((item, time.monotonic()))
+        self.metrics.observe_depth(self._queue.qsize())
+        return accepted
+
+    async def _worker(self) -> None:
+        while True:
+            item, submitted_at = await self._queue.get()
+            self.metrics.observe_depth(self._queue.qsize())
+            try:
+                await self._handler(item)
+            except Exception as e:
+                # 한 항목의 실패가 워커를 멈추게 하면 안 됨
+                logger.warning("pipeline_stage_failed", stage=self.name, error=str(e))
+            finally:
+                self.metrics.observe_latency(time.monotonic() - submitted_at)
+                self._queue.task_done()
+
+    async def close(self, drain_timeout: Optional[float] = None) -> None:
+        """
+        워커를 종료합니다. drain_timeout이 주어지면 남은 항목을 그 시간까지 처리한 뒤 종료합니다.
+        """
+        if drain_timeout and self._workers:
+            try:
+                await asyncio.wait_for(self._queue.join(), drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "pipeline_stage_drain_timeout",
+                    stage=self.name,
+                    remaining=self._queue.qsize(),
+                )
+
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # 남은 항목을 버리고 새 큐로 교체 (다른 이벤트 루프에서 재시작 가능하도록)
+        self._queue = asyncio.Queue(self._max_size)
+        self.metrics.observe_depth(0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.metrics.stats(), "workers": self._worker_count}
@@ -0,0 +1,140 @@
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, FrozenSet, Literal, Optional
+
+from core.config import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# skip: Gemini에 보내지 않음 / defer: 방의 창에 모아서 요청 / send: 창을 바로 닫고 요청
+Decision = Literal["skip", "defer", "send"]
+
+# 단독으로는 분석할 내용이 없는 추임새/맞장구/군말 (문장부호 제거 후 토큰 단위 비교)
+FILLER_WORDS: FrozenSet[str] = frozenset(
+    """
+    음 음음 흠 어 어어 아 아아 에 에이 으 응 응응 엉 오 와 우와 헐
+    네 네네 넵 예 예예 그래 그래요 그래서 그러게 그러게요 그렇죠 그렇네요 그쵸 맞아 맞아요 맞습니다
+    좋아요 좋습니다 알겠습니다 알겠어요 오케이 오키 감사합니다 고맙습니다
+    그 저 저기 저기요 뭐 뭐지 좀 막 이제 그냥 약간 진짜 정말 되게 아무튼 어쨌든 근데 그니까 그러니까
+    잠깐 잠깐만 잠깐만요 잠시만 잠시만요 있잖아 있잖아요 글쎄 글쎄요
+    ok okay yeah yes yep uh um hmm ah oh right so
+    """.split()
+)
+
+# 토큰 끝의 조사 (같은 단어를 새 단어로 세지 않도록 제거, 두 글자 이상 토큰만)
+_PARTICLES = ("에서", "으로", "까지", "부터", "은", "는", "이", "가", "을", "를", "도", "에", "의", "로", "와", "과")
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def _content_tokens(text: str) -> FrozenSet[str]:
+    """추임새를 제외한 내용 토큰 (소문자, 문장부호/조사 제거)"""
+    tokens = set()
+    for token in _NON_WORD.sub(" ", text.lower()).split():
+        if token in FILLER_WORDS:
+            continue
+        for particle in _PARTICLES:
+            if len(token) > len(particle) + 1 and token.endswith(particle):
+                token = token[: -len(particle)]
+                break
+        tokens.add(token)
+    return frozenset(tokens)
+
+
+@dataclass
+class _RoomState:
+    last_speaker: Optional[str] = None
+    # 최근 분석 대상 발언들의 내용 토큰 (새로움 판단용)
+    recent: Deque[FrozenSet[str]] = field(default_factory=deque)
+
+
+class SignificanceFilter:
+    """
+    Gemini 호출 전 로컬 사전 필터 (발화당 수 마이크로초).
+    - 추임새/맞장구만 있거나 내용이 너무 짧은 발화: skip
+    - 최근 발언과 겹치는 토큰이 대부분인 반복 발화: skip
+    - 화자가 바뀌며 충분히 긴 새 발언이 나오면: send (방의 창을 바로 닫음)
+    - 그 외: defer (방의 창에 모아서 요청)
+    """
+
+    def __init__(
+        self,
+        min_chars: Optional[int] = None,
+        min_novelty: Optional[float] = None,
+        send_chars: Optional[int] = None,
+        history: Optional[int] = None,
+        max_rooms: int = 1024,
+    ):
+        self.min_chars = min_chars or settings.insight_filter_min_chars
+        self.min_novelty = (
+            min_novelty if min_novelty is not None else settings.insight_filter_min_novelty
+        )
+        self.send_chars = send_chars or settings.insight_filter_send_chars
+        self.history = history or settings.insight_filter_history
+        self.max_rooms = max_rooms
+        self._rooms: "OrderedDict[str, _RoomState]" = OrderedDict()
+
+        # 메트릭
+        self.decisions: Dict[str, int] = {"skip": 0, "defer": 0, "send": 0}
+        self.eval_seconds = 0.0
+
+    def evaluate(self, room_id: str, speaker: str, text: str) -> Decision:
+        started = time.perf_counter()
+        decision = self._decide(self._room(room_id), speaker, text)
+        self.eval_seconds += time.perf_counter() - started
+        self.decisions[decision] += 1
+        if decision == "skip":
+            logger.debug("insight_filter_skipped", room_id=room_id, chars=len(text))
+        return decision
+
+    def _room(self, room_id: str) -> _RoomState:
+        room = self._rooms.get(room_id)
+        if room is None:
+            room = _RoomState()
+            self._rooms[room_id] = room
+            if len(self._rooms) > self.max_rooms:
+                self._rooms.popitem(last=False)
+        else:
+            self._rooms.move_to_end(room_id)
+        return room
+
+    def _decide(self, room: _RoomState, speaker: str, text: str) -> Decision:
+        tokens = _content_tokens(text)
+        content_chars = sum(len(t) for t in tokens)
+        if content_chars < self.min_chars:
+            # 화자 전환으로 치지 않음 (맞장구가 발언권을 가져가지 않도록)
+            return "skip"
+
+        seen = set().union(*room.recent) if room.recent else set()
+        novelty = len(tokens - seen) / len(tokens)
+        if novelty < self.min_novelty:
+            return "skip"
+
+        turn_changed = room.last_speaker is not None and room.last_speaker != speaker
+        room.last_speaker = speaker
+        room.recent.append(tokens)
+        if len(room.recent) > self.history:
+            room.recent.popleft()
+
+        if turn_changed and content_chars >= self.send_chars:
+            return "send"
+        return "defer"
+
+    def stats(self) -> Dict[str, Any]:
+        evaluated = sum(self.decisions.values())
+        return {
+            **self.decisions,
+            # 필터가 없었다면 Gemini로 보냈을 발화 중 보내지 않은 비율
+            "calls_avoided_ratio": round(self.decisions["skip"] / evaluated, 3)
+            if evaluated
+            else 0.0,
+            "avg_eval_us": round(self.eval_seconds / evaluated * 1e6, 2)
+            if evaluated
+            else 0.0,
+        }
+
+
+significance_filter = SignificanceFilter()
@@ -0,0 +1,224 @@
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from core.config import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# (room_id, 이벤트) -> None. 오디오 수신 경로에서 호출되므로 대기하지 않아야 함
+SpeakingEventListener = Callable[[str, Dict[str, Any]], None]
+
+# 오디오 시각이 도착 시각보다 이만큼 뒤처지면 (클라이언트가 전송을 멈췄다 재개) 다시 맞춤
+_RESYNC_SECONDS = 1.0
+# 유휴 방 정리 주기 (청크마다 전체 방을 훑지 않도록)
+_EVICT_INTERVAL_SECONDS = 60.0
+
+
+class _SpeakerCounters:
+    """사용자별 고정 크기 누적 카운터"""
+
+    __slots__ = (
+        "talk_seconds",
+        "turns",
+        "interruptions",
+        "overlap_seconds",
+        "last_speech_at",
+        "origin",
+        "audio_seconds",
+    )
+
+    def __init__(self, origin: float):
+        self.talk_seconds = 0.0
+        self.turns = 0
+        self.interruptions = 0
+        self.overlap_seconds = 0.0
+        self.last_speech_at: Optional[float] = None
+        # 오디오 시각 = 첫 청크 도착 시각(origin) + 지금까지 받은 오디오 길이의 합
+        self.origin = origin
+        self.audio_seconds = 0.0
+
+
+class _RoomCounters:
+    __slots__ = ("speakers", "total_talk_seconds", "last_speaker", "dominant", "touched_at")
+
+    def __init__(self, touched_at: float):
+        self.speakers: Dict[str, _SpeakerCounters] = {}
+        self.touched_at = touched_at
+        self.total_talk_seconds = 0.0
+        self.last_speaker: Optional[str] = None
+        # 발언 점유 이벤트를 보낸 사용자 (비율이 내려가면 다시 감지 가능)
+        self.dominant: Set[str] = set()
+
+
+class SpeakingAnalytics:
+    """
+    AudioService의 VAD 판정으로 방별 발언 시간/발언 차례/끼어들기/동시 발화를 집계합니다.
+    LLM 호출 없이 발언 점유(dominance)를 판정하며, 같은 입력에는 항상 같은 이벤트를 냅니다.
+    - 발언 차례(turn): 직전 화자와 다른 사용자가 발화를 시작
+    - 끼어들기(interruption): 다른 사용자가 말하는 중에 발화를 시작
+    - 동시 발화(overlap): 다른 사용자와 겹쳐 말한 시간
+    시각은 도착 시각이 아니라 사용자별로 받은 오디오 길이의 누적으로 계산하므로
+    네트워크 지터나 묶음 전송에 영향을 받지 않습니다.
+    오디오가 idle_ttl 동안 없는 방은 정리합니다 (회의 종료 없이 연결만 끊긴 방).
+    """
+
+    def __init__(
+        self,
+        overlap_window: Optional[float] = None,
+        dominance_share: Optional[float] = None,
+        dominance_min_talk: Optional[float] = None,
+        dominance_hysteresis: Optional[float] = None,
+        idle_ttl: Optional[float] = None,
+    ):
+        self.overlap_window = overlap_window or settings.speaking_overlap_window_seconds
+        self.dominance_share = dominance_share or settings.speaking_dominance_share
+        self.dominance_min_talk = (
+            dominance_min_talk
+            if dominance_min_talk is not None
+            else settings.speaking_dominance_min_talk_seconds
+        )
+        self.dominance_hysteresis = (
+            dominance_hysteresis
+            if dominance_hysteresis is not None
+            else settings.speaking_dominance_hysteresis
+        )
+        self.idle_ttl = idle_ttl or settings.speaking_idle_ttl_seconds
+        self._rooms: Dict[str, _RoomCounters] = {}
+        self._next_eviction_at = time.monotonic() + _EVICT_INTERVAL_SECONDS
+        self._listeners: List[SpeakingEventListener] = []
+
+    def subscribe(self, listener: SpeakingEventListener) -> None:
+        self._listeners.append(listener)
+
+    def observe(
+        self,
+        room_id: str,
+        user_id: str,
+        is_speech: bool,
+        duration: float,
+    ) -> None:
+        """VAD가 판정한 청크 하나(duration초)를 반영합니다 (무음도 오디오 시각을 진행)."""
+        arrived_at = time.monotonic()
+        if arrived_at >= self._next_eviction_at:
+            self._evict_idle(arrived_at)
+
+        room = self._rooms.get(room_id)
+        if room is None:
+            room = self._rooms[room_id] = _RoomCounters(arrived_at)
+        room.touched_at = arrived_at
+        speaker = room.speakers.get(user_id)
+        if speaker is None:
+            speaker = room.speakers[user_id] = _SpeakerCounters(arrived_at)
+
+        # 이 청크가 끝나는 오디오 시각
+        if arrived_at - (speaker.origin + speaker.audio_seconds) > _RESYNC_SECONDS:
+            speaker.origin = arrived_at - speaker.audio_seconds
+        speaker.audio_seconds += duration
+        if not is_speech:
+            return
+        now = speaker.origin + speaker.audio_seconds
+
+        others_speaking = any(
+            other_id != user_id
+            and other.last_speech_at is not None
+            and now - other.last_speech_at <= self.overlap_window + duration
+            for other_id, other in room.speakers.items()
+        )
+
+        # 직전 발화와 간격이 벌어졌으면 새 발화 구간의 시작
+        starts_segment = (
+            speaker.last_speech_at is None
+            or now - speaker.last_speech_at > self.overlap_window + duration
+        )
+        if starts_segment:
+            if room.last_speaker != user_id:
+                speaker.turns += 1
+            if others_speaking:
+                speaker.interruptions += 1
+            room.last_speaker = user_id
+
+        speaker.talk_seconds += duration
+        speaker.last_speech_at = now
+        room.total_talk_seconds += duration
+        if others_speaking:
+            speaker.overlap_seconds += duration
+
+        self._check_dominance(room_id, room, user_id, speaker)
+
+    def _check_dominance(
+        self, room_id: str, room: _RoomCounters, user_id: str, speaker: _SpeakerCounters
+    ) -> None:
+        total = room.total_talk_seconds
+        # 이미 감지된 사용자는 비율이 (기준 - 히스테리시스) 아래로 내려가면 해제
+        for dominant_id in list(room.dominant):
+            share = room.speakers[dominant_id].talk_seconds / total
+            if share < self.dominance_share - self.dominance_hysteresis:
+                room.dominant.discard(dominant_id)
+
+        if (
+            user_id in room.dominant
+            or len(room.speakers) < 2
+            or total < self.dominance_min_talk
+        ):
+            return
+        share = speaker.talk_seconds / total
+        if share < self.dominance_share:
+            return
+
+        room.dominant.add(user_id)
+        event = {
+            "event": "speaking_dominance",
+            "user_id": user_id,
+            "share": round(share, 3),
+            "talk_seconds": round(speaker.talk_seconds, 1),
+            "room_talk_seconds": round(total, 1),
+        }
+        logger.info(
+            "speaking_dominance_detected",
+            room_id=room_id,
+            user_id=user_id,
+            share=event["share"],
+        )
+        for listener in self._listeners:
+            try:
+                listener(room_id, event)
+            except Exception as e:
+                logger.warning("speaking_event_listener_error", error=str(e))
+
+    def reset(self, room_id: str) -> None:
+        """회의 종료 시 방의 집계를 버립니다."""
+        self._rooms.pop(room_id, None)
+
+    def _evict_idle(self, now: float) -> None:
+        self._next_eviction_at = now + _EVICT_INTERVAL_SECONDS
+        for room_id, room in list(self._rooms.items()):
+            if now - room.touched_at > self.idle_ttl:
+                del self._rooms[room_id]
+
+    def stats(self, room_id: str) -> Dict[str, Any]:
+        """방의 현재 집계 (사용자 수에 비례하는 시간)"""
+        room = self._rooms.get(room_id)
+        if room is None:
+            return {"total_talk_seconds": 0.0, "users": [], "dominant": []}
+
+        total = room.total_talk_seconds
+        return {
+            "total_talk_seconds": round(total, 2),
+            "users": [
+                {
+                    "user_id": user_id,
+                    "talk_seconds": round(s.talk_seconds, 2),
+                    "share": round(s.talk_seconds / total, 3) if total else 0.0,
+                    "turns": s.turns,
+                    "interruptions": s.interruptions,
+                    "overlap_seconds": round(s.overlap_seconds, 2),
+                }
+                for user_id, s in room.speakers.items()
+            ],
+            "dominant": sorted(room.dominant),
+        }
+
+
+speaking_analytics = SpeakingAnalytics()
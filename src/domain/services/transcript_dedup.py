@@ -0,0 +1,172 @@
+import asyncio
+import re
+import time
+import zlib
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from core.config import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+_NON_WORD = re.compile(r"[\W_]+")
+# MinHash 해시 함수 (a * x + b) mod p 의 계수 (고정값이라 같은 입력에 항상 같은 서명)
+_PRIME = (1 << 61) - 1
+_NUM_HASHES = 16
+_COEFFS = tuple(
+    ((i * 0x9E3779B1 + 0x7F4A7C15) % _PRIME | 1, (i * 0x85EBCA77 + 0xC2B2AE3D) % _PRIME)
+    for i in range(1, _NUM_HASHES + 1)
+)
+
+Signature = Tuple[int, ...]
+
+
+def minhash_signature(text: str, shingle: int = 3) -> Signature:
+    """공백/문장부호를 제거한 글자 n-gram(shingle) 집합의 MinHash 서명"""
+    normalized = _NON_WORD.sub("", text.lower())
+    if len(normalized) <= shingle:
+        shingles = {normalized}
+    else:
+        shingles = {
+            normalized[i : i + shingle] for i in range(len(normalized) - shingle + 1)
+        }
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _COEFFS)
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """두 서명의 Jaccard 유사도 추정치"""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+@dataclass
+class _Final:
+    user_id: str
+    signature: Signature
+    energy: float
+    at: float
+    # 판정 (True: 전송, False: 중복으로 버림). 보류 중이면 아직 완료되지 않음
+    verdict: "Optional[asyncio.Future[bool]]" = None
+
+
+class TranscriptDeduplicator:
+    """
+    같은 공간의 여러 마이크가 한 화자의 발언을 중복 인식한 final 결과를 방 단위로 제거합니다.
+    - 최근 window 동안의 final을 MinHash 서명으로 보관 (방별 max_entries 개로 제한)
+    - 다른 사용자의 final과 유사도가 threshold 이상이면 중복으로 판정
+    - 방에 다른 사용자의 최근 final이 있으면 hold 동안 판정을 보류하고,
+      그 사이 들어온 중복 중 음성 에너지가 가장 큰 사용자의 결과만 유지
+    - 이미 전송된 결과와 중복인 늦은 final은 에너지와 무관하게 버림
+    판정 보류는 타이머로 처리하므로 offer()는 호출자(STT 루프)를 기다리게 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        window: Optional[float] = None,
+        hold: Optional[float] = None,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_rooms: int = 1024,
+    ):
+        self.window = window or settings.transcript_dedup_window_seconds
+        self.hold = hold if hold is not None else settings.transcript_dedup_hold_seconds
+        self.threshold = threshold or settings.transcript_dedup_similarity
+        self.max_entries = max_entries or settings.transcript_dedup_max_entries
+        self.max_rooms = max_rooms
+        self._rooms: "OrderedDict[str, Deque[_Final]]" = OrderedDict()
+
+        # 메트릭
+        self.finals = 0
+        self.dropped = 0
+        self.held = 0
+
+    def offer(
+        self, room_id: str, user_id: str, text: str, energy: float
+    ) -> "asyncio.Future[bool]":
+        """
+        final의 판정 future를 반환합니다 (True면 전송/분석, False면 다른 사용자 결과의 중복).
+        바로 판정할 수 있으면 이미 완료된 future이고, 보류가 필요하면 hold 뒤에 완료됩니다.
+        """
+        self.finals += 1
+        loop = asyncio.get_running_loop()
+        verdict: "asyncio.Future[bool]" = loop.create_future()
+        now = time.monotonic()
+        entries = self._room(room_id)
+        while entries and now - entries[0].at > self.window:
+            entries.popleft()
+
+        final = _Final(user_id, minhash_signature(text), energy, now, verdict)
+        others_active = False
+        replaced = []
+        for other in entries:
+            if other.user_id == user_id:
+                continue
+            others_active = True
+            if similarity(other.signature, final.signature) < self.threshold:
+                continue
+
+            if (
+                other.verdict is not None
+                and not other.verdict.done()
+                and energy > other.energy
+            ):
+                # 보류 중인 중복보다 가까운 마이크: 기존 결과를 대체
+                other.verdict.set_result(False)
+                self._drop(room_id, other.user_id, user_id)
+                replaced.append(other)
+                continue
+            self._drop(room_id, user_id, other.user_id)
+            verdict.set_result(False)
+            return verdict
+
+        # 대체된 결과는 보관하지 않음 (이후 중복은 현재 유지 중인 결과 기준으로 판정)
+        for other in replaced:
+            entries.remove(other)
+        entries.append(final)
+        if not others_active or self.hold <= 0:
+            verdict.set_result(True)
+            return verdict
+
+        # 다른 마이크의 중복 인식이 도착할 때까지 잠시 보류
+        self.held += 1
+        loop.call_later(self.hold, _resolve_held, verdict)
+        return verdict
+
+    def _room(self, room_id: str) -> Deque[_Final]:
+        entries = self._rooms.get(room_id)
+        if entries is None:
+            entries = self._rooms[room_id] = deque(maxlen=self.max_entries)
+            if len(self._rooms) > self.max_rooms:
+                self._rooms.popitem(last=False)
+        else:
+            self._rooms.move_to_end(room_id)
+        return entries
+
+    def _drop(self, room_id: str, user_id: str, kept_user_id: str) -> None:
+        self.dropped += 1
+        logger.info(
+            "transcript_duplicate_dropped",
+            room_id=room_id,
+            user_id=user_id,
+            kept_user_id=kept_user_id,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "finals": self.finals,
+            "dropped": self.dropped,
+            "held": self.held,
+            "rooms": len(self._rooms),
+        }
+
+
+def _resolve_held(verdict: "asyncio.Future[bool]") -> None:
+    # hold 동안 더 가까운 마이크의 중복이 오지 않았으면 유지
+    if not verdict.done():
+        verdict.set_result(True)
+
+
+transcript_dedup = TranscriptDeduplicator()
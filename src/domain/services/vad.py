@@ -0,0 +1,207 @@
+import math
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from core.config import get_settings
+
+settings = get_settings()
+
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+@dataclass
+class VadResult:
+    """청크 단위 VAD 판정 결과"""
+
+    is_speech: bool
+    frame_energies: List[float] = field(default_factory=list)
+
+
+class VadEngine:
+    """
+    프레임 기반 VAD(Voice Activity Detection) 엔진.
+    PCM16(Little Endian) 버퍼를 복사 없이 memoryview로 해석하여
+    10/20/30ms 프레임 단위 RMS 에너지를 일괄 계산합니다.
+    """
+
+    def __init__(
+        self,
+        sample_rate: Optional[int] = None,
+        frame_ms: Optional[int] = None,
+        threshold: Optional[float] = None,
+        attack_frames: Optional[int] = None,
+        hangover_frames: Optional[int] = None,
+        sample_stride: Optional[int] = None,
+        adaptive: Optional[bool] = None,
+    ):
+        self.sample_rate = sample_rate or settings.audio_sample_rate
+        self.frame_ms = frame_ms or settings.vad_frame_ms
+        if self.frame_ms not in (10, 20, 30):
+            raise ValueError("frame_ms must be one of 10, 20, 30")
+
+        self.threshold = (
+            threshold if threshold is not None else settings.vad_energy_threshold
+        )
+        self.attack_frames = attack_frames or settings.vad_attack_frames
+        self.hangover_frames = (
+            hangover_frames
+            if hangover_frames is not None
+            else settings.vad_hangover_frames
+        )
+        self.sample_stride = sample_stride or settings.vad_sample_stride
+        self.frame_samples = self.sample_rate * self.frame_ms // 1000
+        self.adaptive = adaptive if adaptive is not None else settings.vad_adaptive
+
+    def _samples(self, data: bytes) -> Sequence[int]:
+        """PCM16 바이트를 int16 시퀀스로 해석합니다 (가능하면 zero-copy)."""
+        usable = len(data) - (len(data) & 1)
+        if _NATIVE_LITTLE_ENDIAN:
+            return memoryview(data)[:usable].cast("h")
+
+        # Big Endian 플랫폼에서는 바이트 순서 변환을 위해 복사가 불가피함
+        samples = array("h", bytes(data[:usable]))
+        samples.byteswap()
+        return samples
+
+    def frame_energies(self, data: bytes) -> List[float]:
+        """청크를 프레임으로 나누어 프레임별 RMS를 반환합니다 (마지막 부분 프레임 포함)."""
+        samples = self._samples(data)
+        step = self.frame_samples
+        stride = self.sample_stride
+        energies: List[float] = []
+
+        for start in range(0, len(samples), step):
+            # 스트라이드 슬라이스도 memoryview 위의 뷰이므로 복사가 발생하지 않음
+            frame = samples[start : start + step : stride]
+            # hypot(*frame) = sqrt(sum(x^2)) 를 C 레벨에서 한 번에 계산
+            energies.append(math.hypot(*frame) / math.sqrt(len(frame)))
+
+        return energies
+
+    def create_stream(self) -> "VadStream":
+        """사용자 스트림별 스무딩 상태를 생성합니다."""
+        noise = NoiseFloorTracker() if self.adaptive else None
+        return VadStream(self, noise)
+
+
+class NoiseFloorTracker:
+    """
+    최근 프레임 에너지의 하위 백분위수로 배경 소음(Noise Floor)을 추정합니다.
+    에너지를 1dB 단위 히스토그램으로 누적하므로 프레임당 갱신 비용은 O(1)이며,
+    백분위수 재계산은 일정 프레임마다 히스토그램(97 bin)을 한 번 훑는 것으로 끝납니다.
+    """
+
+    _BINS = 97  # 20*log10(32768) ≈ 90.3dB
+
+    def __init__(
+        self,
+        window_frames: Optional[int] = None,
+        percentile: Optional[float] = None,
+        calibration_frames: Optional[int] = None,
+        update_interval: int = 25,
+    ):
+        self.window_frames = window_frames or settings.vad_noise_window_frames
+        self.percentile = percentile or settings.vad_noise_percentile
+        self.calibration_frames = min(
+            calibration_frames or settings.vad_noise_calibration_frames,
+            self.window_frames,
+        )
+        self.update_interval = update_interval
+        # 고정 크기 링 버퍼 (bin 인덱스 저장)
+        self._history = array("B", bytes(self.window_frames))
+        self._counts = [0] * self._BINS
+        self._pos = 0
+        self._filled = 0
+        self._since_update = 0
+        self.floor: Optional[float] = None
+
+    def add(self, energy: float) -> None:
+        level = min(self._BINS - 1, int(20 * math.log10(energy + 1)))
+
+        if self._filled == self.window_frames:
+            self._counts[self._history[self._pos]] -= 1
+        else:
+            self._filled += 1
+
+        self._history[self._pos] = level
+        self._counts[level] += 1
+        self._pos = (self._pos + 1) % self.window_frames
+
+        self._since_update += 1
+        if (
+            self._filled >= self.calibration_frames
+            and (self.floor is None or self._since_update >= self.update_interval)
+        ):
+            self._recompute()
+
+    def _recompute(self) -> None:
+        self._since_update = 0
+        target = max(1, math.ceil(self._filled * self.percentile))
+        cumulative = 0
+        for level, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= target:
+                # bin 중앙값을 선형 진폭으로 환산
+                self.floor = 10 ** ((level + 0.5) / 20) - 1
+                return
+
+
+class VadStream:
+    """
+    스트림별 Attack/Hangover 스무딩 상태.
+    - Attack: 연속 N 프레임 이상 임계값을 넘어야 음성 구간으로 진입 (순간 잡음 제거)
+    - Hangover: 음성 종료 후 N 프레임 동안 음성으로 유지 (어미 잘림 방지)
+    """
+
+    def __init__(self, engine: VadEngine, noise: Optional[NoiseFloorTracker] = None):
+        self.engine = engine
+        self.noise = noise
+        self._onset_frames = 0
+        self._hangover_left = 0
+
+    @property
+    def noise_floor(self) -> Optional[float]:
+        return self.noise.floor if self.noise else None
+
+    @property
+    def threshold(self) -> float:
+        """보정 완료 전에는 고정 임계값, 이후에는 noise floor 기준 상대 임계값"""
+        floor = self.noise_floor
+        if floor is None:
+            return self.engine.threshold
+        return min(
+            max(floor * settings.vad_noise_margin, settings.vad_min_threshold),
+            settings.vad_max_threshold,
+        )
+
+    def process(self, data: bytes) -> VadResult:
+        if not data:
+            return VadResult(is_speech=False)
+
+        energies = self.engine.frame_energies(data)
+        attack = self.engine.attack_frames
+        # 임계값은 청크 단위로 갱신 (청크 내부에서는 고정)
+        threshold = self.threshold
+        is_speech = False
+
+        for energy in energies:
+            if self.noise is not None:
+                self.noise.add(energy)
+
+            if energy >= threshold:
+                self._onset_frames += 1
+            else:
+                self._onset_frames = 0
+
+            if self._onset_frames >= attack:
+                self._hangover_left = self.engine.hangover_frames
+                is_speech = True
+            elif self._hangover_left > 0:
+                self._hangover_left -= 1
+                is_speech = True
+
+        # Attack 진행 중인 청크는 통과시키지 않음 (발화 시작부는 pre-roll 버퍼가 보존)
+
+        return VadResult(is_speech=is_speech, frame_energies=energies)
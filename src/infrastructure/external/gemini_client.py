@@ -1,25 +1,67 @@
-import json
 import google.generativeai as genai
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, AsyncGenerator
 
 from core.config import get_settings
 from core.logging import get_logger
-from core.prompts import SYSTEM_MODERATOR_PROMPT
+from core.prompts import (
+    MEETING_CONTEXT_PROMPT,
+    MEETING_SUMMARY_PROMPT,
+    SYSTEM_MODERATOR_PROMPT,
+    estimate_tokens,
+)
+from infrastructure.external.gemini_hedging import RequestHedger, gemini_hedger
+from infrastructure.external.gemini_scheduler import (
+    GeminiRejectedError,
+    GeminiScheduler,
+    Priority,
+    gemini_scheduler,
+)
+from infrastructure.external.insight_cache import MISS, InsightCache, insight_cache
+from infrastructure.external.insight_parser import (
+    InsightParseError,
+    parse_insight,
+    parse_summary,
+)
+from infrastructure.external.insight_stream_parser import PartialInsightParser
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# 토큰 예산 차감용 응답 토큰 추정치 (실제 사용량을 알면 호출 후 보정)
+_OUTPUT_TOKEN_ESTIMATE = 128
+
+
+def _estimate_tokens(prompt: str) -> int:
+    """호출 전 토큰 수 추정 (프롬프트 + 응답 추정치)"""
+    return estimate_tokens(prompt) + _OUTPUT_TOKEN_ESTIMATE
+
 
 class GeminiClient:
     """
     Google Gemini AI와의 통신을 담당하는 비동기 클라이언트
     """
 
-    def __init__(self, model: Optional[Any] = None):
+    def __init__(
+        self,
+        model: Optional[Any] = None,
+        scheduler: Optional[GeminiScheduler] = None,
+        cache: Optional[InsightCache] = None,
+        hedger: Optional[RequestHedger] = None,
+    ):
         """
         초기화 시 API Key를 설정하고 모델을 로드합니다.
         테스트를 위해 외부에서 model 객체를 주입받을 수 있습니다.
+        호출 동시성/토큰 예산은 프로세스 전역 스케줄러를 공유합니다.
         """
+        self.scheduler = scheduler or gemini_scheduler
+        # 반복되는 짧은 발언("네", "좋습니다")의 중복 호출 방지 (프로세스 전역 공유)
+        if cache is None and settings.insight_cache_enabled:
+            cache = insight_cache
+        self.cache = cache
+        # 느린 호출의 중복 요청(헤징)으로 꼬리 지연 단축 (선택 기능)
+        if hedger is None and settings.gemini_hedging_enabled:
+            hedger = gemini_hedger
+        self.hedger = hedger
         if model:
             self.model = model
         else:
@@ -34,36 +76,196 @@ class GeminiClient:
         # 시스템 페르소나 및 프롬프트 템플릿 정의
         self.system_prompt = SYSTEM_MODERATOR_PROMPT
 
-    async def generate_insight(self, text: str) -> Dict[str, Any]:
+    async def _generate(
+        self, prompt: str, room_id: Optional[str], priority: Priority
+    ) -> Any:
+        """스케줄러 슬롯을 확보한 뒤 모델을 호출합니다 (실제 토큰 사용량으로 예산 보정)."""
+        tokens = _estimate_tokens(prompt)
+        async with self.scheduler.slot(
+            tokens, room_id=room_id, priority=priority
+        ) as ticket:
+            if self.hedger is not None and priority == "interactive":
+                response = await self.hedger.run(
+                    lambda: self.model.generate_content_async(prompt),
+                    hedge_call=lambda: self._generate_hedge(prompt, tokens, room_id),
+                )
+            else:
+                response = await self.model.generate_content_async(prompt)
+            self._record_usage(ticket, response)
+        return response
+
+    async def _generate_hedge(
+        self, prompt: str, tokens: int, room_id: Optional[str]
+    ) -> Any:
+        """헤지 요청도 별도 슬롯을 확보해 동시 호출 상한과 토큰 예산을 지킵니다."""
+        async with self.scheduler.slot(
+            tokens, room_id=room_id, priority="interactive"
+        ) as ticket:
+            response = await self.model.generate_content_async(prompt)
+            self._record_usage(ticket, response)
+        return response
+
+    def _build_prompt(self, text: str, context: Optional[str]) -> str:
+        prompt = f"{self.system_prompt}\n{text}"
+        if context:
+            prompt += MEETING_CONTEXT_PROMPT.format(context=context)
+        return prompt
+
+    @staticmethod
+    def _record_usage(ticket: Any, response: Any) -> None:
+        usage = getattr(response, "usage_metadata", None)
+        total_tokens = getattr(usage, "total_token_count", None)
+        if isinstance(total_tokens, int):
+            ticket.actual_tokens = total_tokens
+
+    @staticmethod
+    def _parse_error(error: InsightParseError, response_text: str) -> Dict[str, Any]:
+        """파싱 실패 원인(JSON 형식 / 스키마)을 구분하여 기록하고 ERROR 인사이트를 반환"""
+        if error.reason == "invalid_json":
+            logger.error(
+                "gemini_json_error", error=str(error), response_text=response_text
+            )
+            return {"type": "ERROR", "content": "JSON parsing failed"}
+        logger.error(
+            "gemini_schema_error", error=str(error), response_text=response_text
+        )
+        return {"type": "ERROR", "content": "Invalid insight format"}
+
+    async def generate_insight(
+        self,
+        text: str,
+        room_id: Optional[str] = None,
+        priority: Priority = "interactive",
+        context: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
         사용자 발언을 분석하여 JSON 형태의 인사이트를 반환합니다.
+        room_id/priority는 스케줄러의 방별 공정 배분과 우선순위에 사용됩니다.
+        context(회의 요약 + 최근 발언)가 주어지면 참고용으로 프롬프트에 덧붙입니다.
+        분석할 가치가 없는 짧은 입력이면 None을 반환합니다 (Gemini 호출 없음).
         """
-        prompt = f"{self.system_prompt}\n{text}"
+        # 캐시는 발언 텍스트 기준 (반복되는 짧은 발언은 맥락과 무관하게 재사용)
+        if self.cache is not None:
+            cached = self.cache.get(text)
+            if cached is not MISS:
+                return cached
+
+        prompt = self._build_prompt(text, context)
         response_text = "" # for error logging context
 
         try:
-            # 비동기 추론 호출
-            response = await self.model.generate_content_async(prompt)
+            # 비동기 추론 호출 (스케줄러 슬롯 확보 후)
+            response = await self._generate(prompt, room_id, priority)
 
-            # 응답 텍스트 추출 및 JSON 파싱
+            # 응답 텍스트 추출 및 JSON 파싱 + 스키마 검증 (코드 펜스 등은 로컬에서 복구)
             response_text = response.text
-            insight_data = json.loads(response_text)
+            insight_data = parse_insight(response_text)
 
             # 성공 로그
             logger.info(
                 "gemini_insight_generated",
                 type=insight_data.get("type"),
-                content_preview=insight_data.get("content")[:20],
+                content_preview=(insight_data.get("content") or "")[:20],
             )
 
+            # 성공한 결과만 캐시 (에러 응답은 다음 요청에서 재시도)
+            if self.cache is not None:
+                self.cache.put(text, insight_data)
+
             return insight_data
 
-        except json.JSONDecodeError as e:
-            logger.error(
-                "gemini_json_error", error=str(e), response_text=response_text
+        except GeminiRejectedError:
+            # 대기 상한 초과: 호출하지 않고 빠르게 실패 (로그는 스케줄러에서 기록)
+            return {"type": "ERROR", "content": "Analysis rejected (overloaded)"}
+
+        except InsightParseError as e:
+            return self._parse_error(e, response_text)
+
+        except Exception as e:
+            logger.error("gemini_api_error", error=str(e))
+            return {"type": "ERROR", "content": "Analysis failed"}
+
+    async def stream_insight(
+        self,
+        text: str,
+        room_id: Optional[str] = None,
+        priority: Priority = "interactive",
+        context: Optional[str] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        스트리밍 생성으로 인사이트를 만들며, type과 content 앞부분이 나오는 대로
+        {"type", "content", "partial": True} 스냅샷을 yield하고
+        마지막에 완성된 인사이트({..., "partial": False})를 yield합니다.
+        짧은 입력(부정 캐시)이면 아무것도 yield하지 않습니다.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(text)
+            if cached is not MISS:
+                if cached is not None:
+                    yield {**cached, "partial": False}
+                return
+
+        prompt = self._build_prompt(text, context)
+        parser = PartialInsightParser()
+
+        try:
+            async with self.scheduler.slot(
+                _estimate_tokens(prompt), room_id=room_id, priority=priority
+            ) as ticket:
+                response = await self.model.generate_content_async(prompt, stream=True)
+                last_chunk = None
+                async for chunk in response:
+                    last_chunk = chunk
+                    snapshot = parser.feed(chunk.text)
+                    if snapshot is not None:
+                        yield {**snapshot, "partial": True}
+                # 스트리밍 응답은 마지막 조각에 사용량 정보가 담김
+                self._record_usage(ticket, last_chunk)
+
+            insight_data = parse_insight(parser.text)
+            logger.info(
+                "gemini_insight_generated",
+                type=insight_data.get("type"),
+                content_preview=(insight_data.get("content") or "")[:20],
+                streamed=True,
             )
-            return {"type": "ERROR", "content": "JSON parsing failed"}
+            if self.cache is not None:
+                self.cache.put(text, insight_data)
+            yield {**insight_data, "partial": False}
+
+        except GeminiRejectedError:
+            yield {
+                "type": "ERROR",
+                "content": "Analysis rejected (overloaded)",
+                "partial": False,
+            }
+
+        except InsightParseError as e:
+            yield {**self._parse_error(e, parser.text), "partial": False}
 
         except Exception as e:
             logger.error("gemini_api_error", error=str(e))
-            return {"type": "ERROR", "content": "Analysis failed"}
\ No newline at end of file
+            yield {"type": "ERROR", "content": "Analysis failed", "partial": False}
+
+    async def summarize(
+        self,
+        previous_summary: str,
+        utterances: List[str],
+        max_words: int,
+        room_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        이전 요약에 새 발언을 반영한 회의 요약을 반환합니다 (background 우선순위).
+        실패 시 None을 반환하며, 호출자는 이전 요약을 유지합니다.
+        """
+        prompt = MEETING_SUMMARY_PROMPT.format(
+            max_words=max_words,
+            summary=previous_summary or "(none)",
+            utterances="\n".join(utterances),
+        )
+        try:
+            response = await self._generate(prompt, room_id, "background")
+            return parse_summary(response.text)
+        except Exception as e:
+            logger.warning("gemini_summary_failed", error=str(e))
+            return None
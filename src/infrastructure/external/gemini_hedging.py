@@ -0,0 +1,120 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from core.config import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """
+    꼬리 지연(tail latency) 단축을 위한 요청 헤징.
+    호출이 최근 관측 지연의 percentile(예: p95)까지 끝나지 않으면 같은 요청을 한 번 더 보내고,
+    먼저 성공한 결과를 사용하며 나머지는 취소합니다.
+    헤지 수는 전체 요청의 budget 비율을 넘지 않으므로 비용 증가가 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        percentile: Optional[float] = None,
+        budget: Optional[float] = None,
+        min_samples: Optional[int] = None,
+        window: int = 500,
+        min_delay: float = 0.05,
+    ):
+        self.percentile = percentile or settings.gemini_hedge_percentile
+        self.budget = budget if budget is not None else settings.gemini_hedge_budget
+        self.min_samples = min_samples or settings.gemini_hedge_min_samples
+        self.min_delay = min_delay
+        # 요청별 지연: 원래 호출 시작 ~ 첫 성공 결과 (헤지 임계값 계산용)
+        self._latencies: Deque[float] = deque(maxlen=window)
+
+        # 메트릭
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def threshold(self) -> Optional[float]:
+        """헤지를 보낼 대기 시간. 표본이 부족하면 None (헤지하지 않음)."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(math.ceil(self.percentile * len(ordered)) - 1, len(ordered) - 1)
+        return max(ordered[max(index, 0)], self.min_delay)
+
+    def _budget_allows(self) -> bool:
+        return self.hedges + 1 <= self.budget * self.requests
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        hedge_call: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """
+        call()을 실행하고, 임계값을 넘기면 한 번 헤지합니다 (hedge_call이 있으면 그것으로).
+        먼저 성공한 결과를 반환합니다.
+        지연은 요청마다 원래 호출 시작부터 결과까지로 기록하므로, 헤지에 져서 취소된 느린 호출도
+        최소한 그때까지의 경과 시간으로 반영되어 임계값이 낮아지지 않습니다.
+        """
+        self.requests += 1
+        started = time.monotonic()
+        primary: "asyncio.Task[T]" = asyncio.ensure_future(call())
+        hedge: "Optional[asyncio.Task[T]]" = None
+
+        try:
+            delay = self.threshold()
+            if delay is None:
+                return self._observe(started, await primary)
+
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._budget_allows():
+                return self._observe(started, await primary)
+
+            self.hedges += 1
+            logger.info("gemini_request_hedged", threshold_ms=round(delay * 1000, 1))
+            hedge = asyncio.ensure_future((hedge_call or call)())
+
+            pending = {primary, hedge}
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return self._observe(started, task.result())
+                    error = error or task.exception()
+            # 두 요청 모두 실패
+            if error is None:
+                raise RuntimeError("hedged requests finished without a result")
+            raise error
+        finally:
+            for request in (primary, hedge):
+                if request is not None and not request.done():
+                    request.cancel()
+
+    def _observe(self, started: float, result: T) -> T:
+        self._latencies.append(time.monotonic() - started)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        threshold = self.threshold()
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_rate": round(self.hedges / self.requests, 4) if self.requests else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "threshold_ms": round(threshold * 1000, 1) if threshold is not None else None,
+        }
+
+
+gemini_hedger = RequestHedger()
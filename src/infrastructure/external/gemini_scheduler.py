@@ -0,0 +1,230 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Literal, Optional
+
+from core.config import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 우선순위가 높은 순서 (interactive: 실시간 인사이트, background: 요약 등 지연 허용 작업)
+Priority = Literal["interactive", "background"]
+PRIORITIES = ("interactive", "background")
+
+
+class GeminiRejectedError(Exception):
+    """대기 시간 상한을 넘겨 스케줄러가 요청을 거절함"""
+
+
+class _Ticket:
+    def __init__(self, room_id: str, priority: str, tokens: int, future: asyncio.Future):
+        self.room_id = room_id
+        self.priority = priority
+        self.tokens = tokens
+        self.future = future
+        self.enqueued_at = time.monotonic()
+        # 응답의 실제 사용 토큰 수 (알 수 있으면 예산을 보정)
+        self.actual_tokens: Optional[int] = None
+
+
+class GeminiScheduler:
+    """
+    프로세스 전역 Gemini 호출 스케줄러.
+    - 동시 호출 수 상한 + 분당 토큰 예산(token bucket)
+    - 우선순위 클래스: interactive 요청이 background 요청보다 먼저 배정됨
+    - 같은 우선순위 안에서는 방(room) 단위 라운드 로빈 (한 방의 폭주가 다른 방을 굶기지 않음)
+    - max_queue_wait 이상 대기한 요청은 호출하지 않고 거절 (GeminiRejectedError)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_queue_wait: Optional[float] = None,
+    ):
+        self.max_concurrency = max_concurrency or settings.gemini_max_concurrency
+        self.tokens_per_minute = tokens_per_minute or settings.gemini_tokens_per_minute
+        self.max_queue_wait = (
+            max_queue_wait
+            if max_queue_wait is not None
+            else settings.gemini_max_queue_wait_seconds
+        )
+
+        # 우선순위별 {room_id: 대기 티켓} (OrderedDict 순서 = 라운드 로빈 순서)
+        self._queues: Dict[str, "OrderedDict[str, Deque[_Ticket]]"] = {
+            p: OrderedDict() for p in PRIORITIES
+        }
+        self._active = 0
+        self._tokens = float(self.tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._retry_timer: Optional[asyncio.TimerHandle] = None
+
+        # 메트릭
+        self._started_at = time.monotonic()
+        self._busy_integral = 0.0
+        self._busy_since = self._started_at
+        self.admitted = 0
+        self.rejected = 0
+        self._wait: Dict[str, Dict[str, float]] = {
+            p: {"count": 0, "total": 0.0, "max": 0.0} for p in PRIORITIES
+        }
+
+    @asynccontextmanager
+    async def slot(
+        self, tokens: int, room_id: Optional[str] = None, priority: Priority = "interactive"
+    ) -> AsyncIterator[_Ticket]:
+        """호출 권한을 얻을 때까지 대기합니다. 블록을 벗어나면 슬롯을 반납합니다."""
+        ticket = await self._acquire(tokens, room_id or "", priority)
+        try:
+            yield ticket
+        finally:
+            self._release(ticket)
+
+    async def _acquire(self, tokens: int, room_id: str, priority: str) -> _Ticket:
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority: {priority}")
+
+        ticket = _Ticket(
+            room_id, priority, tokens, asyncio.get_running_loop().create_future()
+        )
+        self._queues[priority].setdefault(room_id, deque()).append(ticket)
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(ticket.future), self.max_queue_wait)
+        except asyncio.TimeoutError:
+            if not ticket.future.done():
+                self._remove(ticket)
+                self.rejected += 1
+                logger.warning(
+                    "gemini_request_rejected",
+                    room_id=room_id,
+                    priority=priority,
+                    waited_ms=round((time.monotonic() - ticket.enqueued_at) * 1000, 1),
+                )
+                raise GeminiRejectedError("Gemini queue wait exceeded")
+        except asyncio.CancelledError:
+            if ticket.future.done():
+                # 배정 직후 취소된 경우 슬롯 반납
+                self._release(ticket)
+            else:
+                self._remove(ticket)
+            raise
+
+        return ticket
+
+    def _remove(self, ticket: _Ticket) -> None:
+        rooms = self._queues[ticket.priority]
+        waiting = rooms.get(ticket.room_id)
+        if waiting is None:
+            return
+        try:
+            waiting.remove(ticket)
+        except ValueError:
+            return
+        if not waiting:
+            del rooms[ticket.room_id]
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        rate = self.tokens_per_minute / 60.0
+        self._tokens = min(
+            float(self.tokens_per_minute), self._tokens + (now - self._refilled_at) * rate
+        )
+        self._refilled_at = now
+
+    def _set_active(self, active: int) -> None:
+        now = time.monotonic()
+        self._busy_integral += self._active * (now - self._busy_since)
+        self._busy_since = now
+        self._active = active
+
+    def _dispatch(self) -> None:
+        """빈 슬롯과 토큰 예산이 허용하는 만큼 대기 티켓을 배정합니다."""
+        while self._active < self.max_concurrency:
+            rooms = next((q for q in self._queues.values() if q), None)
+            if rooms is None:
+                return
+
+            room_id, waiting = next(iter(rooms.items()))
+            ticket = waiting[0]
+
+            self._refill()
+            # 예산보다 큰 요청은 버킷이 가득 찼을 때 허용 (영원히 대기하지 않도록)
+            needed = min(ticket.tokens, self.tokens_per_minute)
+            if self._tokens < needed:
+                self._schedule_retry(needed - self._tokens)
+                return
+
+            waiting.popleft()
+            if waiting:
+                # 같은 방의 다음 요청은 다른 방 뒤로 (라운드 로빈)
+                rooms.move_to_end(room_id)
+            else:
+                del rooms[room_id]
+
+            self._tokens -= ticket.tokens
+            self._set_active(self._active + 1)
+            self.admitted += 1
+            self._record_wait(ticket)
+            ticket.future.set_result(None)
+
+    def _schedule_retry(self, deficit: float) -> None:
+        if self._retry_timer is not None:
+            return
+        delay = deficit / (self.tokens_per_minute / 60.0)
+
+        def retry() -> None:
+            self._retry_timer = None
+            self._dispatch()
+
+        self._retry_timer = asyncio.get_running_loop().call_later(delay, retry)
+
+    def _release(self, ticket: _Ticket) -> None:
+        if ticket.actual_tokens is not None:
+            # 추정치와 실제 사용량의 차이만큼 예산 보정
+            self._refill()
+            self._tokens += ticket.tokens - ticket.actual_tokens
+        self._set_active(max(self._active - 1, 0))
+        self._dispatch()
+
+    def _record_wait(self, ticket: _Ticket) -> None:
+        waited = time.monotonic() - ticket.enqueued_at
+        bucket = self._wait[ticket.priority]
+        bucket["count"] += 1
+        bucket["total"] += waited
+        bucket["max"] = max(bucket["max"], waited)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        busy = self._busy_integral + self._active * (now - self._busy_since)
+        elapsed = max(now - self._started_at, 1e-9)
+        self._refill()
+        return {
+            "active": self._active,
+            "max_concurrency": self.max_concurrency,
+            # 시작 이후 평균 슬롯 사용률 (0~1)
+            "utilization": round(busy / (elapsed * self.max_concurrency), 3),
+            "tokens_available": int(self._tokens),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "queued": {
+                p: sum(len(w) for w in rooms.values())
+                for p, rooms in self._queues.items()
+            },
+            "wait": {
+                p: {
+                    "avg_ms": round(b["total"] / b["count"] * 1000, 1)
+                    if b["count"]
+                    else 0.0,
+                    "max_ms": round(b["max"] * 1000, 1),
+                }
+                for p, b in self._wait.items()
+            },
+        }
+
+
+gemini_scheduler = GeminiScheduler()
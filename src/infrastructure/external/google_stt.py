@@ -1,25 +1,162 @@
 import asyncio
-from typing import AsyncGenerator, Dict, Any, Optional
+from datetime import timedelta
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, Any, List, Optional, Tuple
 from google.cloud import speech
 from google.api_core import exceptions as google_exceptions # Google API 관련 예외
 import grpc.aio # grpc.aio.AioRpcError를 사용하기 위함 (TransportError 대체)
 
 from core.config import get_settings
 from core.logging import get_logger
+from domain.services.audio_ring_buffer import AudioRingBuffer
+from infrastructure.external.stt_channel_pool import PooledChannel, SttChannelPool
+
+if TYPE_CHECKING:
+    from infrastructure.external.stt_stream_pool import SttStreamPool
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# StreamingRecognizeRequest 하나에 담을 최대 바이트 (API 제한 25KB 이하)
+_MAX_REQUEST_BYTES = 16000
+
+
+class _AudioFeed:
+    """
+    입력 오디오를 링 버퍼에 기록하고, 여러 인식 세션이 각자의 오프셋(cursor)으로
+    읽어갈 수 있게 하는 공유 피드입니다. (재연결 재전송 / 스트림 교대 시 중첩 전송)
+    세션이 아직 읽지 않은 오디오가 max_unread 이상이면 append가 대기하므로,
+    STT가 밀리면 입력 측 AudioQueue가 차고 그 overflow 정책/드롭 메트릭이 적용됩니다.
+    """
+
+    def __init__(self, ring: AudioRingBuffer, max_unread: Optional[int] = None):
+        self.ring = ring
+        self.max_unread = min(max_unread or ring.capacity, ring.capacity)
+        self.ended = False
+        # 세션이 읽어간 가장 먼 위치 (재전송 읽기는 이 값을 되돌리지 않음)
+        self.read_offset = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def unread(self) -> int:
+        return self.ring.end_offset - self.read_offset
+
+    async def append(self, chunk: bytes) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.unread < self.max_unread)
+            self.ring.append(chunk)
+            self._cond.notify_all()
+
+    async def finish(self) -> None:
+        async with self._cond:
+            self.ended = True
+            self._cond.notify_all()
+
+    async def read(self, cursor: int) -> Tuple[Optional[bytes], int]:
+        """cursor 이후의 오디오를 반환합니다. 입력이 끝나고 모두 읽었으면 None."""
+        async with self._cond:
+            await self._cond.wait_for(
+                lambda: self.ring.end_offset > cursor or self.ended
+            )
+            if self.ring.end_offset <= cursor:
+                return None, cursor
+
+            if cursor < self.ring.start_offset:
+                logger.warning(
+                    "stt_replay_truncated",
+                    lost_bytes=self.ring.start_offset - cursor,
+                )
+                cursor = self.ring.start_offset
+
+            data = self.ring.read_from(cursor, _MAX_REQUEST_BYTES)
+            cursor += len(data)
+            if cursor > self.read_offset:
+                self.read_offset = cursor
+                # 대기 중인 append(입력 펌프)를 깨움
+                self._cond.notify_all()
+            return data, cursor
+
+
+class RecognizeSession:
+    """
+    streaming_recognize 호출 하나의 상태 (오디오 시작 오프셋, 응답 소비 태스크).
+    GoogleSTTClient.open_session()으로 생성하며, 스트림 교대와 warm pool(SttStreamPool)이
+    같은 인터페이스를 사용합니다. 피드/이벤트 큐 없이 열어 둔 세션(pre-warm)은
+    나중에 attach()로 transcribe에 연결되고, activate()로 오디오 전송을 시작합니다.
+    """
+
+    def __init__(
+        self,
+        session_id: int,
+        opened_at: float,
+        feed: Optional[_AudioFeed] = None,
+        events: Optional[asyncio.Queue] = None,
+    ):
+        self.id = session_id
+        self.opened_at = opened_at
+        self.feed = feed
+        self.events = events
+        # 이 세션에 전송한 오디오의 시작 위치 (result_end_time 기준점)
+        self.base_offset = 0
+        self.cursor = 0
+        # standby 세션은 인계(activate) 전까지 오디오를 보내지 않음
+        self.activated = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self._pending: List[Tuple["RecognizeSession", str, Any]] = []
+
+    @property
+    def alive(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def attach(self, feed: _AudioFeed, events: asyncio.Queue) -> None:
+        self.feed = feed
+        self.events = events
+        for item in self._pending:
+            events.put_nowait(item)
+        self._pending.clear()
+
+    async def emit(self, kind: str, payload: Any) -> None:
+        item = (self, kind, payload)
+        if self.events is None:
+            self._pending.append(item)
+        else:
+            await self.events.put(item)
+
+    def activate(self, offset: int) -> None:
+        self.base_offset = offset
+        self.cursor = offset
+        self.activated.set()
+
+    def close(self) -> None:
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+
 
 class GoogleSTTClient:
     """
     Google Cloud Speech-to-Text 비동기 스트리밍 클라이언트
     """
 
-    def __init__(self, client: Optional[speech.SpeechAsyncClient] = None):
-        self.client = client or speech.SpeechAsyncClient()
+    def __init__(
+        self,
+        client: Optional[speech.SpeechAsyncClient] = None,
+        pool: Optional[SttChannelPool] = None,
+        warm_pool: Optional["SttStreamPool"] = None,
+    ):
+        # 풀이 주어지면 스트림마다 공유 채널을 배정받고, 연결별 클라이언트는 만들지 않음
+        if client is None and pool is None:
+            client = speech.SpeechAsyncClient()
+        self.client = client
+        self._pool = pool if client is None else None
+        # 미리 열어 둔 인식 스트림 풀 (입장 직후 첫 발화 지연 단축)
+        self._warm_pool = warm_pool
         self._language_code = "ko-KR"
         self._sample_rate = 16000
+        self._retry_backoff = 0.5
+        # 스트림 길이 제한(약 5분) 전에 다음 스트림으로 교대
+        self._rotate_after = settings.stt_stream_rotate_seconds
+        self._handover_timeout = settings.stt_stream_handover_timeout_seconds
+        # 세션이 읽지 않은 오디오 상한 (넘으면 AudioQueue 쪽에서 대기/드롭)
+        self._max_unread = settings.stt_feed_max_unread_bytes
 
     def _create_streaming_config(self) -> speech.StreamingRecognitionConfig:
         config = speech.RecognitionConfig(
@@ -35,11 +172,77 @@ class GoogleSTTClient:
     async def _request_generator(
         self,
         streaming_config: speech.StreamingRecognitionConfig,
-        audio_stream: AsyncGenerator[bytes, None],
+        session: RecognizeSession,
     ) -> AsyncGenerator[speech.StreamingRecognizeRequest, None]:
         yield speech.StreamingRecognizeRequest(streaming_config=streaming_config)
-        async for chunk in audio_stream:
-            yield speech.StreamingRecognizeRequest(audio_content=chunk)
+        await session.activated.wait()
+        feed = session.feed
+        if feed is None:
+            return
+
+        # 세션 시작 오프셋부터 읽으므로 재연결 시 미확정 구간이 자동으로 재전송됨
+        while True:
+            data, session.cursor = await feed.read(session.cursor)
+            if data is None:
+                return
+            yield speech.StreamingRecognizeRequest(audio_content=data)
+
+    def _final_offset(
+        self, result: Any, session: RecognizeSession, ring: AudioRingBuffer
+    ) -> int:
+        """final 결과의 result_end_time을 누적 바이트 오프셋으로 환산합니다."""
+        end_time = getattr(result, "result_end_time", None)
+        if not isinstance(end_time, timedelta):
+            # 시간 정보가 없으면 지금까지 전송한 오디오 전체를 확정으로 간주
+            return session.cursor
+
+        end_bytes = int(end_time.total_seconds() * self._sample_rate) * 2
+        return min(session.base_offset + end_bytes, ring.end_offset)
+
+    def open_session(
+        self,
+        session_id: int,
+        feed: Optional[_AudioFeed] = None,
+        events: Optional[asyncio.Queue] = None,
+        offset: Optional[int] = None,
+    ) -> RecognizeSession:
+        """
+        인식 세션을 열고 응답 소비 태스크를 시작합니다 (설정 요청은 즉시 전송).
+        offset이 없으면 activate()될 때까지 오디오를 보내지 않는 standby 세션입니다.
+        feed/events 없이 연 세션은 transcribe가 인계받을 때 attach()로 연결됩니다.
+        """
+        session = RecognizeSession(
+            session_id, asyncio.get_running_loop().time(), feed, events
+        )
+        if offset is not None:
+            session.activate(offset)
+
+        async def consume() -> None:
+            requests = self._request_generator(self._create_streaming_config(), session)
+            channel: Optional[PooledChannel] = None
+            failed = False
+            try:
+                if self._pool is not None:
+                    channel = await self._pool.acquire()
+                client = channel.client if channel else self.client
+                if client is None:
+                    # __init__에서 client 또는 pool 중 하나는 항상 설정됨
+                    raise RuntimeError("GoogleSTTClient has no client or channel pool")
+                responses = await client.streaming_recognize(requests=requests)
+                async for response in responses:
+                    await session.emit("response", response)
+                await session.emit("end", None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failed = True
+                await session.emit("error", e)
+            finally:
+                if channel is not None and self._pool is not None:
+                    self._pool.release(channel, failed=failed)
+
+        session.task = asyncio.create_task(consume())
+        return session
 
     async def transcribe(
         self, audio_stream: AsyncGenerator[bytes, None]
@@ -47,70 +250,182 @@ class GoogleSTTClient:
         """
         오디오 스트림을 입력받아 실시간으로 텍스트 인식 결과를 반환합니다.
         [DNA Fix] T004: 네트워크 오류 시 자동 재연결(Retry) 로직 포함.
+        재연결 시 링 버퍼에서 마지막 final 이후의 오디오를 재전송하여 발화 손실을 막습니다.
+        스트림 길이 제한 전에 다음 스트림을 미리 열고, final(발화 경계)에서 인계하여
+        호출자에게는 끊김/중복 없는 하나의 결과 스트림으로 보이게 합니다.
         """
         retry_count = 0
         max_retries = 3
+        loop = asyncio.get_running_loop()
 
-        # 스트림 재연결 루프
-        while True:
-            streaming_config = self._create_streaming_config()
-            # 주의: audio_stream 제너레이터는 한 번 소비되면 재사용이 불가능하므로,
-            # 실제 프로덕션에서는 버퍼링된 스트림을 사용하거나
-            # 큐에서 다시 가져오는 구조가 필요할 수 있음.
-            # 여기서는 연결 끊김 시점 이후의 데이터부터 다시 보낸다고 가정(AudioService Queue 지속)
-            requests = self._request_generator(streaming_config, audio_stream)
+        feed = _AudioFeed(
+            AudioRingBuffer(
+                int(settings.stt_replay_buffer_seconds * self._sample_rate) * 2
+            ),
+            self._max_unread,
+        )
+        events: asyncio.Queue = asyncio.Queue()
+        # 서버가 final로 확정한 마지막 오디오 위치 (누적 바이트 오프셋)
+        acked_offset = 0
+        session_ids = 0
 
+        async def pump() -> None:
+            # 세션이 읽는 속도만큼만 AudioQueue에서 꺼냄 (backpressure는 큐가 담당)
             try:
-                responses = await self.client.streaming_recognize(requests=requests)
+                async for chunk in audio_stream:
+                    await feed.append(chunk)
+            finally:
+                await feed.finish()
 
-                async for response in responses:
-                    # 정상 응답 수신 시 재시도 카운트 초기화
-                    retry_count = 0
-
-                    if not response.results:
-                        continue
-
-                    result = response.results[0]
-                    if not result.alternatives:
-                        continue
-
-                    transcript = result.alternatives[0].transcript
-                    is_final = result.is_final
-
-                    if is_final:
-                        logger.info(
-                            "stt_transcript_final",
-                            transcript=transcript,
-                            confidence=result.alternatives[0].confidence,
-                        )
-
-                    yield {
-                        "text": transcript,
-                        "is_final": is_final,
-                        "type": "final" if is_final else "interim",
-                    }
-
-                # 정상적인 스트림 종료 (Loop break)
-                break
-
-            except (
-                google_exceptions.ServiceUnavailable,
-                # TransportError 대신 gRPC의 AioRpcError를 사용하여 포괄적인 네트워크 오류 처리
-                grpc.aio.AioRpcError,
-            ) as e:
-                # [DNA Fix] 일시적인 네트워크/서버 오류 시 재연결 시도
-                retry_count += 1
-                if retry_count > max_retries:
-                    logger.error("stt_max_retries_exceeded", error=str(e))
-                    raise e
+        pump_task = asyncio.create_task(pump())
+        joined_at = loop.time()
+        first_result_at: Optional[float] = None
 
-                logger.warning(
-                    "stt_connection_lost_retrying", retry=retry_count, error=str(e)
+        # 미리 열어 둔 스트림이 있으면 즉시 인계받아 설정 왕복 시간을 생략
+        warm = self._warm_pool.claim() if self._warm_pool is not None else None
+        if warm is not None:
+            active = warm
+            active.attach(feed, events)
+            active.activate(0)
+        else:
+            active = self.open_session(session_ids, feed, events, offset=0)
+        standby: Optional[RecognizeSession] = None
+        rotating_since: Optional[float] = None
+
+        def handover() -> RecognizeSession:
+            """active 세션을 종료하고 standby(없으면 새 세션)를 acked_offset부터 시작"""
+            nonlocal session_ids, standby, rotating_since
+            active.close()
+            if standby is not None:
+                successor = standby
+                successor.activate(acked_offset)
+            else:
+                session_ids += 1
+                successor = self.open_session(
+                    session_ids, feed, events, offset=acked_offset
                 )
-                await asyncio.sleep(0.5 * retry_count)  # Backoff
-                continue
+            logger.info(
+                "stt_stream_rotated",
+                from_session=active.id,
+                to_session=successor.id,
+                offset=acked_offset,
+            )
+            standby = None
+            rotating_since = None
+            return successor
 
-            except Exception as e:
-                # 복구 불가능한 에러
-                logger.error("stt_fatal_error", error=str(e))
-                raise e
\ No newline at end of file
+        try:
+            while True:
+                now = loop.time()
+                if rotating_since is None:
+                    timeout = active.opened_at + self._rotate_after - now
+                else:
+                    timeout = rotating_since + self._handover_timeout - now
+
+                try:
+                    session, kind, payload = await asyncio.wait_for(
+                        events.get(), max(timeout, 0)
+                    )
+                except asyncio.TimeoutError:
+                    if rotating_since is None:
+                        # 교대 시점: 다음 스트림을 미리 열어 설정(config) 왕복을 끝내둠
+                        session_ids += 1
+                        standby = self.open_session(session_ids, feed, events)
+                        rotating_since = loop.time()
+                    else:
+                        # 발화 경계(final)가 오지 않으면 마지막 확정 지점에서 강제 인계
+                        active = handover()
+                    continue
+
+                if session is not active:
+                    if session is standby and kind != "response":
+                        # standby가 먼저 끊기면 인계 시 새 세션을 엶
+                        standby = None
+                    # 종료된 세션의 결과는 버림 (중복 final 방지)
+                    continue
+
+                if kind == "end":
+                    # 정상적인 스트림 종료 (Loop break)
+                    break
+
+                if kind == "error":
+                    e = payload
+                    if not isinstance(
+                        e,
+                        (
+                            google_exceptions.ServiceUnavailable,
+                            # TransportError 대신 gRPC의 AioRpcError를 사용하여 포괄적인 네트워크 오류 처리
+                            grpc.aio.AioRpcError,
+                        ),
+                    ):
+                        # 복구 불가능한 에러
+                        logger.error("stt_fatal_error", error=str(e))
+                        raise e
+
+                    # [DNA Fix] 일시적인 네트워크/서버 오류 시 재연결 시도
+                    retry_count += 1
+                    if retry_count > max_retries:
+                        logger.error("stt_max_retries_exceeded", error=str(e))
+                        raise e
+
+                    logger.warning(
+                        "stt_connection_lost_retrying", retry=retry_count, error=str(e)
+                    )
+                    await asyncio.sleep(self._retry_backoff * retry_count)  # Backoff
+                    if standby is not None:
+                        standby.close()
+                        standby = None
+                    rotating_since = None
+                    session_ids += 1
+                    active = self.open_session(
+                        session_ids, feed, events, offset=acked_offset
+                    )
+                    continue
+
+                # 정상 응답 수신 시 재시도 카운트 초기화
+                retry_count = 0
+                response = payload
+
+                if not response.results:
+                    continue
+
+                result = response.results[0]
+                if not result.alternatives:
+                    continue
+
+                transcript = result.alternatives[0].transcript
+                is_final = result.is_final
+
+                if is_final:
+                    acked_offset = self._final_offset(result, active, feed.ring)
+                    logger.info(
+                        "stt_transcript_final",
+                        transcript=transcript,
+                        confidence=result.alternatives[0].confidence,
+                    )
+
+                if first_result_at is None:
+                    first_result_at = loop.time()
+                    latency = first_result_at - joined_at
+                    logger.info(
+                        "stt_first_result",
+                        latency_ms=round(latency * 1000, 1),
+                        warm=warm is not None,
+                    )
+                    if self._warm_pool is not None:
+                        self._warm_pool.record_first_result(latency, warm is not None)
+
+                yield {
+                    "text": transcript,
+                    "is_final": is_final,
+                    "type": "final" if is_final else "interim",
+                }
+
+                if is_final and rotating_since is not None:
+                    # 발화 경계에서 다음 스트림으로 인계
+                    active = handover()
+        finally:
+            pump_task.cancel()
+            active.close()
+            if standby is not None:
+                standby.close()
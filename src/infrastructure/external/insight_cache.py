@@ -0,0 +1,145 @@
+import hashlib
+import re
+import sys
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from core.config import get_settings
+from core.prompts import SYSTEM_MODERATOR_PROMPT
+
+settings = get_settings()
+
+# 프롬프트가 바뀌면 이전 인사이트를 재사용하지 않도록 키에 포함
+PROMPT_VERSION = hashlib.sha256(SYSTEM_MODERATOR_PROMPT.encode("utf-8")).hexdigest()[:12]
+
+# 줄 앞의 화자 표시("speaker: ") 제거 (같은 발언은 화자와 무관하게 재사용)
+_SPEAKER_PREFIX = re.compile(r"^[^:\n]{1,64}:\s*", re.MULTILINE)
+_NON_WORD = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+
+# 캐시에 없음을 나타내는 표식 (None은 '인사이트 없음'을 캐시한 값)
+MISS = object()
+
+
+def normalize_transcript(text: str) -> str:
+    """유니코드 정규화(NFKC) + 소문자 + 화자 표시/문장부호 제거 + 공백 정리"""
+    text = unicodedata.normalize("NFKC", text)
+    text = _SPEAKER_PREFIX.sub("", text)
+    text = _NON_WORD.sub(" ", text.lower())
+    return _SPACES.sub(" ", text).strip()
+
+
+class InsightCache:
+    """
+    정규화한 발언 텍스트 기준 Gemini 인사이트 캐시 (LRU + TTL).
+    너무 짧은 입력("네", "음")은 Gemini를 호출하지 않도록 '인사이트 없음(None)'을 캐시합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        min_chars: Optional[int] = None,
+    ):
+        self.max_entries = max_entries or settings.insight_cache_max_entries
+        self.ttl = ttl or settings.insight_cache_ttl_seconds
+        self.min_chars = (
+            min_chars if min_chars is not None else settings.insight_cache_min_chars
+        )
+        # key -> (만료 시각, 인사이트 또는 None, 항목 크기)
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]], int]]" = (
+            OrderedDict()
+        )
+        self.memory_bytes = 0
+
+        # 메트릭
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(self, text: str) -> Tuple[str, bool]:
+        """(캐시 키, 너무 짧은 입력 여부)"""
+        normalized = normalize_transcript(text)
+        digest = hashlib.sha256(
+            f"{PROMPT_VERSION}\0{normalized}".encode("utf-8")
+        ).hexdigest()
+        return digest, len(normalized.replace(" ", "")) < self.min_chars
+
+    def get(self, text: str) -> Any:
+        """캐시된 인사이트(또는 None)를 반환합니다. 없으면 MISS."""
+        key, trivial = self.make_key(text)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            self._pop(key)
+            entry = None
+
+        if entry is None:
+            if trivial:
+                # 부정(negative) 캐시: 짧은 입력은 '인사이트 없음'으로 기록 후 바로 반환
+                self._store(key, None)
+                self.negative_hits += 1
+                return None
+            self.misses += 1
+            return MISS
+
+        self._entries.move_to_end(key)
+        if entry[1] is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        # 호출자가 결과를 수정해도 캐시 항목은 유지되도록 복사본 반환
+        return dict(entry[1]) if entry[1] is not None else None
+
+    def put(self, text: str, insight: Dict[str, Any]) -> None:
+        key, _ = self.make_key(text)
+        self._store(key, insight)
+
+    def _store(self, key: str, insight: Optional[Dict[str, Any]]) -> None:
+        if key in self._entries:
+            self._pop(key)
+
+        size = sys.getsizeof(key) + _deep_size(insight)
+        self._entries[key] = (time.monotonic() + self.ttl, insight, size)
+        self.memory_bytes += size
+
+        while len(self._entries) > self.max_entries:
+            self._pop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _pop(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self.memory_bytes -= size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.memory_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "memory_bytes": self.memory_bytes,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 3)
+            if lookups
+            else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+def _deep_size(value: Any) -> int:
+    """인사이트 dict의 대략적인 메모리 크기 (중첩 dict/list/str 포함)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(k) + _deep_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_deep_size(v) for v in value)
+    return size
+
+
+insight_cache = InsightCache()
@@ -0,0 +1,122 @@
+import json
+import re
+from typing import Any, Dict, Optional, TypeVar
+
+from pydantic import BeforeValidator, ConfigDict, Field, TypeAdapter, ValidationError
+from typing_extensions import Annotated, TypedDict
+
+from domain.models import InsightType
+
+# ```json ... ``` 코드 펜스 (앞뒤 설명문 포함 가능)
+_CODE_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)\s*```", re.DOTALL)
+# 닫는 괄호 앞의 trailing comma
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+class InsightParseError(ValueError):
+    """Gemini 응답을 인사이트로 해석할 수 없음 (reason: invalid_json | invalid_schema)"""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+def _normalize_type(v: Any) -> Any:
+    # "summary", " Warning " 같은 대소문자/공백 차이는 허용
+    return v.strip().upper() if isinstance(v, str) else v
+
+
+class InsightPayload(TypedDict):
+    """Gemini 인사이트 응답 스키마 (알 수 없는 필드는 버림)"""
+
+    __pydantic_config__ = ConfigDict(extra="ignore", str_strip_whitespace=True)  # type: ignore[misc]
+
+    type: Annotated[InsightType, BeforeValidator(_normalize_type)]
+    content: Annotated[str, Field(min_length=1)]
+
+
+class SummaryPayload(TypedDict):
+    """회의 맥락 요약 응답 스키마 (MEETING_SUMMARY_PROMPT)"""
+
+    __pydantic_config__ = ConfigDict(extra="ignore", str_strip_whitespace=True)  # type: ignore[misc]
+
+    summary: str
+
+
+# 모듈 로드 시 한 번만 검증기를 컴파일 (정상 JSON은 파싱 + 검증을 한 번에 수행)
+# 모델 인스턴스 대신 dict를 바로 만들어 변환 비용을 줄임
+_INSIGHT_ADAPTER = TypeAdapter(InsightPayload)
+_SUMMARY_ADAPTER = TypeAdapter(SummaryPayload)
+
+P = TypeVar("P")
+
+
+# 첫 JSON 값만 해석하고 뒤따르는 설명문은 무시 (C 구현 디코더 사용)
+_DECODER = json.JSONDecoder()
+
+
+def _decode_object(text: str) -> Optional[Any]:
+    """
+    자주 나오는 JSON 유사 출력(코드 펜스, 앞뒤 설명문, trailing comma)에서
+    첫 번째 JSON 객체를 해석합니다. 복구할 수 없으면 None.
+    """
+    fenced = _CODE_FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start = text.find("{")
+    if start < 0:
+        return None
+    candidate = text[start:]
+    try:
+        return _DECODER.raw_decode(candidate)[0]
+    except ValueError:
+        pass
+    repaired, fixes = _TRAILING_COMMA.subn(r"\1", candidate)
+    if not fixes:
+        return None
+    try:
+        return _DECODER.raw_decode(repaired)[0]
+    except ValueError:
+        return None
+
+
+def _to_dict(insight: InsightPayload) -> Dict[str, Any]:
+    return {"type": insight["type"].value, "content": insight["content"]}
+
+
+def _is_json_error(error: ValidationError) -> bool:
+    return any(e["type"] == "json_invalid" for e in error.errors())
+
+
+def _parse_with_repair(text: str, adapter: "TypeAdapter[P]") -> P:
+    # 정상 JSON은 파싱 + 검증을 한 번에 처리. '{'로 시작하지 않는 응답(코드 펜스,
+    # 설명문, 일반 텍스트)은 실패가 확실하므로 예외 생성 비용 없이 바로 복구 단계로
+    if text.lstrip()[:1] == "{":
+        try:
+            return adapter.validate_json(text)
+        except ValidationError as e:
+            if not _is_json_error(e):
+                # JSON은 올바르고 스키마만 위반: 복구해도 같은 객체이므로 바로 실패
+                raise InsightParseError("invalid_schema", str(e))
+
+    data = _decode_object(text)
+    if data is None:
+        raise InsightParseError("invalid_json", "JSON parsing failed")
+    try:
+        return adapter.validate_python(data)
+    except ValidationError as e:
+        raise InsightParseError("invalid_schema", str(e))
+
+
+def parse_insight(text: str) -> Dict[str, Any]:
+    """
+    Gemini 응답 텍스트를 {"type", "content"} 인사이트로 파싱/검증합니다.
+    바로 해석되지 않으면 로컬에서 한 번 복구를 시도합니다 (추가 모델 호출 없음).
+    실패 시 InsightParseError를 발생시킵니다.
+    """
+    return _to_dict(_parse_with_repair(text, _INSIGHT_ADAPTER))
+
+
+def parse_summary(text: str) -> str:
+    """요약 응답({"summary": ...})을 인사이트와 같은 복구 경로로 해석합니다."""
+    return _parse_with_repair(text, _SUMMARY_ADAPTER)["summary"]
@@ -0,0 +1,172 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.models import InsightType
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_WHITESPACE = " \t\r\n"
+# 짝을 잃은 UTF-16 surrogate 대신 넣는 문자 (그대로 두면 UTF-8 직렬화가 실패함)
+_REPLACEMENT = "\ufffd"
+
+
+def _hex4(buf: str, i: int) -> Optional[int]:
+    try:
+        return int(buf[i : i + 4], 16)
+    except ValueError:
+        return None
+
+
+def _read_string(buf: str, i: int) -> Tuple[str, int, bool]:
+    """
+    buf[i]의 '"'부터 JSON 문자열을 읽습니다.
+    반환: (지금까지 해석한 값, 다음 위치, 문자열이 닫혔는지)
+    """
+    out: List[str] = []
+    i += 1
+    n = len(buf)
+    while i < n:
+        ch = buf[i]
+        if ch == '"':
+            return "".join(out), i + 1, True
+        if ch == "\\":
+            if i + 1 >= n:
+                break  # 이스케이프가 잘린 경우 다음 청크를 기다림
+            esc = buf[i + 1]
+            if esc == "u":
+                if i + 6 > n:
+                    break
+                code = _hex4(buf, i + 2)
+                if code is None:
+                    out.append(buf[i : i + 6])
+                    i += 6
+                    continue
+                if 0xD800 <= code <= 0xDBFF:
+                    # surrogate pair(이모지 등): 뒤따르는 low surrogate와 합쳐 한 글자로
+                    if i + 6 < n and buf[i + 6] == "\\" and i + 12 > n:
+                        break  # low surrogate가 아직 도착하지 않음
+                    low = _hex4(buf, i + 8) if buf[i + 6 : i + 8] == "\\u" else None
+                    if low is not None and 0xDC00 <= low <= 0xDFFF:
+                        out.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                        i += 12
+                        continue
+                    if i + 6 >= n:
+                        break  # 짝이 올 수 있으므로 다음 청크를 기다림
+                    out.append(_REPLACEMENT)
+                elif 0xDC00 <= code <= 0xDFFF:
+                    out.append(_REPLACEMENT)
+                else:
+                    out.append(chr(code))
+                i += 6
+            else:
+                out.append(_ESCAPES.get(esc, esc))
+                i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out), i, False
+
+
+def _skip_value(buf: str, i: int) -> Optional[int]:
+    """문자열이 아닌 값(숫자/객체/배열 등)을 건너뜁니다. 값이 아직 끝나지 않았으면 None."""
+    depth = 0
+    n = len(buf)
+    while i < n:
+        ch = buf[i]
+        if ch == '"':
+            _, i, done = _read_string(buf, i)
+            if not done:
+                return None
+            continue
+        if ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            if depth == 0:
+                return i
+            depth -= 1
+        elif ch == "," and depth == 0:
+            return i
+        i += 1
+    return None
+
+
+def scan_partial_object(buf: str) -> Dict[str, Tuple[Any, bool]]:
+    """
+    아직 끝나지 않은 JSON 객체 텍스트에서 최상위 문자열 필드를 추출합니다.
+    반환: {key: (값 또는 값의 앞부분, 완성 여부)} — 문자열이 아닌 값은 포함하지 않음
+    """
+    fields: Dict[str, Tuple[Any, bool]] = {}
+    i = buf.find("{")
+    if i < 0:
+        return fields
+    i += 1
+    n = len(buf)
+
+    while True:
+        while i < n and (buf[i] in _WHITESPACE or buf[i] == ","):
+            i += 1
+        if i >= n or buf[i] != '"':
+            return fields
+
+        key, i, done = _read_string(buf, i)
+        if not done:
+            return fields
+        while i < n and buf[i] in _WHITESPACE:
+            i += 1
+        if i >= n or buf[i] != ":":
+            return fields
+        i += 1
+        while i < n and buf[i] in _WHITESPACE:
+            i += 1
+        if i >= n:
+            return fields
+
+        if buf[i] == '"':
+            value, i, done = _read_string(buf, i)
+            fields[key] = (value, done)
+            if not done:
+                return fields
+        else:
+            end = _skip_value(buf, i)
+            if end is None:
+                return fields
+            i = end
+
+
+class PartialInsightParser:
+    """
+    스트리밍 응답 조각을 누적하며 인사이트 JSON의 type과 content 앞부분을 추출합니다.
+    type이 완성되고 content가 늘어났을 때만 새 스냅샷을 반환합니다.
+    type은 최종 스키마와 같이 대문자로 정규화하며, 허용되지 않는 값이면 스냅샷을 내지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[str] = []
+        self._emitted_content: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        self._chunks.append(chunk)
+        fields = scan_partial_object(self.text)
+
+        insight_type, type_done = fields.get("type", (None, False))
+        content, _ = fields.get("content", ("", False))
+        if not type_done or not content or content == self._emitted_content:
+            return None
+        try:
+            insight_type = InsightType(insight_type.strip().upper()).value
+        except ValueError:
+            return None
+
+        self._emitted_content = content
+        return {"type": insight_type, "content": content}
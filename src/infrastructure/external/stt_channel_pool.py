@@ -0,0 +1,234 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import google.auth
+import grpc
+from google.cloud import speech
+
+from core.config import get_settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 연속 실패 횟수가 이 값 이상이면 헬스체크 통과 전까지 선택 대상에서 제외
+_MAX_CONSECUTIVE_FAILURES = 3
+
+
+class PooledChannel:
+    """풀에 속한 SpeechAsyncClient(= gRPC 채널 하나)와 부하/상태 정보"""
+
+    def __init__(self, index: int, client: Any):
+        self.index = index
+        self.client = client
+        self.active_streams = 0
+        self.total_streams = 0
+        self.consecutive_failures = 0
+        self.healthy = True
+
+
+class SttChannelPool:
+    """
+    프로세스 전역 Google STT gRPC 채널 풀.
+    연결마다 SpeechAsyncClient를 만들면 인증 로드/채널 생성/TLS 핸드셰이크가 반복되므로,
+    시작 시 N개의 채널을 만들어 두고 스트림을 가장 한가한 채널에 배정합니다.
+    인증 로드(블로킹 I/O)는 항상 스레드에서 수행하고, 채널은 로드된 인증으로 이벤트 루프에서 만듭니다
+    (grpc.aio 채널은 실행 중인 루프가 있는 스레드에서만 만들 수 있음).
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        client_factory: Optional[Callable[[], Any]] = None,
+        health_interval: Optional[float] = None,
+    ):
+        self.size = size or settings.stt_channel_pool_size
+        self._client_factory = client_factory or self._default_client
+        self._load_credentials = client_factory is None
+        self._credentials: Any = None
+        self._health_interval = (
+            health_interval or settings.stt_channel_health_interval_seconds
+        )
+        self._channels: List[PooledChannel] = []
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._refill_task: Optional[asyncio.Task] = None
+        self._refill_lock = asyncio.Lock()
+        self._health_task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _default_client(self) -> speech.SpeechAsyncClient:
+        # 인증 정보를 한 번만 로드하여 모든 채널이 공유
+        return speech.SpeechAsyncClient(credentials=self._credentials)
+
+    async def start(self) -> None:
+        """
+        채널 생성(warm-up)과 헬스체크 태스크를 시작합니다 (애플리케이션 startup).
+        인증 로드는 블로킹 I/O이므로 스레드에서 수행하며, startup을 지연시키지 않습니다.
+        """
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self._warm_up())
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _warm_up(self) -> None:
+        try:
+            await self._refill()
+            logger.info("stt_channel_pool_started", size=len(self._channels))
+        except Exception as e:
+            # 인증 정보가 없는 개발 환경 등: 첫 스트림 요청 시 다시 생성을 시도함
+            logger.warning("stt_channel_pool_init_failed", error=str(e))
+
+    async def _ensure_credentials(self) -> None:
+        if not self._load_credentials or self._credentials is not None:
+            return
+        if self._executor is None:
+            # 전용 스레드 사용: shutdown 시 인증 조회(메타데이터 서버 대기 등)를 기다리지 않음
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._credentials, _ = await asyncio.get_running_loop().run_in_executor(
+            self._executor, google.auth.default
+        )
+
+    async def _refill(self) -> None:
+        """부족한 채널을 채웁니다 (인증 로드는 스레드에서, 동시에 하나만 실행)."""
+        async with self._refill_lock:
+            if len(self._channels) >= self.size:
+                return
+            await self._ensure_credentials()
+            self._ensure_channels()
+
+    def _schedule_refill(self) -> None:
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+
+        async def refill() -> None:
+            try:
+                await self._refill()
+            except Exception as e:
+                logger.warning("stt_channel_refill_failed", error=str(e))
+
+        self._refill_task = asyncio.create_task(refill())
+
+    async def close(self) -> None:
+        """warm-up/헬스체크를 중지하고 모든 채널을 닫습니다 (애플리케이션 shutdown)."""
+        for task in (self._warmup_task, self._health_task, self._refill_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._warmup_task = None
+        self._health_task = None
+        self._refill_task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        channels, self._channels = self._channels, []
+        for channel in channels:
+            await self._close_client(channel.client)
+        logger.info("stt_channel_pool_closed", size=len(channels))
+
+    def _ensure_channels(self) -> None:
+        while len(self._channels) < self.size:
+            index = len(self._channels)
+            self._channels.append(PooledChannel(index, self._client_factory()))
+
+    async def acquire(self) -> PooledChannel:
+        """
+        정상 채널 중 활성 스트림이 가장 적은 채널을 배정합니다.
+        만들어 둔 채널이 하나라도 있으면 기다리지 않고 배정하며, 부족한 채널은 백그라운드에서 채웁니다.
+        """
+        if not self._channels:
+            await self._refill()
+        elif len(self._channels) < self.size:
+            self._schedule_refill()
+        candidates = [c for c in self._channels if c.healthy] or self._channels
+        channel = min(candidates, key=lambda c: c.active_streams)
+        channel.active_streams += 1
+        channel.total_streams += 1
+        return channel
+
+    def release(self, channel: PooledChannel, failed: bool = False) -> None:
+        channel.active_streams = max(channel.active_streams - 1, 0)
+        if failed:
+            channel.consecutive_failures += 1
+            if (
+                channel.healthy
+                and channel.consecutive_failures >= _MAX_CONSECUTIVE_FAILURES
+            ):
+                channel.healthy = False
+                logger.warning("stt_channel_unhealthy", channel=channel.index)
+        else:
+            channel.consecutive_failures = 0
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            await self.check_health()
+
+    async def check_health(self) -> None:
+        """채널 연결 상태를 점검하고, 종료된 채널은 새 채널로 교체합니다."""
+        for channel in list(self._channels):
+            state = self._channel_state(channel.client)
+
+            if state == grpc.ChannelConnectivity.SHUTDOWN or (
+                not channel.healthy and channel.active_streams == 0
+            ):
+                # 사용 중인 스트림이 없을 때만 교체 (진행 중 스트림 보호)
+                await self._replace(channel)
+            elif state == grpc.ChannelConnectivity.TRANSIENT_FAILURE:
+                channel.healthy = False
+            elif state is not None:
+                channel.healthy = True
+                channel.consecutive_failures = 0
+
+    async def _replace(self, channel: PooledChannel) -> None:
+        try:
+            await self._ensure_credentials()
+            client = self._client_factory()
+        except Exception as e:
+            logger.warning(
+                "stt_channel_replace_failed", channel=channel.index, error=str(e)
+            )
+            return
+
+        old_client = channel.client
+        channel.client = client
+        channel.healthy = True
+        channel.consecutive_failures = 0
+        logger.info("stt_channel_replaced", channel=channel.index)
+        await self._close_client(old_client)
+
+    @staticmethod
+    def _channel_state(client: Any) -> Optional[grpc.ChannelConnectivity]:
+        """gRPC 채널 연결 상태 (확인할 수 없으면 None)"""
+        try:
+            return client.transport.grpc_channel.get_state(try_to_connect=False)
+        except Exception:
+            return None
+
+    @staticmethod
+    async def _close_client(client: Any) -> None:
+        try:
+            result = client.transport.close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning("stt_channel_close_failed", error=str(e))
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "channel": c.index,
+                "active_streams": c.active_streams,
+                "total_streams": c.total_streams,
+                "healthy": c.healthy,
+            }
+            for c in self._channels
+        ]
+
+
+stt_channel_pool = SttChannelPool()
@@ -0,0 +1,155 @@
+import asyncio
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from core.config import get_settings
+from core.logging import get_logger
+from infrastructure.external.google_stt import GoogleSTTClient, RecognizeSession
+from infrastructure.external.stt_channel_pool import stt_channel_pool
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class SttStreamPool:
+    """
+    streaming_config 전송까지 끝낸 인식 스트림을 미리 열어 두는 풀.
+    입장 시 즉시 인계하여 첫 요청의 설정 왕복 시간만큼 첫 발화 인식이 늦어지는 것을 막습니다.
+    - 크기: 최근 입장률(window 동안의 claim 수)로 다음 horizon 동안의 입장 수를 추정
+    - 재활용: 오디오 없이 오래 열린 스트림은 서버가 끊기 전에 닫고 새로 엶
+    """
+
+    def __init__(
+        self,
+        stt_client_factory: Callable[[], GoogleSTTClient],
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        rate_window: Optional[float] = None,
+        horizon: Optional[float] = None,
+        interval: float = 1.0,
+    ):
+        self._stt_client_factory = stt_client_factory
+        self._stt_client: Optional[GoogleSTTClient] = None
+        self.min_size = min_size if min_size is not None else settings.stt_warm_pool_min
+        self.max_size = max_size if max_size is not None else settings.stt_warm_pool_max
+        self.idle_ttl = idle_ttl or settings.stt_warm_pool_idle_ttl_seconds
+        self.rate_window = rate_window or settings.stt_warm_pool_rate_window_seconds
+        self.horizon = horizon or settings.stt_warm_pool_horizon_seconds
+        self.interval = interval
+
+        self._idle: Deque[RecognizeSession] = deque()
+        self._joins: Deque[float] = deque()
+        self._session_ids = 0
+        self._task: Optional[asyncio.Task] = None
+
+        # 메트릭
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+        self._first_result: Dict[str, Dict[str, float]] = {
+            "warm": {"count": 0, "total": 0.0, "max": 0.0},
+            "cold": {"count": 0, "total": 0.0, "max": 0.0},
+        }
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._maintain_loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while self._idle:
+            self._idle.popleft().close()
+
+    def claim(self) -> Optional[RecognizeSession]:
+        """살아있는 스트림을 하나 꺼냅니다. 없으면 None (호출자가 새로 엶)."""
+        now = asyncio.get_running_loop().time()
+        self._joins.append(now)
+
+        while self._idle:
+            # 가장 최근에 연 스트림(남은 수명이 가장 긴 스트림)부터 사용
+            session = self._idle.pop()
+            if session.alive and now - session.opened_at < self.idle_ttl:
+                self.hits += 1
+                return session
+            session.close()
+
+        self.misses += 1
+        return None
+
+    def target_size(self) -> int:
+        now = asyncio.get_running_loop().time()
+        while self._joins and now - self._joins[0] > self.rate_window:
+            self._joins.popleft()
+
+        expected = math.ceil(len(self._joins) * self.horizon / self.rate_window)
+        return max(self.min_size, min(self.max_size, expected))
+
+    def maintain(self) -> None:
+        """만료/종료된 스트림을 정리하고 목표 크기까지 새 스트림을 엽니다."""
+        now = asyncio.get_running_loop().time()
+        for session in list(self._idle):
+            if not session.alive or now - session.opened_at >= self.idle_ttl:
+                self._idle.remove(session)
+                session.close()
+                self.recycled += 1
+
+        target = self.target_size()
+        while len(self._idle) > target:
+            self._idle.popleft().close()
+
+        if len(self._idle) < target and self._stt_client is None:
+            self._stt_client = self._stt_client_factory()
+
+        while len(self._idle) < target and self._stt_client is not None:
+            self._session_ids += 1
+            # 피드 없이 열면 config만 전송하고 인계(attach/activate)를 기다림
+            self._idle.append(self._stt_client.open_session(self._session_ids))
+
+    async def _maintain_loop(self) -> None:
+        while True:
+            try:
+                self.maintain()
+            except Exception as e:
+                logger.warning("stt_warm_pool_maintain_failed", error=str(e))
+            await asyncio.sleep(self.interval)
+
+    def record_first_result(self, latency: float, warm: bool) -> None:
+        """입장 ~ 첫 인식 결과(interim) 지연을 기록합니다."""
+        bucket = self._first_result["warm" if warm else "cold"]
+        bucket["count"] += 1
+        bucket["total"] += latency
+        bucket["max"] = max(bucket["max"], latency)
+
+    def stats(self) -> Dict[str, Any]:
+        claims = self.hits + self.misses
+        latency = {
+            name: {
+                "count": int(bucket["count"]),
+                "avg_ms": round(bucket["total"] / bucket["count"] * 1000, 1)
+                if bucket["count"]
+                else 0.0,
+                "max_ms": round(bucket["max"] * 1000, 1),
+            }
+            for name, bucket in self._first_result.items()
+        }
+        return {
+            "idle": len(self._idle),
+            "target": self.target_size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / claims, 3) if claims else 0.0,
+            "recycled": self.recycled,
+            "first_result_latency": latency,
+        }
+
+
+stt_stream_pool = SttStreamPool(lambda: GoogleSTTClient(pool=stt_channel_pool))
@@ -2,11 +2,18 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from api.routes.rooms import router as rooms_router
 from api.routes.websocket import router as websocket_router
+from core.config import get_settings
 from core.logging import configure_logging, get_logger
+from core.websocket.manager import manager
+from domain.services.insight_aggregator import insight_aggregator
+from domain.services.meeting_context import meeting_context
+from infrastructure.external.stt_channel_pool import stt_channel_pool
+from infrastructure.external.stt_stream_pool import stt_stream_pool
 
 # 로깅 설정 초기화
 configure_logging()
 logger = get_logger(__name__)
+settings = get_settings()
 
 app = FastAPI(
     title="AI Moderator Backend",
@@ -34,8 +41,18 @@ app.include_router(websocket_router) # WebSocket 라우터는 /ws/audio/{room_id
 @app.on_event("startup")
 async def startup_event():
     logger.info("Application startup event triggered.")
+    # 다른 worker/노드의 같은 방 메시지 수신 (broker 설정 시 브로커에 연결)
+    await manager.start()
+    await stt_channel_pool.start()
+    if settings.stt_warm_pool_enabled:
+        await stt_stream_pool.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Application shutdown event triggered.")
+    await manager.close()
+    await insight_aggregator.close()
+    await meeting_context.close()
+    await stt_stream_pool.close()
+    await stt_channel_pool.close()
 
@@ -96,3 +96,43 @@ async def test_room_creation_and_websocket_connection(client: AsyncClient, db_se
     assert str(user_id) in manager.active_connections[room_id]
     
     app.dependency_overrides = {}
+
+
+@pytest.mark.asyncio
+async def test_get_speaking_stats(client: AsyncClient):
+    """발언 통계 API: VAD 기반 실시간 집계를 사용자별로 반환"""
+    from domain.services.speaking_analytics import speaking_analytics
+
+    room_id = str(uuid.uuid4())
+    speaking_analytics.observe(room_id, "alice", True, 1.5)
+    speaking_analytics.observe(room_id, "bob", False, 4.5)
+    speaking_analytics.observe(room_id, "bob", True, 0.5)
+
+    response = await client.get(f"/api/v1/rooms/{room_id}/speaking-stats")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_talk_seconds"] == 2.0
+    users = {u["user_id"]: u for u in data["users"]}
+    assert users["alice"]["share"] == 0.75
+    assert users["bob"]["turns"] == 1
+    speaking_analytics.reset(room_id)
+
+
+@pytest.mark.asyncio
+async def test_get_audio_queue_stats(client: AsyncClient):
+    """오디오 큐 통계 API: 방 단위로 STT 전송 대기 큐를 집계"""
+    from domain.services.audio_service import audio_service
+
+    room_id = str(uuid.uuid4())
+    await audio_service.start_stream("queue_stats_user", room_id)
+    try:
+        response = await client.get(f"/api/v1/rooms/{room_id}/audio-queue-stats")
+    finally:
+        await audio_service.stop_stream("queue_stats_user")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["streams"] == 1
+    assert data["depth_bytes"] == 0
+    assert data["dropped_chunks"] == 0
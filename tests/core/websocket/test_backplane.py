@@ -0,0 +1,235 @@
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import WebSocket
+from core.websocket.backplane import (
+    BackplaneBroker,
+    BrokerBackplane,
+    InMemoryBackplane,
+    _encode,
+    _HEADER,
+)
+from core.websocket.manager import ConnectionManager
+
+SRC_DIR = Path(__file__).resolve().parents[3] / "src"
+
+# 다른 프로세스의 worker: 같은 방에 소켓 2개를 연결하고 브로커로 받은 프레임을 출력
+CHILD_SCRIPT = """
+import asyncio, json, sys
+from unittest.mock import AsyncMock
+from fastapi import WebSocket
+from core.websocket.backplane import BrokerBackplane
+from core.websocket.manager import ConnectionManager
+
+async def main():
+    backplane = BrokerBackplane(sys.argv[1])
+    manager = ConnectionManager(backplane=backplane)
+    await manager.start()
+    await backplane.wait_connected(timeout=5)
+    sockets = [AsyncMock(spec=WebSocket), AsyncMock(spec=WebSocket)]
+    for i, ws in enumerate(sockets):
+        await manager.connect(ws, "room_1", f"remote_{i}")
+    print("@ready", flush=True)
+    for _ in range(500):
+        if all(ws.send_text.await_count for ws in sockets):
+            break
+        await asyncio.sleep(0.01)
+    print("@" + json.dumps({
+        "frames": [[c.args[0] for c in ws.send_text.await_args_list] for ws in sockets],
+        "received": backplane.received,
+    }), flush=True)
+    await manager.close()
+
+asyncio.run(main())
+"""
+
+
+async def _read_marked_line(stream: asyncio.StreamReader) -> str:
+    """자식 프로세스 출력에서 로그가 아닌 '@' 표시 줄만 읽음"""
+    while True:
+        line = await stream.readline()
+        if not line:
+            raise EOFError("child process exited")
+        if line.startswith(b"@"):
+            return line[1:].decode("utf-8").strip()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backplane_delivers_to_other_managers():
+    hub = []
+    manager_a = ConnectionManager(backplane=InMemoryBackplane(hub))
+    manager_b = ConnectionManager(backplane=InMemoryBackplane(hub))
+    await manager_a.start()
+    await manager_b.start()
+
+    ws_a = AsyncMock(spec=WebSocket)
+    ws_b1 = AsyncMock(spec=WebSocket)
+    ws_b2 = AsyncMock(spec=WebSocket)
+    ws_other = AsyncMock(spec=WebSocket)
+    await manager_a.connect(ws_a, "room_1", "user_a")
+    await manager_b.connect(ws_b1, "room_1", "user_b1")
+    await manager_b.connect(ws_b2, "room_1", "user_b2")
+    await manager_b.connect(ws_other, "room_2", "user_c")
+
+    await manager_a.broadcast({"type": "test"}, "room_1")
+    await asyncio.sleep(0.01)
+
+    for ws in (ws_a, ws_b1, ws_b2):
+        ws.send_text.assert_awaited_once_with('{"type":"test"}')
+    ws_other.send_text.assert_not_called()
+
+    # 회의 종료는 다른 프로세스의 연결도 닫음
+    await manager_a.disconnect_room("room_1")
+    await asyncio.sleep(0.01)
+    assert "room_1" not in manager_b.active_connections
+    ws_b1.close.assert_awaited_once()
+
+    await manager_a.close()
+    await manager_b.close()
+
+
+@pytest.mark.asyncio
+async def test_broker_delivers_once_per_process(tmp_path):
+    broker = BackplaneBroker(f"unix://{tmp_path / 'backplane.sock'}")
+    await broker.start()
+    url = broker.url
+
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    env.setdefault("GEMINI_API_KEY", "test")
+    env.setdefault("JWT_SECRET_KEY", "test")
+    child = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", CHILD_SCRIPT, url,
+        stdout=asyncio.subprocess.PIPE,
+        env=env,
+    )
+
+    backplane = BrokerBackplane(url)
+    manager = ConnectionManager(backplane=backplane)
+    await manager.start()
+    try:
+        await backplane.wait_connected(timeout=5)
+        ws_local = AsyncMock(spec=WebSocket)
+        await manager.connect(ws_local, "room_1", "local")
+
+        line = await asyncio.wait_for(_read_marked_line(child.stdout), timeout=15)
+        assert line == "ready"
+
+        await manager.broadcast({"type": "test", "payload": "안녕"}, "room_1")
+        result = json.loads(
+            await asyncio.wait_for(_read_marked_line(child.stdout), timeout=10)
+        )
+        await asyncio.wait_for(child.wait(), timeout=10)
+    finally:
+        if child.returncode is None:
+            child.kill()
+        await manager.close()
+        await broker.close()
+
+    frame = '{"type":"test","payload":"안녕"}'
+    ws_local.send_text.assert_awaited_once_with(frame)
+    # 원격 프로세스의 소켓 2개 모두 받았지만 브로커에서는 한 번만 수신
+    assert result["frames"] == [[frame], [frame]]
+    assert result["received"] == 1
+    assert backplane.published == 1
+    assert broker.relayed == 1
+
+
+@pytest.mark.asyncio
+async def test_malformed_message_does_not_stop_subscriber(tmp_path):
+    url = f"unix://{tmp_path / 'backplane.sock'}"
+    broker = BackplaneBroker(url)
+    await broker.start()
+    received = []
+    backplane = BrokerBackplane(url)
+    await backplane.start(lambda *args: received.append(args))
+    _, publisher = await asyncio.open_unix_connection(str(tmp_path / "backplane.sock"))
+    try:
+        await backplane.wait_connected(timeout=5)
+        await asyncio.sleep(0.01)
+        for body in (b"not json", b'{"k":"broadcast"}', b"[1]"):
+            publisher.write(_HEADER.pack(len(body)) + body)
+        publisher.write(_encode({"k": "broadcast", "r": "room_1", "f": "{}", "l": False}))
+        await publisher.drain()
+        for _ in range(200):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        publisher.close()
+        await backplane.close()
+        await broker.close()
+
+    assert received == [("broadcast", "room_1", "{}", False)]
+    assert backplane.invalid == 3
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_stop_subscriber(tmp_path):
+    url = f"unix://{tmp_path / 'backplane.sock'}"
+    broker = BackplaneBroker(url)
+    await broker.start()
+    received = []
+
+    def handler(kind, room_id, frame, lossy):
+        if room_id == "closed_room":
+            raise RuntimeError("queue closed")
+        received.append(room_id)
+
+    backplane = BrokerBackplane(url)
+    await backplane.start(handler)
+    _, publisher = await asyncio.open_unix_connection(str(tmp_path / "backplane.sock"))
+    try:
+        await backplane.wait_connected(timeout=5)
+        await asyncio.sleep(0.01)
+        for room_id in ("closed_room", "room_1", "closed_room", "room_2"):
+            publisher.write(_encode({"k": "broadcast", "r": room_id, "f": "{}"}))
+        await publisher.drain()
+        for _ in range(200):
+            if len(received) == 2:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        publisher.close()
+        await backplane.close()
+        await broker.close()
+
+    assert received == ["room_1", "room_2"]
+    assert backplane.received == 4
+
+
+@pytest.mark.asyncio
+async def test_broker_disconnects_client_that_stops_reading(tmp_path):
+    """Scenario: 읽지 않는 연결의 송신 버퍼가 한도를 넘으면 끊고, 다른 연결에는 계속 중계"""
+    path = tmp_path / "backplane.sock"
+    broker = BackplaneBroker(f"unix://{path}", client_buffer_limit=256 * 1024)
+    await broker.start()
+    received = []
+    backplane = BrokerBackplane(broker.url)
+    await backplane.start(lambda *args: received.append(args))
+    stalled_reader, stalled = await asyncio.open_unix_connection(str(path))
+    _, publisher = await asyncio.open_unix_connection(str(path))
+    messages = 400
+    try:
+        await backplane.wait_connected(timeout=5)
+        await asyncio.sleep(0.01)
+        frame = "x" * 4 * 1024
+        for _ in range(messages):
+            publisher.write(_encode({"k": "broadcast", "r": "room_1", "f": frame}))
+            await publisher.drain()
+        for _ in range(500):
+            if len(received) == messages:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        publisher.close()
+        stalled.close()
+        await backplane.close()
+        await broker.close()
+
+    assert broker.slow_disconnects == 1
+    assert len(received) == messages
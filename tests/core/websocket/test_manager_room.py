@@ -1,3 +1,5 @@
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock
 from fastapi import WebSocket
@@ -44,11 +46,113 @@ async def test_broadcast_to_room_only():
     # Broadcast to Room 1
     message = {"type": "chat", "content": "Hello Room 1"}
     await manager.broadcast(message, "room_1")
+    await asyncio.sleep(0.01)  # 연결별 writer 태스크가 전송할 때까지 대기
 
     # Assertions
-    # Room 1 인원은 메시지를 받아야 함
-    ws_a.send_json.assert_called_with(message)
-    ws_b.send_json.assert_called_with(message)
+    # Room 1 인원은 한 번 직렬화된 같은 프레임을 받아야 함
+    frame = ws_a.send_text.call_args.args[0]
+    assert json.loads(frame) == message
+    ws_b.send_text.assert_called_with(frame)
 
     # Room 2 인원은 메시지를 받지 말아야 함
-    ws_c.send_json.assert_not_called()
\ No newline at end of file
+    ws_c.send_text.assert_not_called()
+
+def slow_socket(delay):
+    ws = AsyncMock(spec=WebSocket)
+
+    async def send_text(frame):
+        await asyncio.sleep(delay)
+
+    ws.send_text.side_effect = send_text
+    return ws
+
+
+@pytest.mark.asyncio
+async def test_slow_socket_does_not_delay_others_and_is_evicted():
+    """
+    Scenario: 느린 클라이언트가 있어도 다른 연결에는 바로 전달되고,
+    전송 제한 시간을 연속으로 넘긴 연결은 방에서 제외되는지 확인
+    """
+    manager = ConnectionManager(send_timeout=0.05, slow_consumer_strikes=2)
+    fast = AsyncMock(spec=WebSocket)
+    slow = slow_socket(10)
+    await manager.connect(fast, "room_1", "fast")
+    await manager.connect(slow, "room_1", "slow")
+
+    await manager.broadcast({"n": 1}, "room_1")
+    await manager.broadcast({"n": 2}, "room_1")
+    await asyncio.sleep(0.01)
+    assert [c.args[0] for c in fast.send_text.call_args_list] == ['{"n":1}', '{"n":2}']
+    assert "slow" in manager.active_connections["room_1"]
+
+    # 두 번 연속 시간 초과 → 제외 후 1013으로 종료
+    await asyncio.sleep(0.15)
+    assert "slow" not in manager.active_connections["room_1"]
+    assert manager.evicted == 1
+    slow.close.assert_called_with(code=1013)
+
+    await manager.broadcast({"n": 3}, "room_1")
+    await asyncio.sleep(0.01)
+    assert slow.send_text.call_count == 2
+    fast.send_text.assert_called_with('{"n":3}')
+
+
+@pytest.mark.asyncio
+async def test_backed_up_connection_keeps_latest_interim_and_all_finals():
+    """
+    Scenario: 밀린 연결에서는 interim이 최신 것으로 교체되고, final/시스템 메시지는 모두 전달됨
+    """
+    manager = ConnectionManager(send_timeout=5, queue_size=8)
+    release = asyncio.Event()
+    ws = AsyncMock(spec=WebSocket)
+
+    async def send_text(frame):
+        await release.wait()
+
+    ws.send_text.side_effect = send_text
+    await manager.connect(ws, "room_1", "user_1")
+
+    await manager.broadcast("blocked", "room_1")
+    await asyncio.sleep(0)  # writer가 첫 프레임 전송 중 (막힘)
+    for i in range(5):
+        await manager.broadcast(f"interim-{i}", "room_1", lossy=True)
+    await manager.broadcast("final-1", "room_1")
+    await manager.broadcast("interim-5", "room_1", lossy=True)
+    await manager.broadcast("system", "room_1")
+
+    stats = manager.get_connection_stats("room_1")["user_1"]
+    assert stats["depth"] == 3
+    assert stats["replaced"] == 5
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert [c.args[0] for c in ws.send_text.call_args_list] == [
+        "blocked",
+        "final-1",
+        "interim-5",
+        "system",
+    ]
+    assert manager.get_connection_stats("room_1")["user_1"]["sent"] == 4
+    manager.disconnect("room_1", "user_1")
+
+
+@pytest.mark.asyncio
+async def test_disconnect_room_closes_sockets_concurrently():
+    manager = ConnectionManager(send_timeout=0.05, close_timeout=0.05)
+    sockets = [AsyncMock(spec=WebSocket) for _ in range(3)]
+
+    async def hang(code):
+        await asyncio.sleep(10)
+
+    sockets[0].close.side_effect = hang
+    for i, ws in enumerate(sockets):
+        await manager.connect(ws, "room_1", f"user_{i}")
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await manager.disconnect_room("room_1")
+
+    assert loop.time() - started < 1
+    assert "room_1" not in manager.active_connections
+    for ws in sockets:
+        ws.close.assert_called_once_with(code=1000)
@@ -0,0 +1,27 @@
+import json
+from core.websocket.schemas import WebSocketMessage, encode_message, encode_stt_result
+
+
+def test_stt_result_envelope_matches_model_serialization():
+    """경량 stt_result envelope는 WebSocketMessage 직렬화와 같은 구조여야 함"""
+    payload = {"text": "안녕하세요 \"회의\" 시작", "is_final": False, "confidence": 0.5}
+
+    frame = encode_stt_result(payload)
+    decoded = json.loads(frame)
+    expected = json.loads(
+        WebSocketMessage(type="stt_result", payload=payload).model_dump_json()
+    )
+
+    assert list(decoded) == ["type", "payload", "timestamp"]
+    assert decoded["type"] == expected["type"]
+    assert decoded["payload"] == expected["payload"]
+    # 한글은 이스케이프 없이 UTF-8 그대로
+    assert "안녕하세요" in frame
+    WebSocketMessage.model_validate_json(frame)
+
+
+def test_encode_message_uses_model_for_other_types():
+    frame = encode_message("ai_response", {"type": "SUMMARY", "content": "요약"})
+    message = WebSocketMessage.model_validate_json(frame)
+    assert message.type == "ai_response"
+    assert message.payload == {"type": "SUMMARY", "content": "요약"}
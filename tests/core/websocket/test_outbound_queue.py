@@ -0,0 +1,51 @@
+import pytest
+from core.websocket.outbound import OutboundQueue
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_interim_first_and_refuses_finals():
+    queue = OutboundQueue(max_size=2)
+
+    assert queue.put("final-1")
+    assert queue.put("interim-1", lossy=True)
+    # 가득 참: interim을 버려 final 자리를 만듦
+    assert queue.put("final-2")
+    assert queue.stats()["dropped"] == 1
+    # 가득 찬 상태에서 버릴 interim이 없으면 final은 거절 (호출자가 연결 정리)
+    assert queue.put("final-3") is False
+    # interim은 자리가 없으면 버림
+    assert queue.put("interim-2", lossy=True)
+    assert queue.stats() == {
+        "depth": 2,
+        "high_water": 2,
+        "replaced": 0,
+        "dropped": 2,
+        "sent": 0,
+    }
+
+    queue.close()
+    assert [await queue.get(), await queue.get(), await queue.get()] == [
+        "final-1",
+        "final-2",
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replacing_interim_keeps_equal_final_and_bounds_stale_slots():
+    queue = OutboundQueue(max_size=3)
+
+    # 같은 텍스트의 final이 앞에 있어도 교체 대상은 대기 중인 interim 하나뿐
+    assert queue.put("same")
+    assert queue.put("same", lossy=True)
+    assert queue.put("final-2")
+    for i in range(20):
+        assert queue.put(f"interim-{i}", lossy=True)
+
+    assert queue.depth == 3
+    assert queue.stats()["replaced"] == 20
+    # writer가 멈춘 동안 교체된 항목은 정리되어 쌓이지 않음
+    assert len(queue._items) <= 2 * queue.max_size
+
+    queue.close()
+    assert [await queue.get() for _ in range(4)] == ["same", "final-2", "interim-19", None]
@@ -1,3 +1,5 @@
+import asyncio
+import json
 import pytest
 from core.security import create_access_token, verify_token
 from core.websocket.schemas import WebSocketMessage
@@ -27,8 +29,8 @@ async def test_connection_manager():
         async def accept(self):
             self.accepted = True
 
-        async def send_json(self, data): # send_json 메서드 추가
-            self.sent_data = data
+        async def send_text(self, data): # 브로드캐스트는 직렬화된 텍스트 프레임 전송
+            self.sent_data = json.loads(data)
 
         async def close(self, code: int = 1000):
             pass
@@ -46,6 +48,7 @@ async def test_connection_manager():
     msg = WebSocketMessage(type="chat", payload={"text": "hello"})
     # manager.broadcast는 pydantic 모델이 아닌 dict를 받으므로 model_dump 사용
     await manager.broadcast(msg.model_dump(mode="json"), room_id)
+    await asyncio.sleep(0.01)  # 연결별 writer 태스크가 전송할 때까지 대기
 
     # Check if sent (실제 환경에서는 json string 확인)
     assert ws1.sent_data == msg.model_dump(mode="json")
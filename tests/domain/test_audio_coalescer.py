@@ -0,0 +1,41 @@
+import pytest
+import asyncio
+from domain.services.audio_coalescer import ChunkCoalescer
+from domain.services.audio_queue import AudioQueue
+
+
+@pytest.mark.asyncio
+async def test_small_chunks_packed_into_target_frames():
+    """작은 청크들이 목표 크기 프레임으로 결합되고, 청크 경계를 넘어 분할됨"""
+    queue = AudioQueue(max_bytes=1024)
+    for chunk in (b"aaa", b"bbb", b"ccc", b"ddd"):
+        await queue.put(chunk)
+    await queue.close()
+
+    coalescer = ChunkCoalescer(target_bytes=5, max_wait=1.0)
+    frames = [frame async for frame in coalescer.frames(queue)]
+
+    assert frames == [b"aaabb", b"bcccd", b"dd"]
+    stats = coalescer.stats()
+    assert stats["chunks_in"] == 4
+    assert stats["frames_out"] == 3
+    assert stats["messages_saved"] == 1
+
+
+@pytest.mark.asyncio
+async def test_partial_frame_flushed_at_deadline():
+    """목표 크기에 못 미쳐도 max_wait가 지나면 전송 (지연 상한)"""
+    queue = AudioQueue(max_bytes=1024)
+    coalescer = ChunkCoalescer(target_bytes=100, max_wait=0.05)
+    frames = coalescer.frames(queue)
+
+    await queue.put(b"hello")
+    frame = await asyncio.wait_for(frames.__anext__(), timeout=1)
+
+    assert frame == b"hello"
+    stats = coalescer.stats()
+    assert 40 <= stats["max_added_latency_ms"] < 500
+
+    await queue.close()
+    with pytest.raises(StopAsyncIteration):
+        await frames.__anext__()
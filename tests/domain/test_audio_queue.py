@@ -0,0 +1,62 @@
+import pytest
+import asyncio
+from domain.services.audio_queue import AudioQueue
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_latest_chunks():
+    queue = AudioQueue(max_bytes=10, policy="drop_oldest")
+
+    for chunk in (b"aaaa", b"bbbb", b"cccc"):
+        assert await queue.put(chunk) is True
+
+    assert queue.depth_bytes == 8
+    assert queue.dropped_chunks == 1
+    assert queue.dropped_bytes == 4
+    assert await queue.get() == b"bbbb"
+    assert await queue.get() == b"cccc"
+
+
+@pytest.mark.asyncio
+async def test_drop_newest_rejects_incoming_chunk():
+    queue = AudioQueue(max_bytes=10, policy="drop_newest")
+
+    assert await queue.put(b"aaaa") is True
+    assert await queue.put(b"bbbb") is True
+    assert await queue.put(b"cccc") is False
+
+    assert queue.stats()["high_water_bytes"] == 8
+    assert queue.dropped_chunks == 1
+    assert await queue.get() == b"aaaa"
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    """block 정책: 큐가 가득 차면 소비자가 꺼낼 때까지 put()이 대기"""
+    queue = AudioQueue(max_bytes=8, policy="block")
+    await queue.put(b"aaaa")
+    await queue.put(b"bbbb")
+
+    pending = asyncio.create_task(queue.put(b"cccc"))
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+    assert queue.blocked_puts == 1
+
+    assert await queue.get() == b"aaaa"
+    assert await asyncio.wait_for(pending, timeout=1) is True
+    assert queue.dropped_chunks == 0
+    assert queue.depth_bytes == 8
+
+
+@pytest.mark.asyncio
+async def test_close_drains_then_signals_end_and_releases_blocked_put():
+    queue = AudioQueue(max_bytes=4, policy="block")
+    await queue.put(b"aaaa")
+    pending = asyncio.create_task(queue.put(b"bbbb"))
+    await asyncio.sleep(0.01)
+
+    await queue.close()
+
+    assert await asyncio.wait_for(pending, timeout=1) is False
+    assert await queue.get() == b"aaaa"
+    assert await queue.get() is None
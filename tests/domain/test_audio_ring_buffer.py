@@ -0,0 +1,32 @@
+from domain.services.audio_ring_buffer import AudioRingBuffer
+
+
+def test_read_from_offset_with_wraparound():
+    ring = AudioRingBuffer(capacity_bytes=8)
+    ring.append(b"abcde")
+    ring.append(b"fghij")
+
+    # 용량(8) 초과분은 밀려나고 오프셋은 누적 기준으로 유지됨
+    assert ring.start_offset == 2
+    assert ring.end_offset == 10
+    assert ring.read_from(4) == b"efghij"
+    assert ring.read_from(0) == b"cdefghij"
+    assert ring.read_from(10) == b""
+
+
+def test_oversized_chunk_keeps_tail_only():
+    ring = AudioRingBuffer(capacity_bytes=4)
+    ring.append(b"xy")
+    ring.append(b"0123456789")
+
+    assert ring.start_offset == 8
+    assert ring.read_from(0) == b"6789"
+
+
+def test_read_from_respects_max_bytes():
+    ring = AudioRingBuffer(capacity_bytes=8)
+    ring.append(b"abcdefgh")
+    ring.append(b"ij")
+
+    assert ring.read_from(2, max_bytes=3) == b"cde"
+    assert ring.read_from(7, max_bytes=10) == b"hij"
@@ -1,6 +1,7 @@
 import pytest
 import asyncio
 from domain.services.audio_service import AudioService
+from domain.services.vad import VadEngine
 
 
 @pytest.mark.asyncio
@@ -43,3 +44,62 @@ async def test_push_to_non_existent_stream():
 
     # 큐가 생성되지 않았으므로 아무 일도 일어나지 않아야 함 (혹은 에러 로그)
     assert "unknown_user" not in service._queues
+
+
+
+@pytest.mark.asyncio
+async def test_silence_dropped_and_preroll_forwarded_with_stats():
+    """무음은 차단되어 통계에 집계되고, 발화 시작 시 직전 무음(Pre-roll)이 함께 전달됨"""
+    service = AudioService()
+    user_id = "test_user_stats"
+    silence = bytes(640)  # 20ms
+    speech = b"\xff\x7f\x01\x80" * 160  # 20ms, 최대 진폭
+
+    await service.start_stream(user_id)
+    for _ in range(20):
+        await service.push_audio(user_id, silence)
+    # attack(2 프레임)이 확정되는 두 번째 청크부터 음성
+    await service.push_audio(user_id, speech)
+    await service.push_audio(user_id, speech)
+
+    stats = service.get_stream_stats(user_id)
+    assert stats["bytes_forwarded"] + stats["bytes_dropped"] == 20 * 640 + 2 * len(speech)
+    # Pre-roll(200ms = 6400 bytes: 무음 + 발화 첫 청크)은 발화와 함께 전달
+    assert stats["bytes_forwarded"] == 6400 + len(speech)
+
+    queue = service._queues[user_id]
+    assert queue.qsize() == 10 + 1
+
+    await service.stop_stream(user_id)
+    assert service.get_stream_stats(user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_stats_per_user_and_room():
+    """STT 소비가 멈춘 상태에서도 큐가 상한을 넘지 않고, 방 단위로 집계됨"""
+    service = AudioService(
+        vad_engine=VadEngine(attack_frames=1),
+        queue_max_bytes=1280,
+        overflow_policy="drop_oldest",
+    )
+    speech = b"\xff\x7f\x01\x80" * 160  # 20ms (640 bytes)
+
+    await service.start_stream("user_a", "room_1")
+    await service.start_stream("user_b", "room_1")
+    for _ in range(5):
+        await service.push_audio("user_a", speech)
+    await service.push_audio("user_b", speech)
+
+    queue_stats = service.get_stream_stats("user_a")["queue"]
+    assert queue_stats["depth_bytes"] == 1280
+    assert queue_stats["dropped_chunks"] == 3
+
+    room_stats = service.get_room_queue_stats("room_1")
+    assert room_stats["streams"] == 2
+    assert room_stats["depth_bytes"] == 1280 + 640
+    assert room_stats["high_water_bytes"] == 1280
+    assert room_stats["dropped_chunks"] == 3
+
+    await service.stop_stream("user_a")
+    await service.stop_stream("user_b")
+    assert service.get_room_queue_stats("room_1")["streams"] == 0
@@ -0,0 +1,122 @@
+import pytest
+import asyncio
+from domain.services.insight_aggregator import InsightAggregator
+
+
+class RecordingProcessor:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, room_id, transcript):
+        self.calls.append((room_id, transcript))
+
+
+@pytest.mark.asyncio
+async def test_finals_from_all_speakers_are_batched_per_room():
+    """
+    Scenario: 창(window) 안에 들어온 여러 화자의 final 발화가
+    화자 표시와 함께 방마다 한 번의 요청으로 묶이는지 확인
+    """
+    aggregator = InsightAggregator(window_seconds=0.05, max_chars=1000)
+    processor = RecordingProcessor()
+
+    aggregator.add("room1", "alice", "예산을 줄여야 합니다.", processor)
+    aggregator.add("room1", "bob", "동의하지 않습니다.", processor)
+    aggregator.add("room2", "carol", "다음 안건으로 넘어가죠.", processor)
+    aggregator.add("room1", "alice", "이유를 말씀해 주세요.", processor)
+    assert processor.calls == []
+
+    await asyncio.sleep(0.1)
+
+    assert sorted(processor.calls) == [
+        (
+            "room1",
+            "alice: 예산을 줄여야 합니다.\nbob: 동의하지 않습니다.\nalice: 이유를 말씀해 주세요.",
+        ),
+        ("room2", "carol: 다음 안건으로 넘어가죠."),
+    ]
+    stats = aggregator.stats()
+    assert stats["utterances"] == 4
+    assert stats["batches"] == 2
+    assert stats["calls_saved"] == 2
+    assert stats["avg_insight_latency_ms"] >= 50
+
+    await aggregator.close()
+
+
+@pytest.mark.asyncio
+async def test_window_closes_at_char_limit_and_flush_waits_for_result():
+    aggregator = InsightAggregator(window_seconds=60, max_chars=10)
+    processor = RecordingProcessor()
+
+    aggregator.add("room1", "alice", "12345", processor)
+    aggregator.add("room1", "bob", "67890", processor)  # 10자 도달 → 즉시 요청
+    await asyncio.sleep(0)  # 워커가 처리 시작 (대기 중이면 다음 batch에 대체됨)
+    aggregator.add("room1", "alice", "남은 발화", processor)
+
+    # flush: 열린 창을 닫고 이 방의 요청이 모두 끝날 때까지 대기
+    await aggregator.flush("room1", timeout=1.0)
+
+    assert processor.calls == [
+        ("room1", "alice: 12345\nbob: 67890"),
+        ("room1", "alice: 남은 발화"),
+    ]
+    await aggregator.close()
+
+
+@pytest.mark.asyncio
+async def test_newer_batch_supersedes_queued_one_and_deadlines_expire():
+    """
+    Scenario: 같은 방의 새 batch가 닫히면 대기 중인 이전 batch를 대체(발언은 합침)하고,
+    마감을 넘긴 요청은 호출 전 버리거나 처리 중 취소하는지 확인
+    """
+    release = asyncio.Event()
+    calls = []
+
+    async def slow_processor(room_id, transcript):
+        calls.append(transcript)
+        await release.wait()
+
+    aggregator = InsightAggregator(
+        window_seconds=0, max_chars=1000, workers=1, deadline_seconds=0.05
+    )
+    aggregator.add("busy", "alice", "처리 중", slow_processor)
+    await asyncio.sleep(0)
+
+    aggregator.add("room1", "alice", "첫 번째", slow_processor)
+    aggregator.add("room1", "bob", "두 번째", slow_processor)  # 대기 중인 첫 batch 대체
+
+    # 'busy' batch는 처리 중 마감 초과로 취소되고, room1 batch는 대기 중 마감 초과로 버려짐
+    await aggregator.flush("room1", timeout=1.0)
+
+    assert calls == ["alice: 처리 중"]
+    stats = aggregator.stats()
+    assert stats["superseded"] == 1
+    assert stats["expired_in_flight"] == 1
+    assert stats["expired"] == 1
+    await aggregator.close()
+
+
+@pytest.mark.asyncio
+async def test_superseding_batch_carries_previous_utterances():
+    release = asyncio.Event()
+    calls = []
+
+    async def processor(room_id, transcript):
+        calls.append(transcript)
+        await release.wait()
+
+    aggregator = InsightAggregator(
+        window_seconds=0, max_chars=1000, workers=1, deadline_seconds=5
+    )
+    aggregator.add("other", "carol", "다른 방", processor)
+    await asyncio.sleep(0)
+    aggregator.add("room1", "alice", "첫 번째", processor)
+    aggregator.add("room1", "bob", "두 번째", processor)
+
+    release.set()
+    await aggregator.flush("room1", timeout=1.0)
+
+    assert calls == ["carol: 다른 방", "alice: 첫 번째\nbob: 두 번째"]
+    assert aggregator.stats()["calls_saved"] == 1
+    await aggregator.close()
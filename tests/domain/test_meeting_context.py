@@ -0,0 +1,88 @@
+import pytest
+import asyncio
+from core.prompts import estimate_tokens
+from domain.services.meeting_context import MeetingContextManager
+
+
+class FakeSummarizer:
+    """이전 요약 뒤에 접어 넣은 발언 수를 기록하는 가짜 요약기"""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def __call__(self, previous, lines, max_words):
+        self.calls.append(list(lines))
+        if self.fail:
+            return None
+        return f"{previous}+{len(lines)}".lstrip("+")
+
+
+@pytest.mark.asyncio
+async def test_recent_window_and_incremental_summary():
+    """
+    Scenario: 최근 N개 발언은 원문으로 유지되고, 밀려난 발언만 누적 요약에 접혀 들어가는지 확인
+    """
+    context = MeetingContextManager(max_recent=3, max_tokens=1000, summary_max_tokens=100)
+    summarizer = FakeSummarizer()
+
+    assert context.build("room1") == ""
+    context.record("room1", "alice: 하나\nbob: 둘")
+    context.record("room1", "alice: 셋")
+    context.compact_soon("room1", summarizer)
+    assert summarizer.calls == []
+
+    context.record("room1", "bob: 넷\nalice: 다섯")
+    context.compact_soon("room1", summarizer)
+    await asyncio.sleep(0)
+
+    assert summarizer.calls == [["alice: 하나", "bob: 둘"]]
+    built = context.build("room1")
+    assert built == "Summary so far:\n2\n\nRecent utterances:\nalice: 셋\nbob: 넷\nalice: 다섯"
+
+    context.record("room1", "bob: 여섯")
+    context.compact_soon("room1", summarizer)
+    await asyncio.sleep(0)
+    assert "Summary so far:\n2+1" in context.build("room1")
+    assert context.stats("room1")["compactions"] == 2
+
+    await context.close()
+
+
+@pytest.mark.asyncio
+async def test_context_size_stays_flat_over_long_meeting():
+    context = MeetingContextManager(max_recent=50, max_tokens=200, summary_max_tokens=50)
+
+    async def verbose_summarizer(previous, lines, max_words):
+        # 요약기가 예산보다 긴 요약을 돌려줘도 잘려서 유지됨
+        return previous + " ".join(lines)
+
+    sizes = []
+    for i in range(500):
+        context.record("room1", f"speaker{i % 7}: 이것은 긴 회의의 {i}번째 발언입니다.")
+        context.compact_soon("room1", verbose_summarizer)
+        await asyncio.sleep(0)
+        sizes.append(estimate_tokens(context.build("room1")))
+
+    assert max(sizes) <= 200 + 20  # 머리말(Summary/Recent) 여유분
+    assert sizes[-1] <= max(sizes[:100]) + 20
+
+    await context.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_compaction_keeps_pending_bounded():
+    context = MeetingContextManager(max_recent=2, max_tokens=1000, summary_max_tokens=100)
+    summarizer = FakeSummarizer(fail=True)
+
+    for i in range(10):
+        context.record("room1", f"a: 발언 {i}")
+        context.compact_soon("room1", summarizer)
+        await asyncio.sleep(0)
+
+    stats = context.stats("room1")
+    assert stats["compaction_failures"] >= 1
+    assert stats["pending"] <= 4
+    assert stats["recent"] == 2
+
+    await context.close()
@@ -1,5 +1,9 @@
+import json
 import pytest
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
+from domain.services.insight_aggregator import InsightAggregator
+from domain.services import meeting_orchestrator
 from domain.services.meeting_orchestrator import MeetingOrchestrator
 
 @pytest.mark.asyncio
@@ -23,4 +27,214 @@ async def test_orchestrator_flow():
     
     # Assertions
     gemini_client.generate_insight.assert_called_once() # Final이라 호출되어야 함
-    assert manager.broadcast.call_count >= 1
\ No newline at end of file
+    assert manager.broadcast.call_count >= 1
+
+@pytest.mark.asyncio
+async def test_slow_insight_does_not_block_stt_broadcast():
+    """
+    Scenario: Gemini 응답이 느려도 STT 결과는 계속 소비/전송되고,
+    스트림 종료 시 대기 중인 분석 결과까지 전송되는지 확인
+    """
+    audio_service = MagicMock()
+    stt_client = MagicMock()
+    manager = AsyncMock()
+    gemini_client = MagicMock()
+    gemini_started = asyncio.Event()
+    release_gemini = asyncio.Event()
+    stt_sent_while_thinking = []
+
+    async def slow_insight(text, **kwargs):
+        gemini_started.set()
+        await release_gemini.wait()
+        return {"type": "SUMMARY", "content": text}
+
+    gemini_client.generate_insight.side_effect = slow_insight
+
+    async def stt_gen(stream):
+        yield {"text": "첫 문장", "is_final": True}
+        await gemini_started.wait()
+        # Gemini가 응답하기 전에도 interim 결과가 전송되어야 함
+        yield {"text": "다음", "is_final": False}
+        stt_sent_while_thinking.append(manager.broadcast.call_count)
+        release_gemini.set()
+
+    stt_client.transcribe.side_effect = stt_gen
+
+    # 발화를 묶지 않고 바로 분석 단계로 넘김
+    orch = MeetingOrchestrator(
+        audio_service,
+        stt_client,
+        gemini_client,
+        manager,
+        insight_aggregator=InsightAggregator(window_seconds=0),
+    )
+    await orch.start_processing("user1", "room1")
+
+    assert stt_sent_while_thinking == [2]
+    types = [json.loads(call.args[0])["type"] for call in manager.broadcast.call_args_list]
+    assert types == ["stt_result", "stt_result", "ai_response"]
+
+    stats = orch.get_pipeline_stats()
+    assert stats["stt"]["processed"] == 2
+    assert stats["insight"]["processed"] == 1
+    assert stats["insight"]["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_streaming_insight_sends_partial_then_final(monkeypatch):
+    """
+    Scenario: 스트리밍 모드에서 partial ai_response들과 최종 메시지가
+    같은 insight_id로 전송되는지 확인
+    """
+    monkeypatch.setattr(meeting_orchestrator.settings, "gemini_streaming_enabled", True)
+
+    manager = AsyncMock()
+    gemini_client = MagicMock()
+    gemini_client.summarize = AsyncMock(return_value="요약")
+
+    async def stream_insight(text, **kwargs):
+        yield {"type": "SUGGESTION", "content": "다음", "partial": True}
+        yield {"type": "SUGGESTION", "content": "다음 안건", "partial": True}
+        yield {"type": "SUGGESTION", "content": "다음 안건으로", "partial": False}
+
+    gemini_client.stream_insight = stream_insight
+
+    orch = MeetingOrchestrator(MagicMock(), MagicMock(), gemini_client, manager)
+    await orch._process_ai_insight("room1", "alice: 다음은 뭐죠?")
+
+    payloads = [json.loads(call.args[0])["payload"] for call in manager.broadcast.call_args_list]
+    assert [p["partial"] for p in payloads] == [True, True, False]
+    assert len({p["insight_id"] for p in payloads}) == 1
+    assert payloads[-1]["content"] == "다음 안건으로"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_streaming_insight_sends_final_frame(monkeypatch):
+    """Scenario: 스트리밍 도중 취소되면 같은 insight_id로 cancelled 최종 메시지를 보내고 취소를 전파"""
+    monkeypatch.setattr(meeting_orchestrator.settings, "gemini_streaming_enabled", True)
+
+    manager = AsyncMock()
+    gemini_client = MagicMock()
+    gemini_client.summarize = AsyncMock(return_value="요약")
+    partial_sent = asyncio.Event()
+
+    async def stream_insight(text, **kwargs):
+        yield {"type": "SUGGESTION", "content": "다음", "partial": True}
+        partial_sent.set()
+        await asyncio.Event().wait()
+        yield {"type": "SUGGESTION", "content": "다음 안건으로", "partial": False}
+
+    gemini_client.stream_insight = stream_insight
+
+    orch = MeetingOrchestrator(MagicMock(), MagicMock(), gemini_client, manager)
+    task = asyncio.create_task(orch._process_ai_insight("room1", "alice: 다음은 뭐죠?"))
+    await partial_sent.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    payloads = [json.loads(call.args[0])["payload"] for call in manager.broadcast.call_args_list]
+    assert [p["partial"] for p in payloads] == [True, False]
+    assert payloads[0]["insight_id"] == payloads[1]["insight_id"]
+    assert payloads[1]["status"] == "cancelled"
+    assert payloads[1]["content"] == "다음"
+
+
+@pytest.mark.asyncio
+async def test_filler_finals_do_not_reach_gemini():
+    """Scenario: 사전 필터가 skip한 final 발화는 집계/Gemini 호출 대상에서 빠짐"""
+    stt_client = MagicMock()
+    gemini_client = AsyncMock()
+    gemini_client.generate_insight.return_value = None
+    manager = AsyncMock()
+
+    async def stt_gen(stream):
+        yield {"text": "음", "is_final": True}
+        yield {"text": "네 네", "is_final": True}
+        yield {"text": "회의 일정을 다음 주로 미루죠", "is_final": True}
+
+    stt_client.transcribe.side_effect = stt_gen
+
+    orch = MeetingOrchestrator(MagicMock(), stt_client, gemini_client, manager)
+    await orch.start_processing("user1", "room1")
+
+    gemini_client.generate_insight.assert_called_once()
+    assert gemini_client.generate_insight.call_args.args[0] == (
+        "user1: 회의 일정을 다음 주로 미루죠"
+    )
+    # STT 결과 자체는 모두 전송됨
+    assert manager.broadcast.call_count == 3
+    assert orch.get_pipeline_stats()["filter"]["skip"] == 2
+
+
+@pytest.mark.asyncio
+async def test_duplicate_final_is_not_broadcast_or_analyzed():
+    """Scenario: 방 공유 중복 제거기가 버린 final은 전송/분석하지 않고, partial은 그대로 전송"""
+    from domain.services.transcript_dedup import TranscriptDeduplicator
+
+    dedup = TranscriptDeduplicator(window=3.0, hold=0)
+    assert await dedup.offer("room1", "alice", "배포 일정을 확정합시다", 1000.0)
+
+    audio_service = MagicMock()
+    audio_service.get_speech_energy.return_value = 200.0
+    stt_client = MagicMock()
+    gemini_client = AsyncMock()
+    manager = AsyncMock()
+
+    async def stt_gen(stream):
+        yield {"text": "배포 일정을", "is_final": False}
+        yield {"text": "배포 일정을 확정합시다.", "is_final": True}
+
+    stt_client.transcribe.side_effect = stt_gen
+
+    orch = MeetingOrchestrator(
+        audio_service, stt_client, gemini_client, manager, transcript_dedup=dedup
+    )
+    await orch.start_processing("bob", "room1")
+
+    assert manager.broadcast.call_count == 1
+    gemini_client.generate_insight.assert_not_called()
+    assert orch.get_pipeline_stats()["dedup"]["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_held_final_keeps_speaker_order_without_blocking_stt():
+    """
+    Scenario: 중복 판정이 보류된 final을 기다리는 동안에도 STT 결과는 계속 소비하고,
+    그 화자의 다음 결과는 final 뒤에 순서대로 전송 (보류 중 interim은 최신 것만)
+    """
+    from domain.services.transcript_dedup import TranscriptDeduplicator
+
+    dedup = TranscriptDeduplicator(window=3.0, hold=0.2)
+    assert await dedup.offer("room1", "alice", "회의를 시작하겠습니다", 1000.0)
+
+    audio_service = MagicMock()
+    audio_service.get_speech_energy.return_value = 500.0
+    stt_client = MagicMock()
+    gemini_client = AsyncMock()
+    manager = AsyncMock()
+    consumed_while_held = []
+
+    async def stt_gen(stream):
+        yield {"text": "배포 일정을 확정합시다.", "is_final": True}
+        yield {"text": "다음", "is_final": False}
+        yield {"text": "다음 안건", "is_final": False}
+        # 보류 중에도 STT 루프는 다음 결과를 바로 소비
+        consumed_while_held.append(manager.broadcast.call_count)
+        yield {"text": "다음 안건은 예산입니다.", "is_final": True}
+
+    stt_client.transcribe.side_effect = stt_gen
+
+    orch = MeetingOrchestrator(
+        audio_service, stt_client, gemini_client, manager, transcript_dedup=dedup
+    )
+    await orch.start_processing("bob", "room1")
+
+    assert consumed_while_held == [0]
+    frames = [json.loads(c.args[0]) for c in manager.broadcast.call_args_list]
+    assert [f["payload"]["text"] for f in frames if f["type"] == "stt_result"] == [
+        "배포 일정을 확정합시다.",
+        "다음 안건",
+        "다음 안건은 예산입니다.",
+    ]
+    assert orch.get_pipeline_stats()["dedup"]["held"] == 2
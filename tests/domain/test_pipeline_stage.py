@@ -0,0 +1,54 @@
+import pytest
+import asyncio
+from domain.services.pipeline_stage import PipelineStage
+
+
+@pytest.mark.asyncio
+async def test_stage_drops_oldest_when_full():
+    processed = []
+    release = asyncio.Event()
+
+    async def handler(item):
+        await release.wait()
+        processed.append(item)
+
+    stage = PipelineStage("test", handler, max_size=2, workers=1)
+    stage.start()
+    stage.submit(1)
+    await asyncio.sleep(0)  # 워커가 1을 가져가 처리 중
+
+    assert stage.submit(2) is True
+    assert stage.submit(3) is True
+    assert stage.submit(4) is False  # 2를 버림
+
+    release.set()
+    await stage.close(drain_timeout=1.0)
+
+    assert processed == [1, 3, 4]
+    stats = stage.stats()
+    assert stats["dropped"] == 1
+    assert stats["max_depth"] == 2
+    assert stats["processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stage_survives_handler_error_and_close_without_drain():
+    processed = []
+
+    async def handler(item):
+        if item == "bad":
+            raise RuntimeError("boom")
+        processed.append(item)
+
+    stage = PipelineStage("test", handler, max_size=4, workers=2)
+    stage.start()
+    stage.submit("bad")
+    stage.submit("ok")
+    await stage.close(drain_timeout=1.0)
+    assert processed == ["ok"]
+
+    # drain 없이 닫으면 남은 항목은 처리하지 않음
+    stage.start()
+    stage.submit("late")
+    await stage.close()
+    assert processed == ["ok"]
@@ -0,0 +1,45 @@
+from domain.services.significance_filter import SignificanceFilter
+
+
+def make_filter():
+    return SignificanceFilter(min_chars=3, min_novelty=0.3, send_chars=15, history=5)
+
+
+def test_fillers_and_backchannels_are_skipped():
+    """Scenario: 추임새/맞장구/짧은 발화는 Gemini로 보내지 않음"""
+    f = make_filter()
+
+    for text in ["음", "네 네", "잠깐만요", "아 그렇죠.", "ok"]:
+        assert f.evaluate("room1", "alice", text) == "skip", text
+
+    assert f.evaluate("room1", "alice", "예산안을 다시 검토해야 합니다.") == "defer"
+
+    stats = f.stats()
+    assert stats["skip"] == 5
+    assert stats["defer"] == 1
+    assert stats["calls_avoided_ratio"] == round(5 / 6, 3)
+    assert stats["avg_eval_us"] > 0
+
+
+def test_repeated_utterance_is_skipped_by_novelty():
+    f = make_filter()
+
+    assert f.evaluate("room1", "alice", "예산안을 다시 검토해야 합니다") == "defer"
+    # 조사만 다르고 같은 단어 → 새로운 내용 없음
+    assert f.evaluate("room1", "bob", "예산안은 다시 검토해야 합니다") == "skip"
+    # 다른 방의 발언과는 비교하지 않음
+    assert f.evaluate("room2", "bob", "예산안은 다시 검토해야 합니다") == "defer"
+
+
+def test_long_new_statement_after_turn_change_is_sent_now():
+    f = make_filter()
+
+    assert f.evaluate("room1", "alice", "다음 분기 마케팅 예산을 줄이자는 의견입니다") == "defer"
+    # 같은 화자가 이어서 말하면 계속 모음
+    assert f.evaluate("room1", "alice", "광고 채널별 성과 보고서를 먼저 보겠습니다") == "defer"
+    # 맞장구는 발언권 전환으로 치지 않음
+    assert f.evaluate("room1", "bob", "네") == "skip"
+    # 다른 화자가 충분히 긴 새 발언 → 창을 바로 닫고 요청
+    assert f.evaluate("room1", "bob", "저는 온라인 광고 비중을 오히려 늘려야 한다고 봅니다") == "send"
+    # 짧은 발언은 화자가 바뀌어도 모음
+    assert f.evaluate("room1", "alice", "근거가 있나요") == "defer"
@@ -0,0 +1,118 @@
+from domain.services import speaking_analytics as module
+from domain.services.speaking_analytics import SpeakingAnalytics
+
+
+def make_analytics(**kwargs):
+    options = dict(
+        overlap_window=0.3,
+        dominance_share=0.6,
+        dominance_min_talk=3.0,
+        dominance_hysteresis=0.1,
+    )
+    options.update(kwargs)
+    return SpeakingAnalytics(**options)
+
+
+def play(analytics, room, script, start, end, chunk=0.1):
+    """
+    start~end 구간을 chunk 단위로 진행하며 사용자마다 청크를 하나씩 관측
+    (script의 발화 구간 (시작, 길이)는 음성, 나머지는 무음 청크)
+    """
+    for step in range(round(start / chunk), round(end / chunk)):
+        t = (step + 1) * chunk
+        for user, spans in script.items():
+            speaking = any(s + 1e-9 < t <= s + d + 1e-9 for s, d in spans)
+            analytics.observe(room, user, speaking, chunk)
+
+
+def by_user(stats):
+    return {u["user_id"]: u for u in stats["users"]}
+
+
+def test_talk_time_turns_interruptions_and_overlap():
+    analytics = make_analytics()
+
+    script = {
+        # alice가 bob의 발화 중간에 끼어듦 (0.5초 겹침), 무음 청크는 발언 시간에 포함되지 않음
+        "alice": [(0.0, 2.0), (3.5, 1.0)],
+        "bob": [(3.0, 1.0)],
+    }
+    play(analytics, "room1", script, 0.0, 5.0)
+
+    users = by_user(analytics.stats("room1"))
+    assert users["alice"]["talk_seconds"] == 3.0
+    assert users["bob"]["talk_seconds"] == 1.0
+    assert users["alice"]["turns"] == 2
+    assert users["bob"]["turns"] == 1
+    assert users["alice"]["interruptions"] == 1
+    assert users["bob"]["interruptions"] == 0
+    assert users["alice"]["overlap_seconds"] > 0
+    assert users["alice"]["share"] == 0.75
+    assert analytics.stats("room2")["users"] == []
+
+
+def test_dominance_event_is_emitted_once_and_rearms_after_share_drops():
+    analytics = make_analytics()
+    events = []
+    analytics.subscribe(lambda room_id, event: events.append((room_id, event)))
+    script = {
+        "alice": [(1.0, 4.0), (5.0, 1.0), (16.0, 20.0)],
+        "bob": [(0.0, 0.5), (7.0, 8.0)],
+    }
+
+    play(analytics, "room1", script, 0.0, 5.0)
+    assert len(events) == 1
+    room_id, event = events[0]
+    assert room_id == "room1"
+    assert event["event"] == "speaking_dominance"
+    assert event["user_id"] == "alice"
+    assert event["share"] >= 0.6
+    assert analytics.stats("room1")["dominant"] == ["alice"]
+
+    # 계속 말해도 중복 이벤트 없음
+    play(analytics, "room1", script, 5.0, 6.5)
+    assert len(events) == 1
+
+    # bob이 오래 말해 alice 비율이 0.5 미만으로 내려가면 해제 → 다시 점유하면 재감지
+    play(analytics, "room1", script, 6.5, 15.5)
+    assert analytics.stats("room1")["dominant"] == ["bob"]
+    play(analytics, "room1", script, 15.5, 36.0)
+    assert [e["user_id"] for _, e in events] == ["alice", "bob", "alice"]
+
+    analytics.reset("room1")
+    assert analytics.stats("room1")["total_talk_seconds"] == 0.0
+
+
+def test_arrival_jitter_does_not_change_audio_timeline(monkeypatch):
+    """
+    Scenario: 청크가 몰려 도착하거나 지연되어도 시각은 받은 오디오 길이로 계산되므로
+    발언 구간/끼어들기 판정이 도착 시각에 영향을 받지 않음
+    """
+    arrivals = iter([0.0, 0.0, 0.0, 0.0, 0.45, 0.45, 0.9, 0.9, 0.9, 0.9])
+    monkeypatch.setattr(module.time, "monotonic", lambda: next(arrivals, 0.9))
+    analytics = make_analytics()
+
+    # alice가 0.1초 청크 10개를 연속으로 말함 (도착 간격은 0 ~ 0.45초로 불규칙)
+    for _ in range(10):
+        analytics.observe("room1", "alice", True, 0.1)
+
+    alice = by_user(analytics.stats("room1"))["alice"]
+    assert alice["talk_seconds"] == 1.0
+    # 도착 간격이 overlap_window(0.3초)보다 벌어져도 발화 하나로 집계
+    assert alice["turns"] == 1
+
+
+def test_idle_rooms_are_evicted(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: clock[0])
+    analytics = make_analytics(idle_ttl=100.0)
+
+    analytics.observe("room1", "alice", True, 0.1)
+    clock[0] = 50.0
+    analytics.observe("room2", "bob", True, 0.1)
+
+    # 정리 주기가 지나면 idle_ttl 동안 오디오가 없던 방만 버림
+    clock[0] = 120.0
+    analytics.observe("room2", "bob", True, 0.1)
+    assert analytics.stats("room1")["users"] == []
+    assert by_user(analytics.stats("room2"))["bob"]["talk_seconds"] == 0.2
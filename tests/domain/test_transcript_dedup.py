@@ -0,0 +1,99 @@
+import pytest
+import asyncio
+from domain.services.transcript_dedup import (
+    TranscriptDeduplicator,
+    minhash_signature,
+    similarity,
+)
+
+
+def test_minhash_similarity_tolerates_small_recognition_differences():
+    a = minhash_signature("다음 주 목요일까지 배포를 마무리하겠습니다.")
+    b = minhash_signature("다음주 목요일까지 배포를 마무리 하겠습니다")
+    c = minhash_signature("예산 문제는 다음 회의에서 다시 논의하죠.")
+
+    assert a == minhash_signature("다음 주 목요일까지 배포를 마무리하겠습니다.")
+    assert similarity(a, b) >= 0.7
+    assert similarity(a, c) < 0.3
+
+
+@pytest.mark.asyncio
+async def test_duplicate_from_quieter_microphone_is_dropped():
+    """
+    Scenario: 같은 공간의 두 마이크가 같은 발언을 인식하면
+    음성 에너지가 큰(화자에 가까운) 사용자의 결과만 유지
+    """
+    dedup = TranscriptDeduplicator(window=3.0, hold=0.1, threshold=0.7)
+
+    # 방에 다른 사용자가 없으면 보류 없이 바로 판정
+    first = dedup.offer("room1", "alice", "안녕하세요 회의 시작하겠습니다", 900.0)
+    assert first.done() and first.result() is True
+
+    text = "다음 주 목요일까지 배포를 마무리하겠습니다."
+    # 먼 마이크(bob)가 먼저 인식, 화자 본인(alice)의 마이크가 조금 늦게 인식
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    bob = dedup.offer("room1", "bob", text, 300.0)
+    assert not bob.done()
+    await asyncio.sleep(0.02)
+    alice = dedup.offer("room1", "alice", "다음주 목요일까지 배포를 마무리 하겠습니다", 2000.0)
+
+    # 더 가까운 마이크의 결과가 오면 보류 중인 결과는 바로 버림
+    assert bob.done() and bob.result() is False
+    # 남은 결과는 hold 타이머가 끝난 뒤 유지
+    assert await alice is True
+    assert loop.time() - started >= 0.1
+
+    # 유지된 결과와 중복인 늦은 final은 에너지와 무관하게 바로 버림
+    late = dedup.offer("room1", "carol", text, 5000.0)
+    assert late.done() and late.result() is False
+    # 다른 방이나 다른 내용은 영향 없음
+    assert await dedup.offer("room2", "carol", text, 100.0) is True
+    assert await dedup.offer("room1", "bob", "예산 문제는 다음 회의에서 논의하죠", 300.0) is True
+
+    stats = dedup.stats()
+    assert stats["dropped"] == 2
+    assert stats["finals"] == 6
+    assert stats["held"] == 3
+
+
+@pytest.mark.asyncio
+async def test_same_user_and_expired_finals_are_not_deduplicated():
+    dedup = TranscriptDeduplicator(window=0.05, hold=0, threshold=0.7)
+
+    assert await dedup.offer("room1", "alice", "네 알겠습니다 진행하죠", 100.0)
+    # 같은 사용자가 같은 말을 반복한 것은 중복 아님
+    assert await dedup.offer("room1", "alice", "네 알겠습니다 진행하죠", 100.0)
+    assert await dedup.offer("room1", "bob", "네 알겠습니다 진행하죠", 50.0) is False
+
+    await asyncio.sleep(0.06)
+    assert await dedup.offer("room1", "bob", "네 알겠습니다 진행하죠", 50.0) is True
+
+
+@pytest.mark.asyncio
+async def test_later_copy_is_judged_against_the_replacing_final(monkeypatch):
+    """
+    Scenario: 보류 중인 결과가 더 가까운 마이크의 결과로 대체된 뒤 들어온 중복은
+    대체한(현재 유지 중인) 사용자를 기준으로 버림
+    """
+    from domain.services import transcript_dedup as module
+
+    dropped = []
+    monkeypatch.setattr(
+        module.TranscriptDeduplicator,
+        "_drop",
+        lambda self, room_id, user_id, kept_user_id: dropped.append((user_id, kept_user_id)),
+    )
+    dedup = TranscriptDeduplicator(window=3.0, hold=0.05, threshold=0.7)
+    assert await dedup.offer("room1", "alice", "안녕하세요 회의 시작하겠습니다", 900.0)
+
+    text = "다음 주 목요일까지 배포를 마무리하겠습니다."
+    bob = dedup.offer("room1", "bob", text, 300.0)
+    alice = dedup.offer("room1", "alice", text, 2000.0)
+    # 판정 보류 중에도 offer()는 바로 반환
+    assert not alice.done()
+    assert await bob is False
+    assert await alice is True
+
+    assert await dedup.offer("room1", "carol", text, 100.0) is False
+    assert dropped == [("bob", "alice"), ("carol", "alice")]
@@ -0,0 +1,128 @@
+import math
+from array import array
+
+from domain.services.vad import NoiseFloorTracker, VadEngine
+
+SAMPLE_RATE = 16000
+
+
+def _tone(ms: int, amplitude: int) -> bytes:
+    """테스트용 PCM16 사인파를 생성합니다."""
+    count = SAMPLE_RATE * ms // 1000
+    samples = array(
+        "h",
+        (int(amplitude * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)) for i in range(count)),
+    )
+    return samples.tobytes()
+
+
+def _engine(**kwargs) -> VadEngine:
+    params = dict(
+        sample_rate=SAMPLE_RATE,
+        frame_ms=20,
+        threshold=300.0,
+        attack_frames=2,
+        hangover_frames=3,
+        sample_stride=1,
+        adaptive=False,
+    )
+    params.update(kwargs)
+    return VadEngine(**params)
+
+
+def test_frame_energies_per_frame_rms():
+    """20ms 프레임 단위로 RMS가 계산되는지 확인 (사인파 RMS = 진폭 / sqrt(2))"""
+    engine = _engine()
+    energies = engine.frame_energies(_tone(100, 1000))
+
+    assert len(energies) == 5
+    for energy in energies:
+        assert abs(energy - 1000 / math.sqrt(2)) < 10
+
+
+def test_silence_is_not_speech():
+    stream = _engine().create_stream()
+
+    result = stream.process(bytes(3200))
+
+    assert result.is_speech is False
+    assert result.frame_energies == [0.0] * 5
+
+
+def test_speech_detected_with_hangover():
+    """음성 이후 hangover 프레임 동안은 음성으로 유지되는지 확인"""
+    stream = _engine(hangover_frames=3).create_stream()
+
+    assert stream.process(_tone(100, 3000)).is_speech is True
+    # 무음 40ms (2 프레임) -> hangover 범위 내
+    assert stream.process(bytes(1280)).is_speech is True
+    # 이후 hangover 소진 -> 무음
+    assert stream.process(bytes(1280)).is_speech is True
+    assert stream.process(bytes(1280)).is_speech is False
+
+
+def test_attack_rejects_isolated_click():
+    """청크 중간의 단일 프레임 잡음은 attack 조건을 만족하지 못해 무음 처리"""
+    stream = _engine(attack_frames=2, hangover_frames=0).create_stream()
+    chunk = bytes(640) + _tone(20, 5000) + bytes(640 * 3)
+
+    assert stream.process(chunk).is_speech is False
+
+
+def test_single_frame_click_is_dropped():
+    """attack 미만의 순간 잡음(클릭)은 청크 끝에 걸려도 음성으로 보지 않음"""
+    stream = _engine(attack_frames=3).create_stream()
+    quiet = bytes(640)
+    click = _tone(20, 5000)
+
+    results = [stream.process(chunk).is_speech for chunk in (quiet, click, quiet, click, quiet)]
+
+    assert results == [False, False, False, False, False]
+
+
+def test_onset_spanning_chunks_is_detected():
+    """attack 프레임이 여러 청크에 걸쳐 이어지면 확정되는 청크부터 음성"""
+    stream = _engine(attack_frames=3).create_stream()
+    loud = _tone(20, 5000)
+
+    assert [stream.process(loud).is_speech for _ in range(3)] == [False, False, True]
+
+
+def test_odd_length_buffer_is_tolerated():
+    stream = _engine().create_stream()
+
+    result = stream.process(_tone(20, 3000) + b"\x01")
+
+    assert len(result.frame_energies) == 1
+
+
+def test_noise_floor_tracks_low_percentile():
+    tracker = NoiseFloorTracker(window_frames=100, percentile=0.2, calibration_frames=10)
+    assert tracker.floor is None
+
+    for _ in range(80):
+        tracker.add(100.0)
+    for _ in range(20):
+        tracker.add(5000.0)
+
+    # 하위 20% 는 배경 소음(100) 구간 -> 1dB 오차 이내
+    assert tracker.floor is not None
+    assert 85 < tracker.floor < 115
+
+
+def test_adaptive_threshold_gates_steady_background_noise():
+    """시끄러운 방: 고정 임계값(300)은 통과시키는 배경 소음을 보정 후 차단"""
+    stream = _engine(adaptive=True, hangover_frames=2).create_stream()
+    noise = _tone(100, 700)  # RMS ≈ 495
+
+    # 보정 전(고정 임계값)에는 소음이 음성으로 판정됨
+    assert stream.process(noise).is_speech is True
+
+    for _ in range(20):
+        stream.process(noise)
+
+    assert stream.noise_floor is not None
+    assert stream.threshold > 495
+    assert stream.process(noise).is_speech is False
+    # 실제 발화는 여전히 통과
+    assert stream.process(_tone(100, 8000)).is_speech is True
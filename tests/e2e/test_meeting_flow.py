@@ -1,15 +1,20 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock
+from fastapi import Query
 from fastapi.testclient import TestClient
 
 # 의존성 임포트 (src. 접두사 제거)
 from infrastructure.external.google_stt import GoogleSTTClient
 from infrastructure.external.gemini_client import GeminiClient
 from core.security import get_current_user_ws, TokenPayload
+import api.routes.websocket as api_websocket
 
 # MeetingOrchestrator는 DI를 통해 주입되므로 여기서 직접 import 하지 않아도 됩니다.
 # 하지만 테스트에서 인스턴스를 직접 생성하기 위해 import 해야 합니다.
 
+# 40ms 최대 진폭 PCM16 (VAD attack 구간을 넘겨 STT로 전달되는 발화)
+SPEECH_CHUNK = b"\xff\x7f\x01\x80" * 320
+
 
 @pytest.fixture
 def mock_dependencies(monkeypatch):
@@ -82,7 +87,7 @@ def test_websocket_e2e_flow(mock_dependencies, app): # app fixture 추가
         with client.websocket_connect(f"/ws/audio/{room_id}?token=dummy_token") as websocket:
             # 1. 오디오 데이터 전송 (바이너리)
             # 이 데이터는 AudioService 큐로 들어가고 -> Orchestrator가 소비 -> Mock STT로 전달됨
-            websocket.send_bytes(b"dummy_audio_data")
+            websocket.send_bytes(SPEECH_CHUNK)
             
             # 2. STT Interim 결과 수신 대기
             data_1 = websocket.receive_json()
@@ -107,4 +112,59 @@ def test_websocket_e2e_flow(mock_dependencies, app): # app fixture 추가
 
     # 검증: Mock 객체들이 실제로 호출되었는지 확인
     assert mock_gemini.generate_insight.called
-    assert mock_gemini.generate_insight.call_args[0][0] == "테스트 문장입니다."
+    # 방 단위 묶음 요청: 발언마다 화자가 표시됨
+    assert mock_gemini.generate_insight.call_args[0][0] == "test_user: 테스트 문장입니다."
+
+
+def _token_as_user(token: str = Query(...)) -> TokenPayload:
+    """토큰 값을 사용자 ID로 사용 (한 테스트에서 여러 사용자 연결)"""
+    return TokenPayload(sub=token, name=token, exp=9999999999)
+
+
+def test_listener_receives_room_broadcasts_without_audio_pipeline(mock_dependencies, app):
+    """청취 전용 연결은 STT/Gemini 자원 없이 방 브로드캐스트만 수신합니다."""
+    room_id = "test_room_listener"
+    app.dependency_overrides[get_current_user_ws] = _token_as_user
+    stt_factory = api_websocket.GoogleSTTClient
+
+    try:
+        with TestClient(app) as client:
+            with client.websocket_connect(f"/ws/room/{room_id}?token=viewer") as viewer:
+                # 청취자는 STT 클라이언트를 만들지 않음
+                assert stt_factory.call_count == 0
+
+                with client.websocket_connect(f"/ws/audio/{room_id}?token=speaker") as speaker:
+                    assert stt_factory.call_count == 1
+                    speaker.send_bytes(SPEECH_CHUNK)
+
+                    data = [viewer.receive_json() for _ in range(3)]
+                    assert [d["type"] for d in data] == ["stt_result", "stt_result", "ai_response"]
+                    assert data[1]["payload"]["text"] == "테스트 문장입니다."
+                    speaker.close()
+                viewer.close()
+    finally:
+        app.dependency_overrides.pop(get_current_user_ws, None)
+
+    assert stt_factory.call_count == 1
+
+
+def test_listener_starts_audio_pipeline_on_first_audio(mock_dependencies, app):
+    """청취자가 오디오를 보내기 시작하면 그때 STT 파이프라인을 시작합니다."""
+    room_id = "test_room_listener_speaks"
+    app.dependency_overrides[get_current_user_ws] = _token_as_user
+    stt_factory = api_websocket.GoogleSTTClient
+
+    try:
+        with TestClient(app) as client:
+            with client.websocket_connect(f"/ws/room/{room_id}?token=viewer") as viewer:
+                # 텍스트(keepalive)는 무시
+                viewer.send_text("ping")
+                viewer.send_bytes(SPEECH_CHUNK)
+
+                data = [viewer.receive_json() for _ in range(3)]
+                assert [d["type"] for d in data] == ["stt_result", "stt_result", "ai_response"]
+                assert data[0]["payload"]["text"] == "테스트"
+                assert stt_factory.call_count == 1
+                viewer.close()
+    finally:
+        app.dependency_overrides.pop(get_current_user_ws, None)
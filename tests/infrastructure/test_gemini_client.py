@@ -83,4 +83,129 @@ async def test_generate_insight_invalid_json():
 
     # Then
     assert result["type"] == "ERROR"
-    assert "JSON parsing failed" in result["content"]
\ No newline at end of file
+    assert "JSON parsing failed" in result["content"]
+
+@pytest.mark.asyncio
+async def test_generate_insight_appends_meeting_context_and_summarize():
+    """
+    Scenario: 회의 맥락이 프롬프트 뒤에 참고용으로 붙고,
+    summarize가 JSON 응답에서 요약만 꺼내는지 확인
+    """
+    mock_model = MagicMock()
+    mock_response_obj = MagicMock()
+    mock_response_obj.text = json.dumps({"type": "SUMMARY", "content": "요약"})
+    mock_model.generate_content_async = AsyncMock(return_value=mock_response_obj)
+
+    client = GeminiClient(model=mock_model)
+    client.cache = None  # 프롬프트 확인을 위해 캐시 비활성화
+    await client.generate_insight("bob: 다음 주에 배포합시다.", context="Summary so far:\n일정 논의")
+
+    prompt = mock_model.generate_content_async.call_args[0][0]
+    assert prompt.index("bob: 다음 주에 배포합시다.") < prompt.index("일정 논의")
+
+    mock_response_obj.text = json.dumps({"summary": " 배포 일정 합의 "})
+    summary = await client.summarize("일정 논의", ["bob: 다음 주에 배포합시다."], max_words=50)
+    assert summary == "배포 일정 합의"
+    assert "일정 논의" in mock_model.generate_content_async.call_args[0][0]
+
+    # 인사이트와 같은 복구 경로: 코드 펜스 + trailing comma + 뒤따르는 설명문
+    mock_response_obj.text = '요약입니다.\n```json\n{"summary": "배포는 다음 주",}\n```\n이상입니다.'
+    assert await client.summarize("일정 논의", ["a: b"], max_words=50) == "배포는 다음 주"
+
+    mock_response_obj.text = "not json"
+    assert await client.summarize("일정 논의", ["a: b"], max_words=50) is None
+    mock_response_obj.text = '{"content": "요약 필드 없음"}'
+    assert await client.summarize("일정 논의", ["a: b"], max_words=50) is None
+
+
+@pytest.mark.asyncio
+async def test_stream_insight_yields_partials_and_final():
+    """
+    Scenario: 스트리밍 응답 조각에서 partial 스냅샷을 만들고, 마지막에 완성된 인사이트를 반환하는지 확인
+    """
+    payload = json.dumps(
+        {"type": "SUMMARY", "content": "참여자들이 배포 일정을 합의했습니다."},
+        ensure_ascii=False,
+    )
+
+    async def chunk_stream():
+        for i in range(0, len(payload), 10):
+            chunk = MagicMock()
+            chunk.text = payload[i : i + 10]
+            yield chunk
+
+    mock_model = MagicMock()
+    mock_model.generate_content_async = AsyncMock(return_value=chunk_stream())
+    client = GeminiClient(model=mock_model)
+    client.cache = None
+
+    results = [r async for r in client.stream_insight("alice: 다음 주에 배포하죠.")]
+
+    assert mock_model.generate_content_async.call_args.kwargs == {"stream": True}
+    assert results[0]["partial"] is True
+    assert results[-1] == {
+        "type": "SUMMARY",
+        "content": "참여자들이 배포 일정을 합의했습니다.",
+        "partial": False,
+    }
+    assert all(r["partial"] for r in results[:-1])
+
+
+@pytest.mark.asyncio
+async def test_generate_insight_rejects_unknown_type_and_repairs_fences():
+    """
+    Scenario: 스키마에 없는 type은 바로 ERROR로 처리하고, 코드 펜스로 감싼 응답은 복구하는지 확인
+    """
+    mock_response_obj = MagicMock()
+    mock_model = MagicMock()
+    mock_model.generate_content_async = AsyncMock(return_value=mock_response_obj)
+    client = GeminiClient(model=mock_model)
+    client.cache = None
+
+    mock_response_obj.text = json.dumps({"type": "PRAISE", "content": "좋아요"})
+    result = await client.generate_insight("발언 내용")
+    assert result == {"type": "ERROR", "content": "Invalid insight format"}
+
+    mock_response_obj.text = '```json\n{"type": "summary", "content": "요약"}\n```'
+    result = await client.generate_insight("발언 내용")
+    assert result == {"type": "SUMMARY", "content": "요약"}
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_takes_its_own_scheduler_slot():
+    """Scenario: 헤지 요청도 스케줄러 슬롯을 확보하므로 동시 호출 상한을 넘지 않음"""
+    import asyncio
+    from infrastructure.external.gemini_hedging import RequestHedger
+    from infrastructure.external.gemini_scheduler import GeminiScheduler
+
+    in_flight = []
+    peak = []
+
+    async def generate(prompt):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            in_flight.pop()
+        response = MagicMock()
+        response.text = json.dumps({"type": "SUMMARY", "content": "요약"})
+        return response
+
+    model = MagicMock()
+    model.generate_content_async = generate
+    hedger = RequestHedger(percentile=0.5, budget=1.0, min_samples=1, min_delay=0.01)
+    hedger._latencies.append(0.01)
+    scheduler = GeminiScheduler(max_concurrency=1, tokens_per_minute=10**9, max_queue_wait=5)
+    client = GeminiClient(model=model, scheduler=scheduler, hedger=hedger)
+
+    result = await client.generate_insight("alice: 다음 주 배포 일정을 정리해 주세요.")
+
+    assert result["type"] == "SUMMARY"
+    # 헤지는 시도되었지만 슬롯이 비지 않아 원래 호출과 동시에 실행되지 않음
+    assert hedger.stats()["hedges"] == 1
+    assert max(peak) == 1
+    # 취소된 헤지가 대기열에서 빠지고 슬롯을 반납
+    await asyncio.sleep(0.01)
+    assert scheduler.stats()["active"] == 0
+    assert scheduler.stats()["queued"]["interactive"] == 0
@@ -0,0 +1,115 @@
+import pytest
+import asyncio
+from infrastructure.external.gemini_hedging import RequestHedger
+
+
+def make_hedger(**kwargs):
+    options = dict(percentile=0.9, budget=0.5, min_samples=5, min_delay=0.0)
+    options.update(kwargs)
+    return RequestHedger(**options)
+
+
+async def warm_up(hedger, latency=0.01, count=10):
+    async def call():
+        await asyncio.sleep(latency)
+        return "ok"
+
+    for _ in range(count):
+        await hedger.run(call)
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_loser_cancelled():
+    hedger = make_hedger()
+    await warm_up(hedger)
+    assert hedger.threshold() is not None
+
+    attempts = []
+
+    async def call():
+        attempt = len(attempts)
+        attempts.append("started")
+        try:
+            # 첫 호출만 매우 느림
+            await asyncio.sleep(1.0 if attempt == 0 else 0.01)
+            return f"attempt-{attempt}"
+        except asyncio.CancelledError:
+            attempts[attempt] = "cancelled"
+            raise
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await hedger.run(call)
+
+    assert result == "attempt-1"
+    assert loop.time() - started < 0.5
+    await asyncio.sleep(0)
+    assert attempts == ["cancelled", "started"]
+    stats = hedger.stats()
+    assert stats["hedges"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_samples_or_budget():
+    hedger = make_hedger(budget=0.0)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    # 표본 부족: 임계값 없음
+    assert await hedger.run(call) == "ok"
+    await warm_up(hedger)
+
+    # 예산 0: 느려도 헤지하지 않음
+    calls.clear()
+    assert await hedger.run(call) == "ok"
+    assert calls == [1]
+    assert hedger.stats()["hedge_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_hedge_falls_back_when_one_attempt_fails():
+    hedger = make_hedger()
+    await warm_up(hedger)
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) == 1:
+            await asyncio.sleep(0.1)
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.2)
+        return "second"
+
+    assert await hedger.run(call) == "second"
+
+
+@pytest.mark.asyncio
+async def test_threshold_does_not_drift_down_when_primaries_are_slow():
+    """
+    Scenario: 원래 호출이 항상 느리고 헤지가 빠르면, 헤지에 진 호출도
+    원래 호출 시작부터의 경과 시간으로 기록되어 임계값이 낮아지지 않음
+    """
+    hedger = make_hedger(percentile=0.5, budget=1.0)
+    await warm_up(hedger, latency=0.05, count=5)
+    initial = hedger.threshold()
+    assert initial is not None and initial >= 0.05
+
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        # 원래 호출(홀수 번째)은 느리고 헤지는 바로 끝남
+        await asyncio.sleep(0.2 if len(attempts) % 2 else 0.0)
+        return "ok"
+
+    for _ in range(10):
+        attempts.clear()
+        assert await hedger.run(call) == "ok"
+
+    assert hedger.stats()["hedges"] == 10
+    assert hedger.threshold() >= initial
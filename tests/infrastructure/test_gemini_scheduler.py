@@ -0,0 +1,100 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from infrastructure.external.gemini_client import GeminiClient
+from infrastructure.external.gemini_scheduler import GeminiRejectedError, GeminiScheduler
+
+
+async def hold_slot(scheduler, order, name, release, room_id="room", priority="interactive"):
+    async with scheduler.slot(10, room_id=room_id, priority=priority):
+        order.append(name)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_priority_and_room_fairness_order():
+    """
+    Scenario: 슬롯이 하나일 때 interactive가 background보다 먼저,
+    같은 우선순위 안에서는 방 단위 라운드 로빈으로 배정되는지 확인
+    """
+    scheduler = GeminiScheduler(max_concurrency=1, tokens_per_minute=10_000, max_queue_wait=5)
+    order = []
+    release = asyncio.Event()
+
+    tasks = [asyncio.create_task(hold_slot(scheduler, order, "first", release))]
+    await asyncio.sleep(0)
+    for name, room, priority in [
+        ("bg", "room1", "background"),
+        ("a1", "roomA", "interactive"),
+        ("a2", "roomA", "interactive"),
+        ("b1", "roomB", "interactive"),
+    ]:
+        tasks.append(
+            asyncio.create_task(
+                hold_slot(scheduler, order, name, release, room_id=room, priority=priority)
+            )
+        )
+    await asyncio.sleep(0)
+
+    assert scheduler.stats()["queued"] == {"interactive": 3, "background": 1}
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert order == ["first", "a1", "b1", "a2", "bg"]
+    stats = scheduler.stats()
+    assert stats["admitted"] == 5
+    assert stats["active"] == 0
+    assert 0 < stats["utilization"] <= 1
+
+
+@pytest.mark.asyncio
+async def test_request_waiting_too_long_is_rejected():
+    scheduler = GeminiScheduler(max_concurrency=1, tokens_per_minute=10_000, max_queue_wait=0.05)
+    release = asyncio.Event()
+    holder = asyncio.create_task(hold_slot(scheduler, [], "holder", release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(GeminiRejectedError):
+        async with scheduler.slot(10):
+            pass
+
+    release.set()
+    await holder
+    stats = scheduler.stats()
+    assert stats["rejected"] == 1
+    assert stats["queued"]["interactive"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_budget_delays_calls():
+    # 분당 600 토큰 = 초당 10 토큰
+    scheduler = GeminiScheduler(max_concurrency=4, tokens_per_minute=600, max_queue_wait=5)
+
+    async with scheduler.slot(600):
+        pass
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with scheduler.slot(1):
+        pass
+    assert loop.time() - started >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_gemini_client_returns_error_when_rejected():
+    mock_model = MagicMock()
+    mock_model.generate_content_async = AsyncMock()
+    scheduler = GeminiScheduler(max_concurrency=1, tokens_per_minute=10_000, max_queue_wait=0)
+    release = asyncio.Event()
+    holder = asyncio.create_task(hold_slot(scheduler, [], "holder", release))
+    await asyncio.sleep(0)
+
+    client = GeminiClient(model=mock_model, scheduler=scheduler)
+    result = await client.generate_insight("발언 내용", room_id="room1")
+
+    assert result["type"] == "ERROR"
+    assert "rejected" in result["content"]
+    mock_model.generate_content_async.assert_not_called()
+
+    release.set()
+    await holder
@@ -1,5 +1,8 @@
 import pytest
+import asyncio
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock
+from google.api_core import exceptions as google_exceptions
 from google.cloud import speech
 from infrastructure.external.google_stt import GoogleSTTClient
 
@@ -80,4 +83,191 @@ async def test_transcribe_stream_processing():
     # 두 번째 결과 (Final)
     assert results[1]["text"] == "안녕하세요"
     assert results[1]["is_final"] is True
-    assert results[1]["type"] == "final"
\ No newline at end of file
+    assert results[1]["type"] == "final"
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_audio_after_last_final():
+    """
+    Scenario: 스트림이 끊기면 마지막 final 이후의 오디오(링 버퍼)를 재전송한 뒤
+    실시간 오디오를 이어서 전송하는지 확인
+    """
+    chunks = [bytes([i]) * 3200 for i in range(4)]  # 각 100ms
+
+    def final_response(seconds: float):
+        result = MagicMock()
+        result.is_final = True
+        result.alternatives = [MagicMock(transcript="확정", confidence=0.9)]
+        result.result_end_time = timedelta(seconds=seconds)
+        response = MagicMock()
+        response.results = [result]
+        return response
+
+    received_per_call = []
+
+    async def fake_streaming_recognize(requests):
+        attempt = len(received_per_call)
+        received = []
+        received_per_call.append(received)
+
+        async def responses():
+            async for request in requests:
+                if request.audio_content:
+                    received.append(request.audio_content)
+                if attempt == 0 and sum(map(len, received)) >= 3 * 3200:
+                    break
+            # 첫 스트림: 첫 100ms만 final로 확정된 뒤 연결 끊김
+            yield final_response(0.1)
+            if attempt == 0:
+                raise google_exceptions.ServiceUnavailable("stream dropped")
+
+        return responses()
+
+    mock_speech_client = MagicMock()
+    mock_speech_client.streaming_recognize = fake_streaming_recognize
+
+    async def audio_stream():
+        for chunk in chunks:
+            yield chunk
+
+    stt_client = GoogleSTTClient(client=mock_speech_client)
+    stt_client._retry_backoff = 0
+    results = [result async for result in stt_client.transcribe(audio_stream())]
+
+    assert len(results) == 2
+    assert b"".join(received_per_call[0]).startswith(chunks[0])
+    # 재연결: 확정되지 않은 chunk1 이후의 오디오를 모두 재전송
+    assert b"".join(received_per_call[1]) == b"".join(chunks[1:])
+
+
+
+class LimitedFakeSpeechClient:
+    """
+    스트림 길이 제한을 강제하는 가짜 STT 클라이언트.
+    2개 청크(640 bytes)마다 하나의 발화를 final로 확정하며,
+    transcript에는 각 청크의 ID(첫 바이트)를 담습니다.
+    """
+
+    CHUNK = 320
+    UTTERANCE = 640
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.sessions = 0
+
+    def _final(self, audio: bytes, end_bytes: int):
+        ids = ",".join(str(audio[i]) for i in range(0, len(audio), self.CHUNK))
+        result = MagicMock()
+        result.is_final = True
+        result.alternatives = [MagicMock(transcript=ids, confidence=0.9)]
+        result.result_end_time = timedelta(seconds=end_bytes / 32000)
+        response = MagicMock()
+        response.results = [result]
+        return response
+
+    async def streaming_recognize(self, requests):
+        loop = asyncio.get_running_loop()
+        opened_at = loop.time()
+        self.sessions += 1
+
+        async def responses():
+            pending = b""
+            consumed = 0
+            async for request in requests:
+                if loop.time() - opened_at > self.limit:
+                    raise google_exceptions.OutOfRange(
+                        "Exceeded maximum allowed stream duration"
+                    )
+                if not request.audio_content:
+                    continue
+                pending += request.audio_content
+                while len(pending) >= self.UTTERANCE:
+                    utterance = pending[: self.UTTERANCE]
+                    pending = pending[self.UTTERANCE :]
+                    consumed += self.UTTERANCE
+                    yield self._final(utterance, consumed)
+            if pending:
+                yield self._final(pending, consumed + len(pending))
+
+        return responses()
+
+
+@pytest.mark.asyncio
+async def test_stream_rotation_before_duration_limit():
+    """
+    Scenario: 스트림 길이 제한보다 긴 오디오를 보내도, 제한 전에 다음 스트림으로 교대하여
+    에러 없이 끊김/중복 없는 final 결과가 이어지는지 확인
+    """
+    fake_client = LimitedFakeSpeechClient(limit=0.15)
+    stt_client = GoogleSTTClient(client=fake_client)
+    stt_client._rotate_after = 0.08
+    stt_client._handover_timeout = 0.03
+
+    async def audio_stream():
+        for i in range(40):  # 10ms 청크 40개 = 0.4초 (제한의 2배 이상)
+            yield bytes([i]) * LimitedFakeSpeechClient.CHUNK
+            await asyncio.sleep(0.01)
+
+    finals = [
+        result["text"]
+        async for result in stt_client.transcribe(audio_stream())
+        if result["is_final"]
+    ]
+
+    assert fake_client.sessions >= 3
+    chunk_ids = [int(i) for text in finals for i in text.split(",")]
+    assert chunk_ids == list(range(40))
+
+
+@pytest.mark.asyncio
+async def test_stalled_session_backpressures_audio_queue():
+    """
+    Scenario: STT 세션이 읽지 않으면 입력 펌프도 멈춰,
+    밀린 오디오가 링 버퍼에서 덮어써지지 않고 AudioQueue의 overflow 정책으로 처리되는지 확인
+    """
+    from domain.services.audio_service import AudioService
+    from domain.services.vad import VadEngine
+
+    stalled = asyncio.Event()
+
+    async def fake_streaming_recognize(requests):
+        async def responses():
+            async for request in requests:
+                if request.audio_content:
+                    # 첫 오디오 요청 이후 응답/읽기가 멈춘 세션
+                    stalled.set()
+                    await asyncio.Event().wait()
+            yield  # pragma: no cover
+
+        return responses()
+
+    mock_speech_client = MagicMock()
+    mock_speech_client.streaming_recognize = fake_streaming_recognize
+
+    service = AudioService(
+        vad_engine=VadEngine(attack_frames=1),
+        queue_max_bytes=6400,
+        overflow_policy="drop_oldest",
+    )
+    await service.start_stream("user_a", "room_1")
+    stt_client = GoogleSTTClient(client=mock_speech_client)
+    stt_client._max_unread = 6400
+
+    async def consume():
+        async for _ in stt_client.transcribe(service.get_audio_stream("user_a")):
+            pass
+
+    task = asyncio.create_task(consume())
+    speech_chunk = b"\xff\x7f\x01\x80" * 800  # 100ms
+    for _ in range(30):
+        await service.push_audio("user_a", speech_chunk)
+        await asyncio.sleep(0)
+    await asyncio.wait_for(stalled.wait(), 1)
+    await asyncio.sleep(0.01)
+
+    queue_stats = service.get_stream_stats("user_a")["queue"]
+    assert queue_stats["depth_bytes"] == 6400
+    assert queue_stats["dropped_chunks"] > 0
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await service.stop_stream("user_a")
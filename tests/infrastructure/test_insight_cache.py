@@ -0,0 +1,66 @@
+import pytest
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+from infrastructure.external.gemini_client import GeminiClient
+from infrastructure.external.insight_cache import MISS, InsightCache, normalize_transcript
+
+
+def test_normalize_ignores_case_punctuation_and_speaker():
+    assert normalize_transcript("alice: 좋습니다!!") == "좋습니다"
+    assert normalize_transcript("Bob:  Hello,   World.") == "hello world"
+
+
+def test_lru_eviction_and_memory_accounting():
+    cache = InsightCache(max_entries=2, ttl=60, min_chars=2)
+    cache.put("첫 번째 발언", {"type": "SUMMARY", "content": "1"})
+    cache.put("두 번째 발언", {"type": "SUMMARY", "content": "2"})
+    assert cache.get("첫 번째 발언")["content"] == "1"  # 최근 사용으로 갱신
+
+    cache.put("세 번째 발언", {"type": "SUMMARY", "content": "3"})
+
+    assert cache.get("두 번째 발언") is MISS
+    assert cache.get("첫 번째 발언")["content"] == "1"
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["memory_bytes"] > 0
+
+    cache.clear()
+    assert cache.stats()["memory_bytes"] == 0
+
+
+def test_entries_expire_after_ttl():
+    cache = InsightCache(max_entries=10, ttl=0.01, min_chars=2)
+    cache.put("안건을 읽겠습니다", {"type": "SUMMARY", "content": "안건"})
+    time.sleep(0.02)
+    assert cache.get("안건을 읽겠습니다") is MISS
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_gemini_client_uses_cache_and_negative_cache():
+    """
+    Scenario: 같은 발언(정규화 기준)은 한 번만 호출하고,
+    너무 짧은 발언은 Gemini를 호출하지 않고 None을 반환하는지 확인
+    """
+    mock_model = MagicMock()
+    mock_response = MagicMock()
+    mock_response.text = json.dumps({"type": "SUMMARY", "content": "인사를 나눴습니다."})
+    mock_model.generate_content_async = AsyncMock(return_value=mock_response)
+    cache = InsightCache(max_entries=10, ttl=60, min_chars=2)
+    client = GeminiClient(model=mock_model, cache=cache)
+
+    first = await client.generate_insight("alice: 안녕하세요!")
+    second = await client.generate_insight("bob: 안녕하세요")
+    assert first == second
+    assert mock_model.generate_content_async.call_count == 1
+
+    assert await client.generate_insight("alice: 네.") is None
+    assert await client.generate_insight("bob: 네") is None
+    assert mock_model.generate_content_async.call_count == 1
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["negative_hits"] == 2
+    assert stats["misses"] == 1
@@ -0,0 +1,44 @@
+import pytest
+from infrastructure.external.insight_parser import InsightParseError, parse_insight
+
+
+def test_valid_json_is_parsed_and_extra_fields_dropped():
+    result = parse_insight(
+        '{"type": "WARNING", "content": "발언이 한쪽에 치우쳐 있습니다.", "confidence": 0.9}'
+    )
+    assert result == {"type": "WARNING", "content": "발언이 한쪽에 치우쳐 있습니다."}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '```json\n{"type": "SUMMARY", "content": "일정 합의"}\n```',
+        'Here is the insight:\n{"type": "SUMMARY", "content": "일정 합의"}\nHope this helps!',
+        '{"type": "SUMMARY", "content": "일정 합의",}',
+        '{"type": " summary ", "content": "일정 합의"}',
+    ],
+)
+def test_common_near_json_output_is_repaired(text):
+    """Scenario: 코드 펜스/앞뒤 설명문/trailing comma/대소문자 차이는 추가 호출 없이 복구"""
+    assert parse_insight(text) == {"type": "SUMMARY", "content": "일정 합의"}
+
+
+def test_brace_inside_string_does_not_break_extraction():
+    text = 'Result: {"type": "SUGGESTION", "content": "다음 안건 {예산} 논의"} done'
+    assert parse_insight(text)["content"] == "다음 안건 {예산} 논의"
+
+
+@pytest.mark.parametrize(
+    "text, reason",
+    [
+        ("This is not JSON", "invalid_json"),
+        ('{"type": "SUMMARY", "content": ', "invalid_json"),
+        ('{"type": "PRAISE", "content": "좋아요"}', "invalid_schema"),
+        ('{"type": "SUMMARY", "content": ""}', "invalid_schema"),
+        ('{"type": "SUMMARY"}', "invalid_schema"),
+    ],
+)
+def test_unrecoverable_output_raises_with_reason(text, reason):
+    with pytest.raises(InsightParseError) as exc_info:
+        parse_insight(text)
+    assert exc_info.value.reason == reason
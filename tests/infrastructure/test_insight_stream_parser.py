@@ -0,0 +1,69 @@
+import json
+from infrastructure.external.insight_stream_parser import (
+    PartialInsightParser,
+    scan_partial_object,
+)
+
+
+def test_scan_partial_object_handles_incomplete_strings_and_escapes():
+    assert scan_partial_object('{"type": "SUGG') == {"type": ("SUGG", False)}
+    assert scan_partial_object('{"type": "SUMMARY", "content": "줄\\n바꿈 \\"인용') == {
+        "type": ("SUMMARY", True),
+        "content": ('줄\n바꿈 "인용', False),
+    }
+    # 이스케이프가 잘린 경우 그 앞까지만 해석
+    assert scan_partial_object('{"content": "a\\u00') == {"content": ("a", False)}
+    # 문자열이 아닌 값은 건너뜀
+    assert scan_partial_object('{"score": [1, {"x": "y"}], "type": "WARNING"}') == {
+        "type": ("WARNING", True)
+    }
+
+
+def test_parser_emits_growing_snapshots_once_type_is_known():
+    payload = json.dumps(
+        {"type": "SUGGESTION", "content": "다음 안건으로 일정 검토를 제안합니다."},
+        ensure_ascii=False,
+    )
+    parser = PartialInsightParser()
+    snapshots = []
+    for i in range(0, len(payload), 7):
+        snapshot = parser.feed(payload[i : i + 7])
+        if snapshot is not None:
+            snapshots.append(snapshot)
+
+    assert snapshots
+    assert all(s["type"] == "SUGGESTION" for s in snapshots)
+    contents = [s["content"] for s in snapshots]
+    assert contents == sorted(set(contents), key=len)
+    assert contents[-1] == "다음 안건으로 일정 검토를 제안합니다."
+    assert json.loads(parser.text)["type"] == "SUGGESTION"
+
+
+def test_escaped_surrogate_pair_is_combined_and_held_until_complete():
+    """이스케이프된 이모지(surrogate pair)는 한 글자로 합치고, 짝이 오기 전에는 내보내지 않음"""
+    text = '{"type": "SUMMARY", "content": "good \\ud83d\\ude00 job"}'
+    assert scan_partial_object(text)["content"] == ("good 😀 job", True)
+
+    # high surrogate까지만 도착: 짝이 올 때까지 그 앞까지만 해석
+    assert scan_partial_object(text[: text.index("\\ude00")])["content"] == ("good ", False)
+    assert scan_partial_object(text[: text.index("\\ude00") + 3])["content"] == ("good ", False)
+    # 짝이 없는 surrogate는 대체 문자로 (UTF-8 직렬화 가능)
+    assert scan_partial_object('{"content": "a\\ud83d b"}')["content"] == ("a� b", True)
+
+    parser = PartialInsightParser()
+    snapshots = [parser.feed(text[i : i + 3]) for i in range(0, len(text), 3)]
+    contents = [s["content"] for s in snapshots if s is not None]
+    assert contents[-1] == "good 😀 job"
+    for content in contents:
+        content.encode("utf-8")
+
+
+def test_partial_type_is_normalized_or_withheld():
+    parser = PartialInsightParser()
+    assert parser.feed('{"type": " warning ", "content": "주의"') == {
+        "type": "WARNING",
+        "content": "주의",
+    }
+
+    parser = PartialInsightParser()
+    assert parser.feed('{"type": "CHITCHAT", "content": "잡담"') is None
@@ -0,0 +1,148 @@
+import pytest
+import grpc
+from unittest.mock import AsyncMock, MagicMock
+from infrastructure.external.google_stt import GoogleSTTClient
+from infrastructure.external.stt_channel_pool import SttChannelPool
+
+
+def make_fake_client(state=grpc.ChannelConnectivity.READY):
+    client = MagicMock()
+    client.transport.grpc_channel.get_state.return_value = state
+    client.transport.close = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_channels_created_at_start_and_closed_at_shutdown():
+    clients = []
+
+    def factory():
+        clients.append(make_fake_client())
+        return clients[-1]
+
+    pool = SttChannelPool(size=3, client_factory=factory, health_interval=60)
+    await pool.start()
+    await pool._warmup_task
+    assert len(clients) == 3
+
+    # 스트림을 여러 번 배정해도 채널은 추가로 만들지 않음
+    for _ in range(10):
+        pool.release(await pool.acquire())
+    assert len(clients) == 3
+
+    await pool.close()
+    for client in clients:
+        client.transport.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_acquire_selects_least_loaded_healthy_channel():
+    pool = SttChannelPool(size=3, client_factory=make_fake_client, health_interval=60)
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+    third = await pool.acquire()
+    assert {first.index, second.index, third.index} == {0, 1, 2}
+
+    pool.release(second)
+    assert await pool.acquire() is second
+
+    # 연속 실패한 채널은 선택 대상에서 제외
+    for _ in range(3):
+        pool.release(first, failed=True)
+        first.active_streams += 1
+    first.active_streams = 0
+    assert first.healthy is False
+    assert await pool.acquire() is not first
+
+
+@pytest.mark.asyncio
+async def test_health_check_replaces_shutdown_channel():
+    pool = SttChannelPool(size=2, client_factory=make_fake_client, health_interval=60)
+    await pool.acquire()
+    broken = pool._channels[1]
+    old_client = broken.client
+    old_client.transport.grpc_channel.get_state.return_value = (
+        grpc.ChannelConnectivity.SHUTDOWN
+    )
+
+    await pool.check_health()
+
+    assert broken.client is not old_client
+    assert broken.healthy is True
+    old_client.transport.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stt_client_streams_on_pooled_channel():
+    """GoogleSTTClient가 풀에서 채널을 배정받고 스트림 종료 시 반환하는지 확인"""
+    fake_client = make_fake_client()
+
+    async def empty_responses():
+        return
+        yield
+
+    fake_client.streaming_recognize = AsyncMock(return_value=empty_responses())
+    pool = SttChannelPool(size=1, client_factory=lambda: fake_client, health_interval=60)
+
+    async def audio_stream():
+        yield b"\x00\x00"
+
+    stt_client = GoogleSTTClient(pool=pool)
+    results = [r async for r in stt_client.transcribe(audio_stream())]
+
+    assert results == []
+    fake_client.streaming_recognize.assert_awaited_once()
+    assert pool.stats()[0]["active_streams"] == 0
+    assert pool.stats()[0]["total_streams"] == 1
+
+
+@pytest.mark.asyncio
+async def test_acquire_after_failed_warm_up_loads_credentials_off_the_loop(monkeypatch):
+    """Scenario: warm-up 실패 후 첫 배정에서 인증을 다시 로드할 때도 이벤트 루프 스레드를 막지 않음"""
+    import threading
+    from infrastructure.external import stt_channel_pool as module
+
+    loaded_on = []
+
+    def default():
+        loaded_on.append(threading.current_thread())
+        if len(loaded_on) == 1:
+            raise RuntimeError("no credentials yet")
+        return object(), "project"
+
+    monkeypatch.setattr(module.google.auth, "default", default)
+    pool = SttChannelPool(size=2, health_interval=60)
+    pool._client_factory = make_fake_client
+    await pool.start()
+    await pool._warmup_task
+    assert pool.stats() == []
+
+    channel = await pool.acquire()
+
+    assert len(pool.stats()) == 2
+    assert channel.active_streams == 1
+    assert threading.current_thread() not in loaded_on
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_acquire_hands_out_built_channel_and_refills_in_background():
+    created = []
+
+    def factory():
+        created.append(make_fake_client())
+        return created[-1]
+
+    pool = SttChannelPool(size=2, client_factory=factory, health_interval=60)
+    await pool.acquire()
+    # 채널 하나가 사라진 상태: 남은 채널을 바로 배정하고 부족한 채널은 나중에 채움
+    pool._channels.pop()
+    channel = await pool.acquire()
+    assert channel is pool._channels[0]
+    assert len(pool._channels) == 1
+
+    await pool._refill_task
+    assert len(pool._channels) == 2
+    assert len(created) == 3
+    await pool.close()
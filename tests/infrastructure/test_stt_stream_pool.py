@@ -0,0 +1,130 @@
+import pytest
+import asyncio
+from unittest.mock import MagicMock
+from infrastructure.external.google_stt import GoogleSTTClient
+from infrastructure.external.stt_stream_pool import SttStreamPool
+
+
+class SetupDelayFakeSpeechClient:
+    """
+    스트림을 열 때 설정(config) 왕복 지연을 흉내 내는 가짜 STT 클라이언트.
+    오디오 요청마다 interim 결과 하나를 반환합니다.
+    """
+
+    def __init__(self, setup_delay: float):
+        self.setup_delay = setup_delay
+        self.opened = 0
+        self.configs = 0
+
+    async def streaming_recognize(self, requests):
+        self.opened += 1
+        setup_delay = self.setup_delay
+
+        async def responses():
+            async for request in requests:
+                if request.audio_content:
+                    result = MagicMock()
+                    result.is_final = False
+                    result.alternatives = [MagicMock(transcript="안녕")]
+                    response = MagicMock()
+                    response.results = [result]
+                    yield response
+                else:
+                    self.configs += 1
+                    await asyncio.sleep(setup_delay)
+
+        return responses()
+
+
+async def audio_stream():
+    yield b"\x00" * 320
+
+
+def make_pool(fake_client, **kwargs):
+    stt_client = GoogleSTTClient(client=fake_client)
+    options = dict(min_size=1, max_size=4, idle_ttl=5.0, rate_window=60.0, horizon=10.0)
+    options.update(kwargs)
+    return stt_client, SttStreamPool(lambda: stt_client, **options)
+
+
+async def first_result(stt_client):
+    async for result in stt_client.transcribe(audio_stream()):
+        return result
+
+
+@pytest.mark.asyncio
+async def test_warm_stream_claim_skips_setup_round_trip():
+    """
+    Scenario: 미리 열어 둔 스트림을 인계받으면 설정 왕복 없이 첫 결과를 받고,
+    hit/miss와 입장~첫 interim 지연이 각각 기록되는지 확인
+    """
+    fake_client = SetupDelayFakeSpeechClient(setup_delay=0.1)
+    stt_client, pool = make_pool(fake_client)
+
+    # Cold: 풀이 비어 있으면 새 스트림을 열고 설정 왕복을 기다림
+    stt_client._warm_pool = pool
+    assert (await first_result(stt_client))["text"] == "안녕"
+
+    # Warm: maintain이 연 스트림이 설정을 마칠 때까지 대기 후 입장
+    pool.maintain()
+    assert len(pool._idle) >= 1
+    await asyncio.sleep(0.15)
+    assert (await first_result(stt_client))["text"] == "안녕"
+
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    latency = stats["first_result_latency"]
+    assert latency["warm"]["count"] == 1
+    assert latency["cold"]["count"] == 1
+    assert latency["warm"]["avg_ms"] < latency["cold"]["avg_ms"]
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_streams_are_recycled_before_expiry():
+    """
+    Scenario: idle_ttl이 지난 스트림은 claim되지 않고, maintain 시 닫힌 뒤 새 스트림으로 교체되는지 확인
+    """
+    fake_client = SetupDelayFakeSpeechClient(setup_delay=0)
+    _, pool = make_pool(fake_client, idle_ttl=0.05)
+
+    pool.maintain()
+    old = pool._idle[0]
+    await asyncio.sleep(0.08)
+
+    pool.maintain()
+    assert pool.recycled == 1
+    assert pool._idle[0] is not old
+    await asyncio.sleep(0)
+    assert not old.alive
+
+    await asyncio.sleep(0.08)
+    assert pool.claim() is None
+    assert pool.misses == 1
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_target_size_follows_join_rate():
+    """
+    Scenario: 최근 입장률이 높을수록 풀의 목표 크기가 커지고, max_size를 넘지 않는지 확인
+    """
+    fake_client = SetupDelayFakeSpeechClient(setup_delay=0)
+    _, pool = make_pool(fake_client, min_size=0, max_size=3, horizon=10.0, rate_window=60.0)
+
+    assert pool.target_size() == 0
+
+    for _ in range(6):
+        pool.claim()
+    # 60초 동안 6명 입장 → 다음 10초 동안 1명 예상
+    assert pool.target_size() == 1
+
+    for _ in range(30):
+        pool.claim()
+    assert pool.target_size() == 3
+
+    await pool.close()